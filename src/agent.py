@@ -1,13 +1,46 @@
 import pygame
 import math
-import random
-import heapq
+from collections import deque
 from config import *
-from projectile import Projectile
+from sim_clock import resolve_clock
+from match_rng import resolve_rng
+from agent_store import AgentStore, store_field
+from nav_grid import NavGrid
+from flow_field import FlowField
+from game_map import occupancy_from_obstacles, clearance_gradient, resolve_circle, escape_direction
+from pathfinding import astar, cooperative_astar, octile_distance, smooth_path
+from path_scheduler import PRIORITY_CARRIER, PRIORITY_CHASER, PRIORITY_ATTACKER, PRIORITY_EXPLORER
+from los_overlay import LOS_ALPHA, los_cone
 
 
 class Agent:
-    def __init__(self, x, y, team_id, role=None):
+    # Starea folosită de trecerile globale stă în AgentStore (array-uri NumPy);
+    # Agent este o vedere peste slot-ul său
+    x = store_field("x")
+    y = store_field("y")
+    velocity_x = store_field("velocity_x")
+    velocity_y = store_field("velocity_y")
+    health = store_field("health")
+    facing_angle = store_field("facing_angle")
+    team_id = store_field("team_id")
+    alive = store_field("alive")
+    
+    def __init__(self, x, y, team_id, role=None, clock=None, rng=None, store=None, grid=None, game_map=None,
+                 visibility=None, path_scheduler=None, reservations=None):
+        # Slot în store-ul meciului (sau într-un store propriu pentru agenți independenți)
+        self.store = store if store is not None else AgentStore(capacity=1)
+        self.slot = self.store.allocate(self)
+        # SpatialGrid-ul meciului pentru vecini (None = parcurgere liniară a listei de agenți)
+        self.grid = grid
+        # Harta meciului pentru coliziuni pe tile-uri (None = parcurgere liniară a obstacolelor)
+        self.game_map = game_map
+        # VisibilitySystem-ul meciului (None = LoS calculat la cerere pentru fiecare inamic)
+        self.visibility = visibility
+        # PathScheduler-ul meciului (None = calea este recalculată imediat)
+        self.path_scheduler = path_scheduler
+        # ReservationTable-ul echipei (None = drumuri planificate independent de coechipieri)
+        self.reservations = reservations
+        
         self.x = x
         self.y = y
         self.team_id = team_id
@@ -17,6 +50,8 @@ class Agent:
         self.color = TEAM_COLORS[team_id]
         self.last_attack_time = 0
         self.role = role  # ROLE_ATTACKER sau ROLE_DEFENDER
+        self.clock = resolve_clock(clock)  # Sursa de timp (SimClock sau timp real)
+        self.rng = resolve_rng(rng)  # Generatorul meciului (implicit modulul random)
         
         # Pentru AI
         self.target = None
@@ -27,7 +62,11 @@ class Agent:
         self.last_y = y
         
         # Path finding
-        self.path = []
+        self.path = deque()  # Punctele căii (netezite), consumate de la început
+        self.route = deque()  # Traseul HPA* rămas (tile-uri intermediare)
+        self.path_schedule = deque()  # (punct, pas de sosire) pentru începutul rezervat al căii (WHCA*)
+        self.path_field = None  # Câmpul de flux al ultimei căi cooperative
+        self.waiting_for_slot = False  # Așteaptă eliberarea unui tile rezervat de un coechipier
         self.path_update_time = 0
         self.path_update_delay = 1000  # Recalculează calea la fiecare 1000ms
         
@@ -47,7 +86,7 @@ class Agent:
 
 
         # Inițializează cu o direcție random
-        angle = random.uniform(0, 2 * math.pi)
+        angle = self.rng.uniform(0, 2 * math.pi)
         self.velocity_x = math.cos(angle) * self.speed
         self.velocity_y = math.sin(angle) * self.speed
         self.facing_angle = angle
@@ -94,18 +133,22 @@ class Agent:
         
         # Detectează dacă agentul e blocat
         distance_moved = math.sqrt((self.x - self.last_x)**2 + (self.y - self.last_y)**2)
-        if distance_moved < 0.5:
+        # Așteptarea unui tile rezervat nu înseamnă blocare
+        waiting, self.waiting_for_slot = self.waiting_for_slot, False
+        if distance_moved < 0.5 and not waiting:
             self.stuck_counter += 1
             if self.stuck_counter > 10:  # Blocat pentru 10 frame-uri - forțează scăpare
                 self.escape_obstacle()
                 self.stuck_counter = 0
                 # Forțează recalcularea pathfinding-ului
-                self.path = []
+                self.path.clear()
+                self.route.clear()
                 self.path_update_time = 0
             elif self.stuck_counter > 5:
                 # Dacă e blocat deja 5 frame-uri, forțează recalcularea pathfinding-ului
                 # și încearcă o direcție nouă
-                self.path = []
+                self.path.clear()
+                self.route.clear()
                 self.path_update_time = 0
                 
                 # Verifică dacă e în centru sau aproape
@@ -121,8 +164,8 @@ class Agent:
                     if dist_to_center < 80:
                         # E în centru, explorează perpendicular pe centru
                         center_angle = math.atan2(dy_center, dx_center) if dist_to_center > 0 else 0
-                        perpendicular = random.choice([-1, 1])
-                        angle = center_angle + (perpendicular * math.pi / 2) + random.uniform(-math.pi/3, math.pi/3)
+                        perpendicular = self.rng.choice([-1, 1])
+                        angle = center_angle + (perpendicular * math.pi / 2) + self.rng.uniform(-math.pi/3, math.pi/3)
                         self.velocity_x = math.cos(angle) * self.speed * 2
                         self.velocity_y = math.sin(angle) * self.speed * 2
                     else:
@@ -132,14 +175,14 @@ class Agent:
                             self.velocity_y = (dy_center / dist_to_center) * self.speed * 2
                         else:
                             # Fallback: direcție random
-                            angle = random.uniform(0, 2 * math.pi)
+                            angle = self.rng.uniform(0, 2 * math.pi)
                             self.velocity_x = math.cos(angle) * self.speed * 2
                             self.velocity_y = math.sin(angle) * self.speed * 2
                 else:
                     # Dacă se mișcă dar e blocat, schimbă direcția perpendicular
                     current_angle = math.atan2(self.velocity_y, self.velocity_x)
-                    perpendicular = random.choice([-1, 1])
-                    angle = current_angle + (perpendicular * math.pi / 2) + random.uniform(-math.pi/4, math.pi/4)
+                    perpendicular = self.rng.choice([-1, 1])
+                    angle = current_angle + (perpendicular * math.pi / 2) + self.rng.uniform(-math.pi/4, math.pi/4)
                     self.velocity_x = math.cos(angle) * self.speed * 2
                     self.velocity_y = math.sin(angle) * self.speed * 2
         else:
@@ -200,23 +243,11 @@ class Agent:
                     if distance_to_enemy < AGENT_ATTACK_RANGE * 1.2 and distance > 40:
                         # Inamic aproape și steagul nu e foarte aproape, atacă-l
                         if current_time - self.path_update_time > self.path_update_delay:
-                            self.find_path_to_target(obstacles)
-                            self.path_update_time = current_time
+                            self.request_path(obstacles, current_time)
                         self.follow_path()
                     elif distance > 50:  # Steagul e departe, mergi către el
                         # Mergi către steagul inamic
-                        if current_time - self.path_update_time > self.path_update_delay:
-                            class TempTarget:
-                                def __init__(self, x, y):
-                                    self.x = x
-                                    self.y = y
-                            
-                            old_target = self.target
-                            self.target = TempTarget(flag_x, flag_y)
-                            self.find_path_to_target(obstacles)
-                            self.target = old_target
-                            self.path_update_time = current_time
-                        self.follow_path()
+                        self.navigate_to(flag_x, flag_y, current_time, obstacles)
                     else:
                         # Aproape de steag, continuă să mergi direct
                         if distance > 0:
@@ -224,18 +255,7 @@ class Agent:
                             self.velocity_y = (dy / distance) * self.speed
                 elif distance > 30:  # Nu există inamic, mergi direct la steag
                     # Mergi către steagul inamic
-                    if current_time - self.path_update_time > self.path_update_delay:
-                        class TempTarget:
-                            def __init__(self, x, y):
-                                self.x = x
-                                self.y = y
-                        
-                        old_target = self.target
-                        self.target = TempTarget(flag_x, flag_y)
-                        self.find_path_to_target(obstacles)
-                        self.target = old_target
-                        self.path_update_time = current_time
-                    self.follow_path()
+                    self.navigate_to(flag_x, flag_y, current_time, obstacles)
                 else:
                     # Foarte aproape de steag, mergi direct
                     if distance > 0:
@@ -244,8 +264,7 @@ class Agent:
             elif self.target and getattr(self.target, "alive", False):
                 # Actualizează calea doar periodic pentru performanță
                 if current_time - self.path_update_time > self.path_update_delay:
-                    self.find_path_to_target(obstacles)
-                    self.path_update_time = current_time
+                    self.request_path(obstacles, current_time)
                 
                 # Urmează calea sau atacă
                 self.follow_path()
@@ -265,15 +284,12 @@ class Agent:
                                 def __init__(self, x, y):
                                     self.x = x
                                     self.y = y
-                            old_target = self.target
-                            self.target = TempTarget(wx, wy)
-                            self.find_path_to_target(obstacles)
-                            self.target = old_target
-                            self.path_update_time = current_time
+                            self.request_path(obstacles, current_time, TempTarget(wx, wy), PRIORITY_EXPLORER)
                         self.follow_path()
                 else:
                     self.explore()
-                    self.path = []  # Șterge calea când nu există țintă
+                    self.path.clear()  # Șterge calea când nu există țintă
+                    self.route.clear()
         
         # Actualizează unghiul facing bazat pe velocity
         if abs(self.velocity_x) > 0.1 or abs(self.velocity_y) > 0.1:
@@ -291,10 +307,9 @@ class Agent:
         # Aplică mișcarea
         self.apply_movement(obstacles)
     
-    def shoot(self, projectiles_list):
+    def shoot(self, projectiles):
         """Creează un proiectil în direcția în care se uită agentul"""
-        projectile = Projectile(self.x, self.y, self.facing_angle, self.team_id)
-        projectiles_list.append(projectile)
+        projectiles.spawn(self.x, self.y, self.facing_angle, self.team_id, owner=self)
     
     def update_attacker_behavior(self, current_time, obstacles, agents=None, message_bus=None):
         """Comportament pentru atacatori - merg către zona centrală"""
@@ -312,8 +327,7 @@ class Agent:
             # Atacă dacă inamicul e în raza de atac
             if distance_to_enemy < AGENT_ATTACK_RANGE * 1.2:
                 if current_time - self.path_update_time > self.path_update_delay:
-                    self.find_path_to_target(obstacles)
-                    self.path_update_time = current_time
+                    self.request_path(obstacles, current_time)
                 self.follow_path()
             elif not in_zone:
                 # Inamicul nu e aproape, continuă către zona centrală
@@ -325,19 +339,7 @@ class Agent:
                 distance = math.sqrt(dx*dx + dy*dy)
                 
                 if distance > 50:  # Dacă e departe, folosește pathfinding
-                    if current_time - self.path_update_time > self.path_update_delay:
-                        class TempTarget:
-                            def __init__(self, x, y):
-                                self.x = x
-                                self.y = y
-                        
-                        old_target = self.target
-                        self.target = TempTarget(zone_center_x, zone_center_y)
-                        self.find_path_to_target(obstacles)
-                        self.target = old_target
-                        self.path_update_time = current_time
-                    
-                    self.follow_path()
+                    self.navigate_to(zone_center_x, zone_center_y, current_time, obstacles, goal_rect=self.target_zone)
                 else:
                     # Aproape de zonă, mergi direct către centru
                     if distance > 0:
@@ -360,19 +362,7 @@ class Agent:
             distance = math.sqrt(dx*dx + dy*dy)
             
             if distance > 50:  # Dacă e departe, folosește pathfinding
-                if current_time - self.path_update_time > self.path_update_delay:
-                    class TempTarget:
-                        def __init__(self, x, y):
-                            self.x = x
-                            self.y = y
-                    
-                    old_target = self.target
-                    self.target = TempTarget(zone_center_x, zone_center_y)
-                    self.find_path_to_target(obstacles)
-                    self.target = old_target
-                    self.path_update_time = current_time
-                
-                self.follow_path()
+                self.navigate_to(zone_center_x, zone_center_y, current_time, obstacles, goal_rect=self.target_zone)
             else:
                 # Aproape de zonă, mergi direct către centru
                 if distance > 0:
@@ -392,10 +382,10 @@ class Agent:
         # Verifică dacă e în zonă
         if self.target_zone.collidepoint(self.x, self.y):
             # E în zonă, mișcă-te lent în jurul zonei (patrulare)
-            if random.random() < 0.03:  # 3% șansă să schimbe direcția
+            if self.rng.random() < 0.03:  # 3% șansă să schimbe direcția
                 # Alege o direcție către un punct random în zonă
-                target_x = self.target_zone.x + random.randint(0, self.target_zone.width)
-                target_y = self.target_zone.y + random.randint(0, self.target_zone.height)
+                target_x = self.target_zone.x + self.rng.randint(0, self.target_zone.width)
+                target_y = self.target_zone.y + self.rng.randint(0, self.target_zone.height)
                 
                 dx = target_x - self.x
                 dy = target_y - self.y
@@ -408,8 +398,8 @@ class Agent:
             # Altfel, continuă în direcția curentă (dacă există) sau oprește-te
             elif abs(self.velocity_x) < 0.1 and abs(self.velocity_y) < 0.1:
                 # Dacă nu se mișcă, alege o direcție lentă în zonă
-                target_x = self.target_zone.x + random.randint(0, self.target_zone.width)
-                target_y = self.target_zone.y + random.randint(0, self.target_zone.height)
+                target_x = self.target_zone.x + self.rng.randint(0, self.target_zone.width)
+                target_y = self.target_zone.y + self.rng.randint(0, self.target_zone.height)
                 
                 dx = target_x - self.x
                 dy = target_y - self.y
@@ -447,10 +437,10 @@ class Agent:
                 if self._can_broadcast(msg_type, current_time, 1200):
                     self.send_team_broadcast(message_bus, msg_type, {"x": self.target_zone.centerx, "y": self.target_zone.centery})
             # E în zonă, mișcă-te lent în jurul zonei pentru a rămâne acolo
-            if random.random() < 0.04:  # 4% șansă să schimbe direcția
+            if self.rng.random() < 0.04:  # 4% șansă să schimbe direcția
                 # Alege o direcție către un punct random în zonă
-                target_x = self.target_zone.x + random.randint(0, self.target_zone.width)
-                target_y = self.target_zone.y + random.randint(0, self.target_zone.height)
+                target_x = self.target_zone.x + self.rng.randint(0, self.target_zone.width)
+                target_y = self.target_zone.y + self.rng.randint(0, self.target_zone.height)
                 
                 dx = target_x - self.x
                 dy = target_y - self.y
@@ -463,8 +453,8 @@ class Agent:
             # Altfel, continuă în direcția curentă (dacă există) sau oprește-te
             elif abs(self.velocity_x) < 0.1 and abs(self.velocity_y) < 0.1:
                 # Dacă nu se mișcă, alege o direcție lentă în zonă
-                target_x = self.target_zone.x + random.randint(0, self.target_zone.width)
-                target_y = self.target_zone.y + random.randint(0, self.target_zone.height)
+                target_x = self.target_zone.x + self.rng.randint(0, self.target_zone.width)
+                target_y = self.target_zone.y + self.rng.randint(0, self.target_zone.height)
                 
                 dx = target_x - self.x
                 dy = target_y - self.y
@@ -528,20 +518,7 @@ class Agent:
             distance = (dx*dx + dy*dy) ** 0.5
             
             if distance > 30:  # Nu e încă în bază
-                if current_time - self.path_update_time > self.path_update_delay:
-                    # Creează o țintă temporară pentru pathfinding
-                    class TempTarget:
-                        def __init__(self, x, y):
-                            self.x = x
-                            self.y = y
-                    
-                    old_target = self.target
-                    self.target = TempTarget(base_x, base_y)
-                    self.find_path_to_target(obstacles)
-                    self.target = old_target
-                    self.path_update_time = current_time
-                
-                self.follow_path()
+                self.navigate_to(base_x, base_y, current_time, obstacles, goal_rect=self.enemy_base)
             else:
                 # E în bază, mergi către centru
                 if distance > 0:
@@ -562,19 +539,14 @@ class Agent:
         if enemy_carrier:
             # Urmărește carrier-ul
             if current_time - self.path_update_time > self.path_update_delay:
-                old_target = self.target
-                self.target = enemy_carrier
-                self.find_path_to_target(obstacles)
-                self.path_update_time = current_time
-                self.target = old_target
+                self.request_path(obstacles, current_time, enemy_carrier)
             
             self.follow_path()
         else:
             # Nu există carrier, comportament standard
             if self.target and self.target.alive:
                 if current_time - self.path_update_time > self.path_update_delay:
-                    self.find_path_to_target(obstacles)
-                    self.path_update_time = current_time
+                    self.request_path(obstacles, current_time)
                 self.follow_path()
             elif self.target_flag:
                 # Mergi către steagul propriu (pentru a-l apăra sau recupera)
@@ -586,19 +558,7 @@ class Agent:
                 distance = (dx*dx + dy*dy) ** 0.5
                 
                 if distance > 30:
-                    if current_time - self.path_update_time > self.path_update_delay:
-                        class TempTarget:
-                            def __init__(self, x, y):
-                                self.x = x
-                                self.y = y
-                        
-                        old_target = self.target
-                        self.target = TempTarget(flag_x, flag_y)
-                        self.find_path_to_target(obstacles)
-                        self.target = old_target
-                        self.path_update_time = current_time
-                    
-                    self.follow_path()
+                    self.navigate_to(flag_x, flag_y, current_time, obstacles)
                 else:
                     # Patrulează în jurul steagului
                     self.explore()
@@ -616,24 +576,30 @@ class Agent:
         dy = map_center_y - self.y
         distance = math.sqrt(dx*dx + dy*dy)
         
-        if distance > 0:
+        # Pe harta meciului: direcția în care crește distanța până la ziduri (O(1))
+        escape = self.game_map.escape_direction(self.x, self.y) if self.game_map is not None else None
+        if escape is not None:
+            self.velocity_x = escape[0] * self.speed * 1.5
+            self.velocity_y = escape[1] * self.speed * 1.5
+        elif distance > 0:
             # 70% șansă să meargă către centru, 30% direcție random
-            if random.random() < 0.7:
+            if self.rng.random() < 0.7:
                 self.velocity_x = (dx / distance) * self.speed * 1.5
                 self.velocity_y = (dy / distance) * self.speed * 1.5
             else:
                 # Direcție random dar perpendiculară pe direcția curentă pentru a evita blocarea
                 current_angle = math.atan2(self.velocity_y, self.velocity_x) if (abs(self.velocity_x) > 0.1 or abs(self.velocity_y) > 0.1) else 0
-                perpendicular_angle = current_angle + math.pi / 2 + random.uniform(-math.pi/4, math.pi/4)
+                perpendicular_angle = current_angle + math.pi / 2 + self.rng.uniform(-math.pi/4, math.pi/4)
                 self.velocity_x = math.cos(perpendicular_angle) * self.speed * 1.5
                 self.velocity_y = math.sin(perpendicular_angle) * self.speed * 1.5
         else:
             # Fallback: direcție random
-            angle = random.uniform(0, 2 * math.pi)
+            angle = self.rng.uniform(0, 2 * math.pi)
             self.velocity_x = math.cos(angle) * self.speed * 1.5
             self.velocity_y = math.sin(angle) * self.speed * 1.5
         
-        self.path = []  # Resetează calea
+        self.path.clear()  # Resetează calea
+        self.route.clear()
         self.path_update_time = 0  # Forțează recalculare imediată
         self.explore_direction = None  # Resetează direcția de explorare
     
@@ -661,6 +627,11 @@ class Agent:
         # Dacă suntem departe de centru (în bază), reducem separarea pentru a permite ieșirea
         in_base = distance_to_center < 150  # Considerăm că suntem în bază dacă suntem departe de centru
         
+        # Doar coechipierii vii din apropiere (din grilă, dacă există)
+        if self.grid is not None:
+            nearby = self.grid.query_radius(self.x, self.y, AGENT_SEPARATION_DISTANCE, team_id=self.team_id)
+            agents = [self.grid.items[slot] for slot in nearby]
+        
         for agent in agents:
             if agent == self or not agent.alive or agent.team_id != self.team_id:
                 continue
@@ -757,18 +728,15 @@ class Agent:
             return False
         
         # Verifică dacă există obstacole între agenți
-        # Simplificat: verificăm câteva puncte pe linia dintre agenți
-        num_checks = int(distance / 10)  # Un check la fiecare 10 pixeli
-        for i in range(1, num_checks):
-            t = i / num_checks
-            check_x = self.x + dx * t
-            check_y = self.y + dy * t
-            
-            for obstacle in obstacles:
-                if not obstacle.alive:
-                    continue
-                if obstacle.rect.collidepoint(check_x, check_y):
-                    return False
+        if self.game_map is not None and obstacles is self.game_map.obstacles:
+            # Traversare exactă a tile-urilor de pe segment (oprită la primul zid)
+            return self.game_map.raycast(self.x, self.y, agent.x, agent.y) is None
+        
+        # Listă arbitrară de obstacole: intersecție exactă segment - dreptunghi
+        segment = (self.x, self.y, agent.x, agent.y)
+        for obstacle in obstacles:
+            if obstacle.alive and obstacle.rect.clipline(segment):
+                return False
         
         return True
     
@@ -777,10 +745,20 @@ class Agent:
         min_distance = float('inf')
         closest_enemy = None
         
+        check_los = True
+        if self.visibility is not None and self.visibility.covers(self.slot, obstacles):
+            # Inamicii văzuți la începutul tick-ului (matricea partajată)
+            agents = [self.store.agents[slot] for slot in self.visibility.visible_targets(self.slot)]
+            check_los = False
+        elif self.grid is not None:
+            # Doar inamicii vii din raza de vedere (din grilă)
+            nearby = self.grid.query_radius(self.x, self.y, AGENT_LOS_RANGE, enemy_of=self.team_id)
+            agents = [self.grid.items[slot] for slot in nearby]
+        
         for agent in agents:
             if agent.team_id != self.team_id and agent.alive:
                 # Verifică dacă este în LoS
-                if self.is_in_line_of_sight(agent, obstacles):
+                if not check_los or self.is_in_line_of_sight(agent, obstacles):
                     distance = self.distance_to(agent)
                     if distance < min_distance:
                         min_distance = distance
@@ -792,7 +770,8 @@ class Agent:
                 # Nu reseta calea dacă mergem către steag
                 pass
             else:
-                self.path = []
+                self.path.clear()
+                self.route.clear()
             # Broadcast noul inamic spotat
             if closest_enemy and message_bus and hasattr(self, 'agent_id'):
                 message_bus.broadcast_enemy_spotted(self, closest_enemy)
@@ -897,7 +876,7 @@ class Agent:
         if not message_bus or not hasattr(self, 'agent_id'):
             return
         from communication import Message  # Import local pentru a evita cicluri
-        ts = pygame.time.get_ticks()
+        ts = self.clock.get_ticks()
         
         # Rotunjește coordonatele la 3 zecimale dacă există în payload
         processed_payload = payload.copy()
@@ -922,123 +901,257 @@ class Agent:
             is_limited=is_limited
         ))
     
-    def find_path_to_target(self, obstacles):
-        """Găsește o cale către țintă folosind Dijkstra"""
-        if not self.target:
+    def path_priority(self):
+        """Prioritatea cererilor de cale ale agentului (carrier > chaser > atacator > explorator)"""
+        if self.carrying_flag or self.role == ROLE_CARRIER:
+            return PRIORITY_CARRIER
+        if self.role == ROLE_CHASER:
+            return PRIORITY_CHASER
+        if self.role == ROLE_ATTACKER or (self.target and getattr(self.target, "alive", False)):
+            return PRIORITY_ATTACKER
+        return PRIORITY_EXPLORER
+    
+    def request_path(self, obstacles, current_time, target=None, priority=None):
+        """
+        Cere recalcularea căii către țintă
+        
+        Cu PathScheduler-ul meciului cererea intră în coadă și calea veche rămâne
+        în folosință până când cererea este servită; altfel calea se calculează imediat.
+        
+        Args:
+            obstacles: Lista de obstacole
+            current_time: Timpul curent
+            target: Ținta căii (implicit self.target)
+            priority: Prioritatea cererii (implicit path_priority())
+        """
+        self.path_update_time = current_time
+        target = target if target is not None else self.target
+        if self.path_scheduler is not None and self.game_map is not None and obstacles is self.game_map.obstacles:
+            self.path_scheduler.submit(self, target, priority if priority is not None else self.path_priority())
+        else:
+            self.find_path_to_target(obstacles, target)
+    
+    def find_path_to_target(self, obstacles, target=None):
+        """
+        Găsește o cale către țintă (implicit self.target) folosind A* (heuristică octilă)
+        
+        O țintă FlowField este o destinație statică comună echipei (zonă, steag,
+        bază): calea este planificată cooperativ (WHCA*) pe câmpul ei de flux.
+        """
+        target = target if target is not None else self.target
+        if not target:
+            return
+        if isinstance(target, FlowField):
+            self.plan_cooperative(target)
             return
+        self.route.clear()
         
         # Convertește pozițiile în coordonate de grilă
         grid_size = TILE_SIZE
-        start_x, start_y = int(self.x / grid_size), int(self.y / grid_size)
-        target_x, target_y = int(self.target.x / grid_size), int(self.target.y / grid_size)
+        start = (int(self.x / grid_size), int(self.y / grid_size))
+        goal = (int(target.x / grid_size), int(target.y / grid_size))
+        
+        # Graful de navigare: cel al hărții (precalculat) sau unul construit din lista dată
+        table = hpa = None
+        on_map = self.game_map is not None and obstacles is self.game_map.obstacles
+        if on_map:
+            nav = self.game_map.nav_grid
+            table = self.game_map.next_hops
+            hpa = self.game_map.hpa
+        else:
+            nav = NavGrid.from_obstacles(obstacles)
         
-        # Creează harta de obstacole într-o grilă
-        grid_obstacles = set()
-        for obstacle in obstacles:
-            if not obstacle.alive:
-                continue
-            obs_x1, obs_y1 = obstacle.rect.x // grid_size, obstacle.rect.y // grid_size
-            obs_x2, obs_y2 = (obstacle.rect.x + obstacle.rect.width) // grid_size, (obstacle.rect.y + obstacle.rect.height) // grid_size
-            
-            for x in range(obs_x1, obs_x2 + 1):
-                for y in range(obs_y1, obs_y2 + 1):
-                    grid_obstacles.add((x, y))
-        
-        # Implementare Dijkstra (nu folosim heuristică)
-        open_set = [(0, 0, (start_x, start_y))]  # (cost, counter, pos)
-        came_from = {}
-        cost = {(start_x, start_y): 0}
-        open_set_hash = {(start_x, start_y)}
-        counter = 1
-        
-        max_iterations = 500  # Limită pentru a preveni bucle infinite
-        iterations = 0
-        
-        while open_set and iterations < max_iterations:
-            iterations += 1
-            current_cost, _, current = heapq.heappop(open_set)
-            open_set_hash.remove(current)
-            
-            if current == (target_x, target_y):
-                # Reconstruiește calea
-                path = []
-                while current in came_from:
-                    path.append((current[0] * grid_size + grid_size // 2, 
-                                current[1] * grid_size + grid_size // 2))
-                    current = came_from[current]
-                
-                self.path = path[::-1]  # Inversează calea
+        # Cu tabelul precalculat drumul este citit direct (fără căutare)
+        if table is not None and nav.in_bounds(*goal):
+            tiles = table.path(start, goal)
+            if tiles is not None:
+                self.set_path(tiles, smooth=True)
                 return
+        
+        # Pe hărțile mari: traseu abstract HPA*, rafinat segment cu segment
+        if hpa is not None and nav.in_bounds(*goal) and nav.is_walkable(*goal):
+            route = hpa.find_route(start, goal)
+            if route is not None:
+                self.route = deque(route)
+                self.refine_route()
+                return
+        
+        tiles, reached = astar(nav, start, goal)
+        
+        # Dacă ținta nu poate fi atinsă, ne apropiem cât putem (dacă nu avem deja o cale)
+        if reached or (not self.path and tiles):
+            self.set_path(tiles, smooth=on_map)
+    
+    def set_path(self, tiles, smooth=False):
+        """
+        Stochează o cale dată ca tile-uri, ca deque de centre de tile-uri
+        
+        Args:
+            tiles: Tile-urile căii (fără tile-ul de start)
+            smooth: Elimină punctele care se văd direct dintr-un punct anterior
+                    (raycast pe harta meciului, cu lățimea agentului)
+        """
+        half = TILE_SIZE // 2
+        points = [(tx * TILE_SIZE + half, ty * TILE_SIZE + half) for tx, ty in tiles]
+        if smooth and self.game_map is not None:
+            self.path = smooth_path((self.x, self.y), points, self._segment_clear)
+        else:
+            self.path = deque(points)
+        self.path_schedule.clear()
+    
+    def _segment_clear(self, a, b):
+        """True dacă agentul poate merge în linie dreaptă de la a la b pe harta meciului"""
+        return self.game_map.segment_clear(a[0], a[1], b[0], b[1], AGENT_SIZE / 2)
+    
+    def plan_cooperative(self, field):
+        """
+        Calea cooperativă (WHCA*) către destinația unui câmp de flux
+        
+        Primii WHCA_WINDOW pași sunt planificați în spațiu-timp, ocolind rezervările
+        coechipierilor, și sunt rezervați la rândul lor; restul căii urmează câmpul
+        de flux (netezit). Un agent ajuns în destinație își rezervă locul până la
+        capătul ferestrei, astfel încât coechipierii aleg alte tile-uri din zonă.
+        
+        Args:
+            field: FlowField-ul destinației (costul lui este heuristica exactă)
+        
+        Returns:
+            True dacă s-a găsit o cale (posibil goală, agentul e deja în destinație)
+        """
+        nav = self.game_map.nav_grid
+        start = (int(self.x / TILE_SIZE), int(self.y / TILE_SIZE))
+        step = self.reservations.step_at(self.clock.get_ticks())
+        nodes = cooperative_astar(nav, start, field.cost, self.reservations, self, step)
+        self.path_field = field
+        if nodes is None:
+            self.reservations.release(self)
+            return False
+        start_node = nav.node(*start)
+        held = [start_node] + nodes
+        held.extend([held[-1]] * (WHCA_WINDOW + 1 - len(held)))
+        self.reservations.reserve(self, held, step)
+        
+        # Partea coordonată: centrele tile-urilor cu pasul de sosire (așteptările
+        # se contopesc în mutarea următoare)
+        half = TILE_SIZE // 2
+        points, schedule = [], []
+        previous = start_node
+        for i, node in enumerate(nodes, 1):
+            if node != previous:
+                tx, ty = nav.tile(node)
+                point = (tx * TILE_SIZE + half, ty * TILE_SIZE + half)
+                points.append(point)
+                schedule.append((point, step + i))
+            previous = node
+        
+        # Restul: câmpul de flux de la capătul ferestrei până în destinație
+        tail = []
+        node = field.next_node[previous]
+        while node >= 0 and len(tail) < nav.width * nav.height:
+            tx, ty = nav.tile(node)
+            tail.append((tx * TILE_SIZE + half, ty * TILE_SIZE + half))
+            node = field.next_node[node]
+        anchor = points[-1] if points else (self.x, self.y)
+        self.path = deque(points)
+        self.path.extend(smooth_path(anchor, tail, self._segment_clear))
+        self.path_schedule = deque(schedule)
+        self.route.clear()
+        return True
+    
+    def refine_route(self):
+        """Calculează drumul pe tile-uri până la următorul nod din traseul HPA*"""
+        grid_size = TILE_SIZE
+        start = (int(self.x / grid_size), int(self.y / grid_size))
+        waypoint = self.route.popleft()
+        tiles, _ = self.game_map.hpa.refine(start, waypoint)
+        self.set_path(tiles, smooth=True)
+    
+    def navigate_to(self, goal_x, goal_y, current_time, obstacles, goal_rect=None):
+        """
+        Se deplasează către o destinație comună mai multor agenți (zonă, bază, steag)
+        
+        Pe harta meciului direcția este citită din câmpul de flux partajat al
+        destinației; altfel se folosește o cale A* proprie, recalculată periodic.
+        
+        Args:
+            goal_x, goal_y: Punctul destinație
+            current_time: Timpul curent (pentru recalcularea căii)
+            obstacles: Lista de obstacole
+            goal_rect: Zona destinație (orice tile din ea este suficient)
+        """
+        if self.game_map is not None and obstacles is self.game_map.obstacles:
+            flow_fields = self.game_map.flow_fields
+            if goal_rect is not None:
+                field = flow_fields.to_rect(goal_rect)
+            else:
+                field = flow_fields.to_point(goal_x, goal_y)
+            # Cu rezervările echipei: cale cooperativă, cerută prin PathScheduler
+            # periodic sau la schimbarea destinației (până la servire, sau fără
+            # cale, se folosește direct câmpul de flux)
+            if self.reservations is not None:
+                if self.path_field is not field:
+                    self.path_field = field
+                    self.path.clear()
+                    self.path_schedule.clear()
+                    self.request_path(obstacles, current_time, target=field)
+                elif current_time - self.path_update_time > self.path_update_delay:
+                    self.request_path(obstacles, current_time, target=field)
+                if self.path:
+                    self.follow_path()
+                    return
+            # În destinație (sau fără drum din tile-ul curent) mergi direct spre punct
+            waypoint = field.next_waypoint(self.x, self.y) or (goal_x, goal_y)
+            dx = waypoint[0] - self.x
+            dy = waypoint[1] - self.y
+            distance = math.sqrt(dx*dx + dy*dy)
+            if distance > 0:
+                self.velocity_x = (dx / distance) * self.speed
+                self.velocity_y = (dy / distance) * self.speed
+            self.path.clear()
+            self.route.clear()
+            return
+        
+        if current_time - self.path_update_time > self.path_update_delay:
+            class TempTarget:
+                def __init__(self, x, y):
+                    self.x = x
+                    self.y = y
             
-            # Verifică vecinii (8 direcții)
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-                
-                # Verifică limitele hărții
-                if (neighbor[0] < 0 or neighbor[0] >= MAP_WIDTH or 
-                    neighbor[1] < 0 or neighbor[1] >= MAP_HEIGHT):
-                    continue
-                
-                # Verifică obstacole
-                if neighbor in grid_obstacles:
-                    continue
-                
-                # Pentru diagonale, verifică și cele două căi directe
-                if abs(dx) == 1 and abs(dy) == 1:
-                    if (current[0] + dx, current[1]) in grid_obstacles or (current[0], current[1] + dy) in grid_obstacles:
-                        continue
-                
-                # Cost suplimentar pentru diagonale
-                move_cost = 1.4 if abs(dx) + abs(dy) == 2 else 1.0
-                
-                tentative_cost = cost[current] + move_cost
-                
-                if neighbor not in cost or tentative_cost < cost[neighbor]:
-                    came_from[neighbor] = current
-                    cost[neighbor] = tentative_cost
-                    
-                    if neighbor not in open_set_hash:
-                        counter += 1
-                        heapq.heappush(open_set, (tentative_cost, counter, neighbor))
-                        open_set_hash.add(neighbor)
-        
-        # Dacă nu găsim o cale completă, încercăm să ne apropiem cât putem
-        if not self.path and len(came_from) > 0:
-            # Găsește cel mai apropiat punct explorat
-            best_point = None
-            best_dist = float('inf')
-            
-            for point in came_from.keys():
-                dist = self.heuristic(point, (target_x, target_y))
-                if dist < best_dist:
-                    best_dist = dist
-                    best_point = point
-            
-            if best_point:
-                # Reconstruiește calea până la cel mai bun punct
-                path = []
-                current = best_point
-                while current in came_from:
-                    path.append((current[0] * grid_size + grid_size // 2, 
-                                current[1] * grid_size + grid_size // 2))
-                    current = came_from[current]
-                
-                self.path = path[::-1]  # Inversează calea
+            old_target = self.target
+            self.target = TempTarget(goal_x, goal_y)
+            self.find_path_to_target(obstacles)
+            self.target = old_target
+            self.path_update_time = current_time
+        
+        self.follow_path()
     
     def heuristic(self, a, b):
-        """Calculează distanța Manhattan între două puncte"""
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        """Calculează distanța octilă între două puncte de pe grilă"""
+        return octile_distance(a, b)
     
     def follow_path(self):
         """Urmează calea calculată"""
         # Folosește MEREU viteza constantă
         speed = self.speed
         
+        if not self.path and self.route:
+            self.refine_route()
+        
         if not self.path:
             # Dacă nu există cale, încearcă să te miști direct spre țintă
             self.move_direct_to_target()
             return
         
+        # Cale cooperativă: nu porni spre un tile rezervat înaintea pasului planificat
+        while self.path_schedule and self.path_schedule[0][0] != self.path[0]:
+            self.path_schedule.popleft()
+        if self.path_schedule and \
+                self.reservations.step_at(self.clock.get_ticks()) < self.path_schedule[0][1] - 1:
+            self.velocity_x = 0
+            self.velocity_y = 0
+            self.waiting_for_slot = True
+            return
+        
         # Verifică dacă am ajuns la primul punct din cale
         next_point = self.path[0]
         dx = next_point[0] - self.x
@@ -1047,7 +1160,9 @@ class Agent:
         
         # Dacă suntem foarte aproape de punct, treci la următorul
         if distance < speed * 2:
-            self.path.pop(0)
+            self.path.popleft()
+            if not self.path and self.route:
+                self.refine_route()
             if not self.path:
                 # Dacă nu mai există puncte, mergi direct la țintă sau steag
                 if self.target:
@@ -1075,7 +1190,7 @@ class Agent:
             self.velocity_y = (dy / distance) * speed
         else:
             # Dacă distanța e 0, elimină punctul și continuă
-            self.path.pop(0) if self.path else None
+            self.path.popleft() if self.path else None
     
     def move_direct_to_target(self):
         """Mișcare directă către țintă când suntem aproape sau nu avem cale"""
@@ -1104,6 +1219,11 @@ class Agent:
             flag_x = self.target_flag.x
             flag_y = self.target_flag.y
             
+            # Cu rezervările echipei: cale cooperativă, ca să nu meargă toți pe același culoar
+            if self.reservations is not None and self.game_map is not None:
+                self.navigate_to(flag_x, flag_y, self.clock.get_ticks(), self.game_map.obstacles)
+                return
+            
             dx = flag_x - self.x
             dy = flag_y - self.y
             distance = (dx*dx + dy*dy) ** 0.5
@@ -1125,7 +1245,18 @@ class Agent:
         distance_to_center = math.sqrt(dx*dx + dy*dy)
         
         # Dacă e departe de centru, mergi către centru (unde e mai probabil să fie acțiune)
-        if distance_to_center > 150:
+        if distance_to_center > 150 and self.game_map is not None:
+            # Pe harta meciului: urmează câmpul de flux către centru (ocolește zidurile
+            # în loc să rămână împins într-un colț pe linia dreaptă)
+            field = self.game_map.flow_fields.to_point(map_center_x, map_center_y)
+            waypoint = field.next_waypoint(self.x, self.y) or (map_center_x, map_center_y)
+            wx = waypoint[0] - self.x
+            wy = waypoint[1] - self.y
+            distance = math.sqrt(wx*wx + wy*wy)
+            if distance > 0:
+                self.velocity_x = (wx / distance) * speed
+                self.velocity_y = (wy / distance) * speed
+        elif distance_to_center > 150:
             # Foarte departe de centru, mergi direct către centru
             if distance_to_center > 0:
                 self.velocity_x = (dx / distance_to_center) * speed
@@ -1134,12 +1265,12 @@ class Agent:
             # Aproape de centru, dar nu încă acolo - mergi către centru cu varietate
             if distance_to_center > 0:
                 # 80% către centru, 20% direcție random pentru varietate
-                if random.random() < 0.8:
+                if self.rng.random() < 0.8:
                     self.velocity_x = (dx / distance_to_center) * speed
                     self.velocity_y = (dy / distance_to_center) * speed
                 else:
                     # Schimbă direcția random pentru explorare
-                    angle = random.uniform(0, 2 * math.pi)
+                    angle = self.rng.uniform(0, 2 * math.pi)
                     self.velocity_x = math.cos(angle) * speed
                     self.velocity_y = math.sin(angle) * speed
         else:
@@ -1148,23 +1279,23 @@ class Agent:
             center_angle = math.atan2(dy, dx) if distance_to_center > 0 else 0
             
             # Schimbă direcția periodic pentru a explora și a evita pereții
-            if random.random() < 0.2:  # 20% șansă să schimbe direcția (explorare activă)
+            if self.rng.random() < 0.2:  # 20% șansă să schimbe direcția (explorare activă)
                 # Alege o direcție care NU e către centru (pentru a explora)
-                if random.random() < 0.5:
+                if self.rng.random() < 0.5:
                     # Perpendicular la direcția către centru (stânga sau dreapta)
-                    perpendicular = random.choice([-1, 1])  # -1 pentru stânga, 1 pentru dreapta
-                    angle = center_angle + (perpendicular * math.pi / 2) + random.uniform(-math.pi/4, math.pi/4)
+                    perpendicular = self.rng.choice([-1, 1])  # -1 pentru stânga, 1 pentru dreapta
+                    angle = center_angle + (perpendicular * math.pi / 2) + self.rng.uniform(-math.pi/4, math.pi/4)
                 else:
                     # Opus direcției către centru (departe de centru)
-                    angle = center_angle + math.pi + random.uniform(-math.pi/3, math.pi/3)
+                    angle = center_angle + math.pi + self.rng.uniform(-math.pi/3, math.pi/3)
                 
                 self.velocity_x = math.cos(angle) * speed
                 self.velocity_y = math.sin(angle) * speed
             # Altfel, continuă în direcția curentă (dacă există)
             elif abs(self.velocity_x) < 0.1 and abs(self.velocity_y) < 0.1:
                 # Dacă nu se mișcă, forțează o direcție perpendiculară pe centru
-                perpendicular = random.choice([-1, 1])
-                angle = center_angle + (perpendicular * math.pi / 2) + random.uniform(-math.pi/4, math.pi/4)
+                perpendicular = self.rng.choice([-1, 1])
+                angle = center_angle + (perpendicular * math.pi / 2) + self.rng.uniform(-math.pi/4, math.pi/4)
                 self.velocity_x = math.cos(angle) * speed
                 self.velocity_y = math.sin(angle) * speed
 
@@ -1204,7 +1335,13 @@ class Agent:
         self.search_index = dists.index(min(dists)) if points else 0
     
     def apply_movement(self, obstacles):
-        """Aplică mișcarea și verifică coliziuni"""
+        """
+        Aplică mișcarea și rezolvă coliziunile cu zidurile (cerc-tile, cu alunecare pe zid)
+        
+        Pe harta meciului se folosesc bitmap-ul de ocupare și câmpul de distanță
+        ale hărții; o listă arbitrară de obstacole este rasterizată într-un bitmap
+        temporar și rezolvată la fel.
+        """
         new_x = self.x + self.velocity_x
         new_y = self.y + self.velocity_y
         
@@ -1212,132 +1349,33 @@ class Agent:
         new_x = max(AGENT_SIZE//2, min(MAP_WIDTH * TILE_SIZE - AGENT_SIZE//2, new_x))
         new_y = max(AGENT_SIZE//2, min(MAP_HEIGHT * TILE_SIZE - AGENT_SIZE//2, new_y))
         
-        # Verifică coliziuni cu obstacole
-        if not self.check_collision(new_x, new_y, obstacles):
-            self.x = new_x
-            self.y = new_y
+        on_map = self.game_map is not None and obstacles is self.game_map.obstacles
+        if on_map:
+            occupied = self.game_map.occupancy
+            tile_size = self.game_map.tile_size
         else:
-            # Încearcă să aluneci de-a lungul obstacolului (mișcare doar pe X sau doar pe Y)
-            moved = False
-            if not self.check_collision(new_x, self.y, obstacles):
-                self.x = new_x
-                moved = True
-            elif not self.check_collision(self.x, new_y, obstacles):
-                self.y = new_y
-                moved = True
-            
-            if not moved:
-                # Dacă nu s-a putut mișca deloc, încearcă să ocolești obstacolul
-                # Verifică dacă există o cale liberă pe o distanță mai mare
-                current_angle = math.atan2(self.velocity_y, self.velocity_x) if (abs(self.velocity_x) > 0.1 or abs(self.velocity_y) > 0.1) else 0
-                
-                # Dacă nu avem direcție, folosim direcția către centru
-                if abs(self.velocity_x) < 0.1 and abs(self.velocity_y) < 0.1:
-                    map_center_x = (MAP_WIDTH * TILE_SIZE) / 2
-                    map_center_y = (MAP_HEIGHT * TILE_SIZE) / 2
-                    dx = map_center_x - self.x
-                    dy = map_center_y - self.y
-                    dist = math.sqrt(dx*dx + dy*dy)
-                    if dist > 0:
-                        current_angle = math.atan2(dy, dx)
-                
-                # Încearcă 16 direcții (toate direcțiile principale și intermediare)
-                # Testează la distanțe mai mari pentru a ocoli pereții închisi
-                test_directions = []
-                for i in range(16):  # 16 direcții (22.5 grade între ele)
-                    angle = (2 * math.pi * i) / 16
-                    test_directions.append(angle)
-                
-                # Testează fiecare direcție verificând dacă există o cale liberă pe o distanță suficientă
-                best_direction = None
-                best_distance = 0
-                
-                for test_angle in test_directions:
-                    # Testează dacă direcția e liberă pe o distanță mai mare (pentru a scăpa din colțuri)
-                    test_distance = 0
-                    step_size = self.speed * 2
-                    max_test_distance = self.speed * 8  # Testează până la 8 pași înainte
-                    
-                    for distance in range(int(step_size), int(max_test_distance), int(step_size)):
-                        test_x = self.x + math.cos(test_angle) * distance
-                        test_y = self.y + math.sin(test_angle) * distance
-                        
-                        if self.check_collision(test_x, test_y, obstacles):
-                            break  # Blocat, oprește testarea
-                        
-                        test_distance = distance
-                    
-                    # Dacă această direcție e mai bună (mai liberă), o salvează
-                    if test_distance > best_distance:
-                        best_distance = test_distance
-                        best_direction = test_angle
-                
-                # Dacă am găsit o direcție bună, aplică-o
-                if best_direction is not None and best_distance > 0:
-                    # Aplică direcția cu o distanță suficientă pentru a scăpa
-                    move_distance = min(best_distance, self.speed * 3)
-                    self.velocity_x = math.cos(best_direction) * self.speed * 2
-                    self.velocity_y = math.sin(best_direction) * self.speed * 2
-                    
-                    # Verifică dacă poate merge în direcția nouă
-                    test_x = self.x + self.velocity_x
-                    test_y = self.y + self.velocity_y
-                    if not self.check_collision(test_x, test_y, obstacles):
-                        self.x = test_x
-                        self.y = test_y
-                        moved = True
-                
-                if not moved:
-                    # Dacă niciuna dintre direcții nu funcționează, încearcă să te îndepărtezi de obstacol
-                    # Găsește cel mai apropiat obstacol
-                    nearest_obstacle = None
-                    min_dist = float('inf')
-                    
-                    for obstacle in obstacles:
-                        if not obstacle.alive:
-                            continue
-                        dist = math.sqrt((self.x - obstacle.rect.centerx)**2 + (self.y - obstacle.rect.centery)**2)
-                        if dist < min_dist:
-                            min_dist = dist
-                            nearest_obstacle = obstacle
-                    
-                    if nearest_obstacle and min_dist < AGENT_SIZE * 3:
-                        # Calculează direcția opusă obstacolului
-                        dx = self.x - nearest_obstacle.rect.centerx
-                        dy = self.y - nearest_obstacle.rect.centery
-                        dist = math.sqrt(dx*dx + dy*dy)
-                        
-                        if dist > 0:
-                            # Normalizează și aplică velocitatea departe de obstacol
-                            self.velocity_x = (dx / dist) * self.speed * 1.2
-                            self.velocity_y = (dy / dist) * self.speed * 1.2
-                            
-                            # Verifică dacă poate merge în direcția nouă
-                            test_x = self.x + self.velocity_x
-                            test_y = self.y + self.velocity_y
-                            if not self.check_collision(test_x, test_y, obstacles):
-                                self.x = test_x
-                                self.y = test_y
-                                moved = True
-                    
-                    if not moved:
-                        # Dacă încă nu s-a putut mișca, resetează calea și velocitatea
-                        self.path = []
-                        self.path_update_time = 0
-                        # Redu velocitatea pentru a evita blocajele
-                        self.velocity_x *= 0.3
-                        self.velocity_y *= 0.3
-    
-    def check_collision(self, x, y, obstacles):
-        """Verifică coliziune cu obstacole"""
-        # Convertim la float pentru a evita probleme cu numpy types
-        x = float(x)
-        y = float(y)
-        agent_rect = pygame.Rect(x - AGENT_SIZE//2, y - AGENT_SIZE//2, AGENT_SIZE, AGENT_SIZE)
-        for obstacle in obstacles:
-            if obstacle.alive and agent_rect.colliderect(obstacle.rect):
-                return True
-        return False
+            occupied = occupancy_from_obstacles(obstacles)
+            tile_size = TILE_SIZE
+        
+        # O singură rezolvare cerc-tile (cost fix)
+        self.x, self.y, normals = resolve_circle(occupied, tile_size, new_x, new_y, AGENT_SIZE / 2)
+        for nx, ny in normals:
+            # Anulează doar componenta vitezei care intră în zid; rămâne cea tangentă
+            into_wall = self.velocity_x * nx + self.velocity_y * ny
+            if into_wall < 0:
+                self.velocity_x -= into_wall * nx
+                self.velocity_y -= into_wall * ny
+        # Împins direct într-un colț (nu rămâne componentă tangentă): ieși pe gradientul
+        # distanței până la ziduri chiar în acest frame (încă o rezolvare, cost tot fix)
+        if normals and abs(self.velocity_x) < 0.1 and abs(self.velocity_y) < 0.1:
+            # Câmpul hărții este memorat; cel al bitmap-ului temporar se calculează acum
+            clearance = self.game_map.clearance_field() if on_map else clearance_gradient(occupied)
+            escape = escape_direction(clearance, tile_size, self.x, self.y)
+            if escape is not None:
+                self.velocity_x = escape[0] * self.speed
+                self.velocity_y = escape[1] * self.speed
+                self.x, self.y, _ = resolve_circle(
+                    occupied, tile_size, self.x + self.velocity_x, self.y + self.velocity_y, AGENT_SIZE / 2)
     
     def try_attack(self, current_time, projectiles):
         """Încearcă să atace ținta cu proiectile"""
@@ -1353,8 +1391,7 @@ class Agent:
                 angle_to_target = math.atan2(dy, dx)
                 
                 # Creează proiectil cu owner pentru tracking statistici
-                projectile = Projectile(self.x, self.y, angle_to_target, self.team_id, PROJECTILE_DAMAGE, owner=self)
-                projectiles.append(projectile)
+                projectiles.spawn(self.x, self.y, angle_to_target, self.team_id, PROJECTILE_DAMAGE, owner=self)
                 
                 self.last_attack_time = current_time
     
@@ -1371,12 +1408,23 @@ class Agent:
         dy = self.y - other.y
         return math.sqrt(dx*dx + dy*dy)
     
-    def draw(self, screen, camera_x=0, camera_y=0):
-        """Desenează agentul"""
+    def draw(self, screen, camera_x=0, camera_y=0, los_overlay=None, position=None):
+        """
+        Desenează agentul
+        
+        Args:
+            screen: Suprafața pe care se desenează
+            camera_x, camera_y: Deplasarea camerei
+            los_overlay: Stratul LosOverlay al frame-ului pentru conul de vedere
+                         (None = conul este compus separat peste ecran)
+            position: (x, y) la care se desenează, interpolată între ultimii doi pași
+                      ai simulării (None = poziția curentă)
+        """
+        x, y = position if position is not None else (self.x, self.y)
         if not self.alive:
             # Desenează mort (X roșu)
-            x_pos = int(self.x - camera_x)
-            y_pos = int(self.y - camera_y)
+            x_pos = int(x - camera_x)
+            y_pos = int(y - camera_y)
             pygame.draw.line(screen, (200, 0, 0), 
                            (x_pos - 10, y_pos - 10), 
                            (x_pos + 10, y_pos + 10), 3)
@@ -1397,52 +1445,38 @@ class Agent:
         
         # Desenează corpul agentului
         pygame.draw.circle(screen, agent_color, 
-                         (int(self.x - camera_x), int(self.y - camera_y)), 
+                         (int(x - camera_x), int(y - camera_y)), 
                          AGENT_SIZE // 2)
         
         # Desenează contur
         pygame.draw.circle(screen, (0, 0, 0), 
-                         (int(self.x - camera_x), int(self.y - camera_y)), 
+                         (int(x - camera_x), int(y - camera_y)), 
                          AGENT_SIZE // 2, 2)
         
         # Desenează direcția (o linie mică către direcția facing)
-        end_x = self.x + math.cos(self.facing_angle) * (AGENT_SIZE // 2 + 10)
-        end_y = self.y + math.sin(self.facing_angle) * (AGENT_SIZE // 2 + 10)
+        end_x = x + math.cos(self.facing_angle) * (AGENT_SIZE // 2 + 10)
+        end_y = y + math.sin(self.facing_angle) * (AGENT_SIZE // 2 + 10)
         pygame.draw.line(screen, (255, 255, 255),
-                       (int(self.x - camera_x), int(self.y - camera_y)),
+                       (int(x - camera_x), int(y - camera_y)),
                        (int(end_x - camera_x), int(end_y - camera_y)), 3)
         
         # Desenează LoS (con semi-transparent)
-        los_color = (*agent_color, 50)  # Semi-transparent
-        los_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        # Calculează punctele pentru con
-        los_angle_rad = math.radians(AGENT_LOS_ANGLE / 2)
-        angle1 = self.facing_angle - los_angle_rad
-        angle2 = self.facing_angle + los_angle_rad
-        
-        # Punctele conului
-        point1 = (
-            int(self.x + math.cos(angle1) * AGENT_LOS_RANGE - camera_x),
-            int(self.y + math.sin(angle1) * AGENT_LOS_RANGE - camera_y)
-        )
-        point2 = (
-            int(self.x + math.cos(angle2) * AGENT_LOS_RANGE - camera_x),
-            int(self.y + math.sin(angle2) * AGENT_LOS_RANGE - camera_y)
-        )
-        center = (int(self.x - camera_x), int(self.y - camera_y))
-        
-        # Desenează conul LoS
-        pygame.draw.polygon(los_surface, los_color, [center, point1, point2])
-        screen.blit(los_surface, (0, 0))
+        cone = los_cone(x, y, self.facing_angle, camera_x, camera_y)
+        if los_overlay is not None:
+            # Stratul comun al frame-ului, compus o singură dată după toți agenții
+            los_overlay.add_cone(cone, agent_color)
+        else:
+            los_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            pygame.draw.polygon(los_surface, (*agent_color, LOS_ALPHA), cone)
+            screen.blit(los_surface, (0, 0))
         
         # Bara de viață
         health_bar_width = AGENT_SIZE
         health_bar_height = 4
         health_percentage = self.health / AGENT_MAX_HEALTH
         
-        bar_x = self.x - camera_x - health_bar_width // 2
-        bar_y = self.y - camera_y - AGENT_SIZE // 2 - 8
+        bar_x = x - camera_x - health_bar_width // 2
+        bar_y = y - camera_y - AGENT_SIZE // 2 - 8
         
         # Fundal bara
         pygame.draw.rect(screen, (255, 0, 0), 
@@ -0,0 +1,125 @@
+"""
+Stocare structure-of-arrays pentru starea agenților.
+
+Câmpurile folosite de toate trecerile globale (poziție, viteză, viață, orientare,
+echipă, stare) sunt ținute în array-uri NumPy contigue, indexate după slot-ul
+întreg al agentului. Clasa Agent rămâne o vedere subțire peste un slot, astfel
+încât codul existent (agent.x, agent.alive, ...) funcționează neschimbat, iar
+operațiile pe întreaga populație pot fi vectorizate.
+"""
+
+import numpy as np
+from config import TILE_SIZE
+
+# Câmp -> dtype pentru fiecare array din store
+AGENT_FIELDS = {
+    "x": np.float64,
+    "y": np.float64,
+    "velocity_x": np.float64,
+    "velocity_y": np.float64,
+    "health": np.float64,
+    "facing_angle": np.float64,
+    "team_id": np.int32,
+    "alive": np.bool_,
+}
+
+
+class AgentStore:
+    """Array-uri NumPy cu starea tuturor agenților unui meci"""
+
+    def __init__(self, capacity=16):
+        """
+        Args:
+            capacity: Numărul inițial de slot-uri (crește automat la nevoie)
+        """
+        self.capacity = max(1, capacity)
+        self.count = 0  # Număr de slot-uri alocate
+        for name, dtype in AGENT_FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+        # Agentul (vederea) asociat fiecărui slot
+        self.agents = []
+        # Pozițiile de dinaintea ultimului pas (pentru interpolarea la randare)
+        self.prev_x = None
+        self.prev_y = None
+
+    def allocate(self, agent=None):
+        """Alocă un slot nou și returnează indexul lui"""
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        slot = self.count
+        self.count += 1
+        self.agents.append(agent)
+        return slot
+
+    def _grow(self, new_capacity):
+        """Mărește capacitatea păstrând datele existente"""
+        for name, dtype in AGENT_FIELDS.items():
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = new_capacity
+
+    # ========== Vederi pe populația activă ==========
+
+    def view(self, name):
+        """Returnează array-ul unui câmp limitat la slot-urile alocate (fără copiere)"""
+        return getattr(self, name)[:self.count]
+
+    def positions(self):
+        """Returnează pozițiile ca array (count, 2)"""
+        return np.column_stack((self.x[:self.count], self.y[:self.count]))
+
+    def alive_slots(self, team_id=None):
+        """Returnează slot-urile agenților în viață (opțional doar dintr-o echipă)"""
+        mask = self.alive[:self.count]
+        if team_id is not None:
+            mask = mask & (self.team_id[:self.count] == team_id)
+        return np.flatnonzero(mask)
+
+    def team_alive_counts(self):
+        """Returnează {team_id: număr agenți în viață} pentru echipele cu agenți vii"""
+        teams = self.team_id[:self.count][self.alive[:self.count]]
+        ids, counts = np.unique(teams, return_counts=True)
+        return {int(team): int(n) for team, n in zip(ids, counts)}
+
+
+    # ========== Interpolare pentru randare ==========
+
+    def snapshot_positions(self):
+        """Memorează pozițiile curente ca stare anterioară, înaintea unui pas de simulare"""
+        self.prev_x = self.x[:self.count].copy()
+        self.prev_y = self.y[:self.count].copy()
+
+    def interpolated_positions(self, alpha, max_jump=TILE_SIZE):
+        """
+        Pozițiile între ultimele două stări ale simulării
+
+        Args:
+            alpha: Fracțiunea (0-1) din pasul următor scursă deja în timp real
+            max_jump: Deplasarea peste care agentul nu este interpolat (respawn)
+
+        Returns:
+            Array (count, 2) cu pozițiile de desenat
+        """
+        current = self.positions()
+        if self.prev_x is None or len(self.prev_x) != self.count:
+            return current
+        previous = np.column_stack((self.prev_x, self.prev_y))
+        moved = current - previous
+        # Teleportările (respawn) se desenează direct la noua poziție
+        jumped = np.hypot(moved[:, 0], moved[:, 1]) > max_jump
+        alpha = np.where(jumped, 1.0, alpha)
+        return previous + moved * alpha[:, None]
+
+
+def store_field(name):
+    """Creează o proprietate Agent care citește/scrie câmpul din store la slot-ul agentului"""
+    def getter(self):
+        # item() întoarce direct tipul Python (float/int/bool), nu un scalar NumPy
+        return getattr(self.store, name).item(self.slot)
+
+    def setter(self, value):
+        getattr(self.store, name)[self.slot] = value
+
+    return property(getter, setter)
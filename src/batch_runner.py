@@ -0,0 +1,163 @@
+"""
+Rulare batch headless a meciurilor (fără fereastră).
+
+Construiește lumi echivalente cu Game fără display, le rulează până la game_over
+într-un ProcessPoolExecutor și scrie rezultatul fiecărui meci (câștigător, durată,
+agregate StatisticsTracker) ca o linie JSON în fișierul de rezultate.
+
+Utilizare:
+    python main.py batch --mode "King of the Hill" --matches 5000 --workers 8
+    python -m batch_runner --mode Survival --matches 100 --output results.jsonl
+
+Cu --seed S, meciul i folosește sămânța S + i, iar sămânța fiecărui meci este
+scrisă în rezultate; un meci se rejoacă exact cu --matches 1 --seed <seed>.
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# Fără display - trebuie setat înainte de inițializarea pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from logger import logger
+from main import Game
+
+GAME_MODES = ["Survival", "King of the Hill", "Capture the Flag"]
+
+
+def _init_worker():
+    """Inițializează un proces worker (fără logging verbos per mesaj)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    logger.set_level(logging.WARNING)
+
+
+def match_seed(base_seed, match_index):
+    """Sămânța unui meci din batch (None = aleatoare)"""
+    if base_seed is None:
+        return None
+    return base_seed + match_index
+
+
+def run_match(game_mode, base_seed, match_index):
+    """
+    Rulează un meci headless până la final
+
+    Args:
+        game_mode: Numele modului de joc
+        base_seed: Sămânța batch-ului (None = meciuri aleatoare)
+        match_index: Indexul meciului în batch
+
+    Returns:
+        Dicționar cu rezultatul meciului (serializabil JSON)
+    """
+    game = Game(game_mode, headless=True, seed=match_seed(base_seed, match_index))
+    while not game.game_mode.game_over:
+        game.update()
+    return collect_match_result(game, match_index)
+
+
+def collect_match_result(game, match_index):
+    """Extrage rezultatul unui meci terminat"""
+    mode = game.game_mode
+    end_time = mode.end_time if mode.end_time is not None else game.sim_clock.get_ticks()
+    result = {
+        "match": match_index,
+        "mode": game.game_mode_name,
+        "seed": game.seed,
+        "winner": mode.winner,
+        "duration_s": round((end_time - mode.start_time) / 1000.0, 3),
+        "ticks": game.sim_clock.tick_count,
+        "communication": {str(team): comm for team, comm in game.team_communication_modes.items()},
+        "teams": {str(team): game.statistics_tracker.get_team_summary(team) for team in [0, 1]}
+    }
+    # Coada de pathfinding (doar metricile deterministe, fără timpi)
+    metrics = game.path_scheduler.metrics()
+    result["path_requests"] = {key: metrics[key] for key in ("served_total", "peak_queue_length", "mean_wait_ticks")}
+    # Obiective specifice modului
+    if hasattr(mode, "team_zone_time"):
+        result["zone_time"] = {str(team): round(t, 3) for team, t in mode.team_zone_time.items()}
+    if hasattr(mode, "team_scores"):
+        result["scores"] = {str(team): score for team, score in mode.team_scores.items()}
+    return result
+
+
+def run_batch(game_mode, matches, workers, output_path, seed=None):
+    """
+    Rulează un batch de meciuri și scrie rezultatele pe măsură ce se termină
+
+    Args:
+        game_mode: Numele modului de joc
+        matches: Numărul de meciuri
+        workers: Numărul de procese (1 = rulare în procesul curent)
+        output_path: Fișierul JSON Lines pentru rezultate
+        seed: Sămânța de bază (meciul i folosește seed + i)
+
+    Returns:
+        Dicționar cu sumarul batch-ului (victorii per echipă, egalități, durată medie)
+    """
+    summary = {"matches": 0, "wins": {0: 0, 1: 0}, "draws": 0, "total_duration_s": 0.0}
+    task = partial(run_match, game_mode, seed)
+
+    with open(output_path, "w") as output:
+        if workers <= 1:
+            _init_worker()
+            results = map(task, range(matches))
+            _write_results(results, output, summary)
+        else:
+            chunksize = max(1, matches // (workers * 8))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                results = executor.map(task, range(matches), chunksize=chunksize)
+                _write_results(results, output, summary)
+
+    return summary
+
+
+def _write_results(results, output, summary):
+    """Scrie fiecare rezultat imediat în fișier și actualizează sumarul"""
+    for result in results:
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+        summary["matches"] += 1
+        summary["total_duration_s"] += result["duration_s"]
+        if result["winner"] is None:
+            summary["draws"] += 1
+        else:
+            summary["wins"][result["winner"]] = summary["wins"].get(result["winner"], 0) + 1
+
+
+def parse_args(argv=None):
+    """Parsează argumentele din linia de comandă"""
+    parser = argparse.ArgumentParser(description="Synapse Strike - rulare batch headless")
+    parser.add_argument("--mode", default="Survival", choices=GAME_MODES, help="Modul de joc")
+    parser.add_argument("--matches", type=int, default=100, help="Numărul de meciuri")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Numărul de procese")
+    parser.add_argument("--seed", type=int, default=None, help="Sămânța de bază pentru meciuri reproductibile")
+    parser.add_argument("--output", default="batch_results.jsonl", help="Fișierul de rezultate (JSON Lines)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logger.info(f"Batch start - mode: {args.mode}, matches: {args.matches}, workers: {args.workers}")
+
+    start = time.perf_counter()
+    summary = run_batch(args.mode, args.matches, args.workers, args.output, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    matches = summary["matches"]
+    avg_duration = summary["total_duration_s"] / matches if matches else 0.0
+    print(f"Meciuri: {matches} în {elapsed:.1f}s ({matches / elapsed if elapsed > 0 else 0:.1f} meciuri/s)")
+    print(f"Victorii: Team 1 = {summary['wins'][0]}, Team 2 = {summary['wins'][1]}, Egalități = {summary['draws']}")
+    print(f"Durată medie (timp simulat): {avg_duration:.1f}s")
+    print(f"Rezultate scrise în {args.output}")
+    logger.info(f"Batch finished - {matches} matches in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
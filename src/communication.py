@@ -1,7 +1,8 @@
-import pygame
-import math
+import numpy as np
 from config import COMMUNICATION_RANGE
 from logger import logger
+from sim_clock import resolve_clock
+from spatial_grid import SpatialGrid
 
 class Message:
     """Mesaj simplu pentru comunicare între agenți din aceeași echipă.
@@ -29,11 +30,17 @@ class MessageBus:
 
     Mesajele sunt păstrate doar câteva milisecunde pentru a preveni acumularea.
     """
-    def __init__(self, max_age_ms=2000):
+    def __init__(self, max_age_ms=2000, clock=None):
         self.max_age_ms = max_age_ms
+        self.clock = resolve_clock(clock)  # Sursa de timp pentru mesajele generate de bus
         self.messages = []
         self._agent_index = {}  # agent_id -> Agent
         self._team_communication_modes = {}  # team_id -> "FULL" | "LIMITED" | "NONE"
+        # Index spațial al pozițiilor expeditorilor, reconstruit o dată pe tick (la cleanup);
+        # mesajele publicate după reconstruire (indicii >= _indexed_count) sunt verificate direct
+        self._sender_grid = SpatialGrid()
+        self._unpositioned = []  # Indicii mesajelor indexate fără poziția expeditorului
+        self._indexed_count = 0
 
     def set_agents(self, agent_index):
         """Actualizează indexul de agenți (apelat după spawn/reset)."""
@@ -67,42 +74,72 @@ class MessageBus:
         if team_mode == "NONE":
             return []
         
+        # LIMITED: doar mesajele expeditorilor din raza de comunicare, luate din grilă
+        if team_mode == "LIMITED" and receiving_agent is not None:
+            return self._collect_nearby(team_id, current_time, receiving_agent)
+        
         filtered_messages = []
         for m in self.messages:
             # Verifică dacă mesajul este pentru echipa corectă și nu a expirat
             if m.team_id != team_id or (current_time - m.timestamp) > self.max_age_ms:
                 continue
             
-            # Pentru modul LIMITED, verifică distanța
-            if team_mode == "LIMITED" and receiving_agent is not None:
-                # Verifică dacă receptorul este suficient de aproape
-                if m.sender_x is not None and m.sender_y is not None:
-                    dx = receiving_agent.x - m.sender_x
-                    dy = receiving_agent.y - m.sender_y
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    # Dacă distanța este mai mare decât raza de comunicare, ignoră mesajul
-                    if distance > COMMUNICATION_RANGE:
-                        continue
             # Pentru modul FULL, toate mesajele sunt permise (dar verificăm și flag-ul legacy is_limited)
-            elif m.is_limited and receiving_agent is not None:
-                # Verifică dacă receptorul este suficient de aproape pentru mesajele cu is_limited=True
-                if m.sender_x is not None and m.sender_y is not None:
-                    dx = receiving_agent.x - m.sender_x
-                    dy = receiving_agent.y - m.sender_y
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    # Dacă distanța este mai mare decât raza de comunicare, ignoră mesajul
-                    if distance > COMMUNICATION_RANGE:
-                        continue
+            if m.is_limited and receiving_agent is not None and not self._in_range(m, receiving_agent):
+                continue
             
             filtered_messages.append(m)
         
         return filtered_messages
 
+    def _collect_nearby(self, team_id, current_time, receiving_agent):
+        """Mesajele echipei trimise din raza de comunicare a receptorului (plus cele fără poziție)."""
+        nearby = self._sender_grid.query_radius(receiving_agent.x, receiving_agent.y,
+                                                COMMUNICATION_RANGE, team_id=team_id)
+        indices = sorted(nearby + self._unpositioned)
+        # Mesajele publicate în tick-ul curent nu sunt încă în grilă
+        recent = range(self._indexed_count, len(self.messages))
+        
+        filtered_messages = []
+        for i in indices + [i for i in recent if self._in_range(self.messages[i], receiving_agent)]:
+            m = self.messages[i]
+            if m.team_id != team_id or (current_time - m.timestamp) > self.max_age_ms:
+                continue
+            filtered_messages.append(m)
+        return filtered_messages
+
+    def _in_range(self, message, receiving_agent):
+        """True dacă receptorul este în raza de comunicare a expeditorului (sau mesajul nu are poziție)."""
+        if message.sender_x is None or message.sender_y is None:
+            return True
+        dx = receiving_agent.x - message.sender_x
+        dy = receiving_agent.y - message.sender_y
+        return dx * dx + dy * dy <= COMMUNICATION_RANGE * COMMUNICATION_RANGE
+
+    def _rebuild_index(self):
+        """Reconstruiește grila pozițiilor expeditorilor pentru toate mesajele curente."""
+        count = len(self.messages)
+        x = np.zeros(count)
+        y = np.zeros(count)
+        teams = np.zeros(count, dtype=np.int32)
+        positioned = np.zeros(count, dtype=bool)
+        self._unpositioned = []
+        for i, m in enumerate(self.messages):
+            teams[i] = m.team_id
+            if m.sender_x is not None and m.sender_y is not None:
+                x[i] = m.sender_x
+                y[i] = m.sender_y
+                positioned[i] = True
+            else:
+                self._unpositioned.append(i)
+        # Mesajele fără poziție sunt marcate ca inactive în grilă (tratate separat)
+        self._sender_grid.rebuild(x, y, teams, positioned)
+        self._indexed_count = count
+
     def cleanup(self, current_time):
         """Elimină mesajele expirate."""
         self.messages = [m for m in self.messages if current_time - m.timestamp <= self.max_age_ms]
+        self._rebuild_index()
 
     def resolve_agent(self, agent_id):
         return self._agent_index.get(agent_id)
@@ -118,7 +155,7 @@ class MessageBus:
             return
         if not enemy_agent:
             return
-        ts = pygame.time.get_ticks()
+        ts = self.clock.get_ticks()
         is_limited = getattr(spotter_agent, 'has_limited_communication', False)
         msg = Message(
             sender_id=spotter_agent.agent_id,
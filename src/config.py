@@ -2,6 +2,9 @@
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+SIM_MS_PER_TICK = 1000 / FPS  # Milisecunde simulate per tick (pas fix al simulării)
+RENDER_FPS = 60  # Limita de randare (frame-uri pe secundă), independentă de simulare
+MAX_SIM_STEPS_PER_FRAME = 5  # Pași de recuperare per frame (restul întârzierii se abandonează)
 
 # Culori echipe
 TEAM_COLORS = {
@@ -35,6 +38,12 @@ AGENT_LOS_ANGLE = 90  # Unghiul conului de vedere (grade)
 AGENT_LOS_RANGE = 250  # Distanța maximă de vedere
 AGENT_SEPARATION_DISTANCE = 30  # Distanța minimă între agenți din aceeași echipă
 COMMUNICATION_RANGE = 150  # Distanța maximă pentru comunicare limitată între vecini (pixels)
+SPATIAL_CELL_SIZE = 64  # Latura unei celule din SpatialGrid (pixels)
+NEXT_HOP_TABLE = False  # Opțional: precalculează drumurile minime între toate tile-urile hărții (hărți mici)
+PATH_BUDGET_EXPANSIONS = 2000  # Noduri expandate per tick de PathScheduler
+PATH_BUDGET_MS = None  # Buget opțional de timp per tick (ms); None = doar bugetul de noduri (determinist)
+COOPERATIVE_PATHS = False  # Opțional: coechipierii își rezervă drumurile (WHCA*) în KOTH și CTF
+WHCA_WINDOW = 8  # Pași de timp (tile-uri traversate) coordonați prin rezervări
 
 # Configurări proiectile
 PROJECTILE_SIZE = 5
@@ -1,6 +1,8 @@
 import pygame
-import random
 from config import *
+from sim_clock import resolve_clock
+from text_cache import resolve_text_cache
+from match_rng import resolve_rng
 
 
 class Flag:
@@ -80,14 +82,18 @@ class Flag:
 
 
 class CaptureTheFlagMode:
-    def __init__(self, agents, game_map, statistics_tracker=None, message_bus=None):
+    def __init__(self, agents, game_map, statistics_tracker=None, message_bus=None, clock=None, rng=None, grid=None, text_cache=None):
         self.agents = agents
         self.game_map = game_map
         self.statistics_tracker = statistics_tracker
         self.message_bus = message_bus
+        self.clock = resolve_clock(clock)  # Sursa de timp (SimClock sau timp real)
+        self.text_cache = resolve_text_cache(text_cache)  # Fonturi și texte randate
+        self.rng = resolve_rng(rng)  # Generatorul meciului (implicit modulul random)
+        self.grid = grid  # SpatialGrid al agenților (None = parcurgere liniară)
         self.time_limit = CTF_TIME_LIMIT
         self.max_points = CTF_MAX_POINTS
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.clock.get_ticks()
         self.end_time = None  # Timpul când jocul s-a terminat
         self.game_over = False
         self.winner = None
@@ -137,7 +143,7 @@ class CaptureTheFlagMode:
         if self.game_over:
             return
        
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
        
         # Verifică timpul
         elapsed_time = (current_time - self.start_time) / 1000
@@ -173,9 +179,19 @@ class CaptureTheFlagMode:
    
     def check_flag_captures(self):
         """Verifică dacă agenții captează steaguri"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
        
-        for agent in self.agents:
+        if self.grid is not None:
+            # Reindexează după respawn-uri; candidați doar inamicii din jurul fiecărui steag
+            self.grid.refresh()
+            nearby = set()
+            for flag in self.flags.values():
+                nearby.update(self.grid.query_radius(flag.x, flag.y, CTF_FLAG_CAPTURE_RADIUS, enemy_of=flag.team_id))
+            agents = [self.grid.items[slot] for slot in sorted(nearby)]
+        else:
+            agents = self.agents
+       
+        for agent in agents:
             if not agent.alive:
                 continue
            
@@ -236,7 +252,7 @@ class CaptureTheFlagMode:
    
     def check_flag_deliveries(self):
         """Verifică dacă agenții livrează steaguri la baza proprie"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
        
         for agent in self.agents:
             if not agent.alive or not agent.carrying_flag:
@@ -276,11 +292,12 @@ class CaptureTheFlagMode:
             if current_time - death_time >= CTF_RESPAWN_TIME:
                 # Respawn agentul în baza echipei
                 base = self.bases[agent.team_id]
-                agent.x = base.centerx + random.randint(-20, 20)
-                agent.y = base.centery + random.randint(-20, 20)
+                agent.x = base.centerx + self.rng.randint(-20, 20)
+                agent.y = base.centery + self.rng.randint(-20, 20)
                 agent.health = AGENT_MAX_HEALTH
                 agent.alive = True
-                agent.path = []
+                agent.path.clear()
+                agent.route.clear()
                 agent.target = None
                 agent.carrying_flag = None
                 agent.role = ROLE_ATTACKER  # Toți devin atacatori după respawn
@@ -289,7 +306,7 @@ class CaptureTheFlagMode:
    
     def on_agent_death(self, agent):
         """Apelat când un agent moare"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
        
         # Dacă purta un steag, îl scapă la poziția curentă
         if agent.carrying_flag:
@@ -329,7 +346,7 @@ class CaptureTheFlagMode:
         self.game_over = True
         # Salvează momentul când jocul s-a terminat pentru timer
         if self.end_time is None:
-            self.end_time = pygame.time.get_ticks()
+            self.end_time = self.clock.get_ticks()
         # Îngheață statisticile DPS
         if self.statistics_tracker:
             self.statistics_tracker.freeze_dps()
@@ -340,30 +357,27 @@ class CaptureTheFlagMode:
         if self.game_over and self.end_time is not None:
             elapsed = (self.end_time - self.start_time) / 1000
         else:
-            elapsed = (pygame.time.get_ticks() - self.start_time) / 1000
+            elapsed = (self.clock.get_ticks() - self.start_time) / 1000
         return max(0, self.time_limit - elapsed)
    
     def draw_ui(self, screen):
         """Desenează UI-ul modului Capture the Flag"""
-        font = pygame.font.Font(None, 36)
-        small_font = pygame.font.Font(None, 24)
        
         # Timp rămas
-        time_text = font.render(f"Time: {int(self.get_remaining_time())}s", True, (255, 255, 255))
+        time_text = self.text_cache.render(36, f"Time: {int(self.get_remaining_time())}s", (255, 255, 255))
         screen.blit(time_text, (SCREEN_WIDTH // 2 - 60, 10))
        
         # Scoruri echipe
         y_offset = 50
         for team_id in [0, 1]:
             score = self.team_scores[team_id]
-            text = font.render(f"Team {team_id + 1}: {score}/{self.max_points}", True, TEAM_COLORS[team_id])
+            text = self.text_cache.render(36, f"Team {team_id + 1}: {score}/{self.max_points}", TEAM_COLORS[team_id])
             x_pos = 10 if team_id == 0 else SCREEN_WIDTH - 200
             screen.blit(text, (x_pos, y_offset))
        
         # Statistici pentru fiecare echipă pe părțile laterale
         if self.statistics_tracker:
             y_offset = 100
-            small_font_stats = pygame.font.Font(None, 20)
            
             for team_id in [0, 1]:
                 # Număr de jucători în viață
@@ -375,28 +389,28 @@ class CaptureTheFlagMode:
                         teams_alive[agent.team_id] += 1
                
                 players_alive = teams_alive.get(team_id, 0)
-                text = small_font_stats.render(f"Players alive: {players_alive}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Players alive: {players_alive}", TEAM_COLORS[team_id])
                 x_pos = 10 if team_id == 0 else SCREEN_WIDTH - 200
                 screen.blit(text, (x_pos, y_offset))
                
                 # DPS
                 dps = self.statistics_tracker.get_team_dps(team_id)
-                text = small_font_stats.render(f"DPS: {dps:.1f}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"DPS: {dps:.1f}", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 20))
                
                 # Avg time alive
                 avg_time_alive = self.statistics_tracker.get_team_avg_time_alive(team_id)
-                text = small_font_stats.render(f"Avg time alive: {avg_time_alive:.1f}s", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Avg time alive: {avg_time_alive:.1f}s", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 40))
                
                 # Avg distance traveled
                 avg_distance = self.statistics_tracker.get_team_avg_distance(team_id)
-                text = small_font_stats.render(f"Avg distance: {avg_distance:.0f}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Avg distance: {avg_distance:.0f}", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 60))
                
                 # Total bullets fired
                 total_shots = self.statistics_tracker.get_team_total_shots(team_id)
-                text = small_font_stats.render(f"Bullets fired: {total_shots}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Bullets fired: {total_shots}", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 80))
        
         # Desenează bazele
@@ -417,27 +431,26 @@ class CaptureTheFlagMode:
         # Afișează statistici CTF
         if self.statistics_tracker:
             y_offset = 200  # Mutat mai jos pentru a nu se suprapune cu statisticile echipelor
-            small_font = pygame.font.Font(None, 20)
            
             avg_delivery = self.statistics_tracker.get_avg_delivery_time()
             avg_carry = self.statistics_tracker.get_avg_flag_carry_time()
            
-            text = small_font.render(f"Avg delivery: {avg_delivery:.1f}s", True, (255, 255, 255))
+            text = self.text_cache.render(20, f"Avg delivery: {avg_delivery:.1f}s", (255, 255, 255))
             screen.blit(text, (SCREEN_WIDTH // 2 - 100, y_offset))
            
-            text = small_font.render(f"Avg carry time: {avg_carry:.1f}s", True, (255, 255, 255))
+            text = self.text_cache.render(20, f"Avg carry time: {avg_carry:.1f}s", (255, 255, 255))
             screen.blit(text, (SCREEN_WIDTH // 2 - 100, y_offset + 20))
        
         # Mesaj de victorie
         if self.game_over:
-            game_over_text = font.render("GAME OVER!", True, (255, 255, 0))
+            game_over_text = self.text_cache.render(36, "GAME OVER!", (255, 255, 0))
             screen.blit(game_over_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 50))
            
             if self.winner is not None:
-                winner_text = font.render(f"Team {self.winner + 1} Wins!", True, TEAM_COLORS[self.winner])
+                winner_text = self.text_cache.render(36, f"Team {self.winner + 1} Wins!", TEAM_COLORS[self.winner])
                 screen.blit(winner_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2))
             else:
-                draw_text = font.render("Draw!", True, (255, 255, 255))
+                draw_text = self.text_cache.render(36, "Draw!", (255, 255, 255))
                 screen.blit(draw_text, (SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT // 2))
 
 
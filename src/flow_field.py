@@ -0,0 +1,225 @@
+"""
+Câmpuri de flux partajate către destinații comune.
+
+Când mulți agenți merg spre aceeași destinație (zona centrală KOTH, bazele și
+steagurile CTF), în loc de câte o căutare A* per agent se calculează o singură
+dată, cu Dijkstra multi-sursă pornit din tile-urile destinației, costul până la
+destinație pentru fiecare tile (câmpul de integrare) și vecinul următor pe
+drumul cel mai scurt (câmpul de direcții). Orice agent își citește apoi direcția
+în O(1) din tile-ul în care se află.
+
+Câmpurile sunt păstrate în FlowFieldCache după destinație. Când un zid este
+distrus, câmpurile existente nu sunt aruncate: ca în D* Lite, costurile sunt
+reparate incremental pornind doar din tile-urile eliberate și vecinii lor
+(muchiile noi pot doar scădea costurile), iar direcțiile sunt recalculate doar
+în jurul tile-urilor al căror cost s-a schimbat.
+"""
+
+import heapq
+import math
+import numpy as np
+from collections import OrderedDict
+from config import *
+
+# Câte câmpuri (destinații distincte) păstrează cache-ul
+FLOW_CACHE_SIZE = 32
+
+
+class FlowField:
+    """Costul până la destinație și următorul nod pentru fiecare tile"""
+
+    def __init__(self, nav, goal_nodes):
+        """
+        Args:
+            nav: NavGrid-ul hărții
+            goal_nodes: Nodurile destinație (surse ale căutării)
+        """
+        self.nav = nav
+        self.goal_nodes = tuple(goal_nodes)
+        self.repaired_nodes = 0  # Noduri atinse la ultima reparare (pentru profilare)
+        self._build()
+
+    def _build(self):
+        """Calculează câmpul de la zero"""
+        nav = self.nav
+        nav.adjacency()  # Reconstruiește graful dacă e nevoie
+        size = nav.width * nav.height
+        self.version = nav.version
+        self._blocked = nav.blocked.copy()
+
+        # Dijkstra multi-sursă; vecinătatea este simetrică între tile-urile libere
+        self.cost = [math.inf] * size
+        heap = []
+        for node in self.goal_nodes:
+            self.cost[node] = 0.0
+            heap.append((0.0, node))
+        heapq.heapify(heap)
+        self._propagate(heap)
+
+        # Direcții: vecinul cu cel mai mic cost total (inclusiv pentru tile-urile
+        # blocate de pe care un agent poate doar ieși)
+        self.next_node = [-1] * size
+        self._update_directions(range(size))
+
+    def _propagate(self, heap):
+        """Dijkstra din nodurile din heap; returnează nodurile al căror cost a scăzut"""
+        neighbor_start, neighbor_node, neighbor_cost = self.nav.adjacency()
+        cost = self.cost
+        changed = set()
+        while heap:
+            current_cost, current = heapq.heappop(heap)
+            if current_cost > cost[current]:
+                continue
+            for k in range(neighbor_start[current], neighbor_start[current + 1]):
+                neighbor = neighbor_node[k]
+                new_cost = current_cost + neighbor_cost[k]
+                if new_cost < cost[neighbor]:
+                    cost[neighbor] = new_cost
+                    changed.add(neighbor)
+                    heapq.heappush(heap, (new_cost, neighbor))
+        return changed
+
+    def _update_directions(self, nodes):
+        """Recalculează vecinul următor pentru nodurile date"""
+        neighbor_start, neighbor_node, neighbor_cost = self.nav.adjacency()
+        cost, next_node = self.cost, self.next_node
+        for node in nodes:
+            next_node[node] = -1
+            if cost[node] == 0.0:
+                continue
+            best = math.inf
+            for k in range(neighbor_start[node], neighbor_start[node + 1]):
+                candidate = cost[neighbor_node[k]] + neighbor_cost[k]
+                if candidate < best:
+                    best = candidate
+                    next_node[node] = neighbor_node[k]
+
+    def _around(self, nodes):
+        """Nodurile date împreună cu cei 8 vecini ai lor din hartă"""
+        width, height = self.nav.width, self.nav.height
+        result = set()
+        for node in nodes:
+            ty, tx = divmod(node, width)
+            for y in range(max(ty - 1, 0), min(ty + 2, height)):
+                for x in range(max(tx - 1, 0), min(tx + 2, width)):
+                    result.add(y * width + x)
+        return result
+
+    def ensure_current(self):
+        """
+        Aduce câmpul la versiunea curentă a grafului
+
+        Tile-urile eliberate doar adaugă muchii, deci costurile vechi rămân
+        margini superioare valide: se recalculează (ca rhs în D* Lite) costul
+        capetelor muchiilor noi, iar scăderile se propagă doar cât este nevoie.
+        Un tile nou blocat (nu apare în joc) duce la recalcularea completă.
+        """
+        nav = self.nav
+        if self.version == nav.version:
+            return
+        neighbor_start, neighbor_node, neighbor_cost = nav.adjacency()
+        blocked = nav.blocked
+        if (blocked & ~self._blocked).any():
+            self._build()
+            return
+        freed = np.flatnonzero(self._blocked & ~blocked).tolist()
+        self.version = nav.version
+        self._blocked = blocked.copy()
+
+        # Capetele muchiilor noi: tile-urile eliberate și vecinii lor (diagonalele
+        # dintre doi vecini se deschid odată cu colțul eliberat)
+        seeds = self._around(freed)
+
+        cost = self.cost
+        heap = []
+        changed = set()
+        for node in seeds:
+            if blocked.item(node):
+                # Un tile blocat nu poate fi atins (are doar muchii de ieșire); dacă
+                # este destinație, muchiile lui noi trebuie relaxate din nou
+                if cost[node] < math.inf:
+                    heapq.heappush(heap, (cost[node], node))
+                continue
+            best = cost[node]
+            for k in range(neighbor_start[node], neighbor_start[node + 1]):
+                best = min(best, cost[neighbor_node[k]] + neighbor_cost[k])
+            if best < cost[node]:
+                cost[node] = best
+                changed.add(node)
+                heapq.heappush(heap, (best, node))
+        changed |= self._propagate(heap)
+
+        # Direcțiile se pot schimba doar lângă costuri schimbate sau muchii noi
+        # (inclusiv pe tile-urile blocate, care au doar muchii de ieșire)
+        dirty = seeds | self._around(changed)
+        self._update_directions(dirty)
+        self.repaired_nodes = len(dirty)
+
+    def next_waypoint(self, x, y):
+        """
+        Centrul tile-ului următor către destinație pentru un punct (x, y)
+
+        Returns:
+            (wx, wy), sau None dacă punctul e deja într-un tile destinație
+            sau destinația nu poate fi atinsă de acolo
+        """
+        node = self.next_node[self.nav.node_at(x, y)]
+        if node < 0:
+            return None
+        nx, ny = self.nav.tile(node)
+        return (nx * TILE_SIZE + TILE_SIZE // 2, ny * TILE_SIZE + TILE_SIZE // 2)
+
+    def distance(self, x, y):
+        """Costul (în tile-uri) de la punctul (x, y) până la destinație"""
+        return self.cost[self.nav.node_at(x, y)]
+
+
+class FlowFieldCache:
+    """Câmpuri de flux după destinație, cu evacuare LRU"""
+
+    def __init__(self, nav, max_size=FLOW_CACHE_SIZE):
+        self.nav = nav
+        self.max_size = max_size
+        self._fields = OrderedDict()
+        self._rect_goals = {}  # Dreptunghi -> nodurile destinație
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, goal_nodes):
+        """Câmpul către un set de noduri destinație (reparat incremental după distrugerea zidurilor)"""
+        key = tuple(goal_nodes)
+        field = self._fields.get(key)
+        if field is not None:
+            self.hits += 1
+            self._fields.move_to_end(key)
+            field.ensure_current()
+            return field
+
+        self.misses += 1
+        field = FlowField(self.nav, key)
+        self._fields[key] = field
+        if len(self._fields) > self.max_size:
+            self._fields.popitem(last=False)
+        return field
+
+    def to_point(self, x, y):
+        """Câmpul către tile-ul care conține punctul (x, y)"""
+        return self.get((self.nav.node_at(x, y),))
+
+    def to_rect(self, rect):
+        """Câmpul către toate tile-urile cu centrul în interiorul dreptunghiului"""
+        key = (rect.x, rect.y, rect.width, rect.height)
+        goals = self._rect_goals.get(key)
+        if goals is None:
+            nav = self.nav
+            half = TILE_SIZE // 2
+            goals = tuple(nav.node(tx, ty)
+                          for ty in range(nav.height) for tx in range(nav.width)
+                          if rect.collidepoint(tx * TILE_SIZE + half, ty * TILE_SIZE + half))
+            self._rect_goals[key] = goals
+        if not goals:
+            return self.to_point(rect.centerx, rect.centery)
+        return self.get(goals)
+
+    def __len__(self):
+        return len(self._fields)
@@ -1,10 +1,185 @@
+import math
 import pygame
-import random
+import numpy as np
 from config import *
+from match_rng import resolve_rng
+from nav_grid import NavGrid
+from flow_field import FlowFieldCache
+from next_hop import NextHopTable, NEXT_HOP_MAX_CELLS
+from hpa import HierarchicalPlanner, HPA_MIN_CELLS
+
+# Culoarea fundalului hărții (iarbă)
+MAP_BACKGROUND_COLOR = (34, 139, 34)
+# Ordinea tile-urilor verificate de GameMap.resolve_circle: centru, laturi, diagonale
+RESOLVE_ORDER = [(0, 0), (0, -1), (0, 1), (-1, 0), (1, 0), (-1, -1), (1, -1), (-1, 1), (1, 1)]
+
+
+def _lower_envelope(f):
+    """
+    Transformata de distanță 1D la pătrat (Felzenszwalb-Huttenlocher):
+    d(x) = min după q din (x - q)² + f(q), în timp liniar, prin anvelopa
+    inferioară a parabolelor cu vârfurile în (q, f(q))
+
+    Args:
+        f: Costurile (la pătrat) ale fiecărei poziții
+
+    Returns:
+        Lista d(x) pentru fiecare poziție
+    """
+    n = len(f)
+    vertices = [0] * n  # Vârfurile parabolelor din anvelopă
+    bounds = [0.0] * (n + 1)  # Intervalele pe care domină fiecare parabolă
+    k = 0
+    bounds[0] = -math.inf
+    bounds[1] = math.inf
+    for q in range(1, n):
+        while True:
+            v = vertices[k]
+            s = ((f[q] + q * q) - (f[v] + v * v)) / (2 * q - 2 * v)
+            if s > bounds[k]:
+                break
+            k -= 1
+        k += 1
+        vertices[k] = q
+        bounds[k] = s
+        bounds[k + 1] = math.inf
+    result = [0.0] * n
+    k = 0
+    for x in range(n):
+        while bounds[k + 1] < x:
+            k += 1
+        v = vertices[k]
+        result[x] = (x - v) * (x - v) + f[v]
+    return result
+
+
+def distance_transform(occupied):
+    """
+    Distanța euclidiană exactă (în tile-uri) de la fiecare tile la cel mai apropiat tile ocupat
+
+    Transformare separabilă, liniară în numărul de tile-uri: întâi distanța
+    verticală pe fiecare coloană (două parcurgeri vectorizate pe rânduri), apoi
+    pe fiecare rând d²(x, y) = min după x' din (x - x')² + vertical(x', y)²,
+    calculată cu anvelopa inferioară (_lower_envelope), fără temporare O(w²).
+    """
+    h, w = occupied.shape
+    far = float(h + w)  # Mai mare decât orice distanță reală (harta fără ziduri)
+    vertical = np.where(occupied, 0.0, far)
+    for y in range(1, h):
+        np.minimum(vertical[y], vertical[y - 1] + 1, out=vertical[y])
+    for y in range(h - 2, -1, -1):
+        np.minimum(vertical[y], vertical[y + 1] + 1, out=vertical[y])
+    squared = vertical ** 2
+    result = np.empty((h, w))
+    for y in range(h):
+        result[y] = _lower_envelope(squared[y].tolist())
+    return np.sqrt(result)
+
+
+def clearance_gradient(occupied):
+    """
+    Distanța până la cel mai apropiat tile ocupat și gradientul ei
+
+    Returns:
+        (clearance, grad_x, grad_y) - matrici de aceeași formă ca occupied
+    """
+    clearance = distance_transform(occupied)
+    grad_y, grad_x = np.gradient(clearance)
+    return clearance, grad_x, grad_y
+
+
+def occupancy_from_obstacles(obstacles, width=MAP_WIDTH, height=MAP_HEIGHT, tile_size=TILE_SIZE):
+    """Bitmap-ul de ocupare (height, width) al tile-urilor acoperite de obstacolele vii dintr-o listă"""
+    occupied = np.zeros((height, width), dtype=bool)
+    for obstacle in obstacles:
+        if not obstacle.alive:
+            continue
+        rect = obstacle.rect
+        x1, y1 = max(rect.x // tile_size, 0), max(rect.y // tile_size, 0)
+        x2 = (rect.x + rect.width - 1) // tile_size
+        y2 = (rect.y + rect.height - 1) // tile_size
+        occupied[y1:y2 + 1, x1:x2 + 1] = True
+    return occupied
+
+
+def resolve_circle(occupied, tile_size, x, y, radius):
+    """
+    Scoate un cerc (agentul) din tile-urile ocupate pe care le atinge
+    
+    Se verifică doar cele cel mult 9 tile-uri din jurul centrului (raza este
+    sub jumătate de tile): întâi tile-ul centrului, apoi cele 4 vecine pe
+    laturi, apoi cele 4 diagonale. După împingerile pe laturi, colțurile unui
+    perete drept nu mai ating cercul, deci alunecarea de-a lungul peretelui nu
+    este deviată de muchiile interne dintre tile-uri.
+    
+    Args:
+        occupied: Bitmap-ul de ocupare (height, width)
+        tile_size: Latura unui tile (pixeli)
+        x, y: Centrul cercului (pixeli)
+        radius: Raza cercului (pixeli)
+    
+    Returns:
+        (x, y, normals) - poziția corectată și normalele de contact (vectori unitari
+        orientați dinspre zid spre cerc), în ordinea rezolvării
+    """
+    ts = tile_size
+    height, width = occupied.shape
+    ctx, cty = int(x // ts), int(y // ts)
+    normals = []
+    for ox, oy in RESOLVE_ORDER:
+        tx, ty = ctx + ox, cty + oy
+        if not (0 <= tx < width and 0 <= ty < height) or not occupied.item(ty, tx):
+            continue
+        left, top = tx * ts, ty * ts
+        # Cel mai apropiat punct al tile-ului de centrul cercului
+        dx = x - min(max(x, left), left + ts)
+        dy = y - min(max(y, top), top + ts)
+        dist_sq = dx * dx + dy * dy
+        if dist_sq >= radius * radius:
+            continue
+        if dist_sq > 0:
+            dist = math.sqrt(dist_sq)
+            nx, ny = dx / dist, dy / dist
+            depth = radius - dist
+        else:
+            # Centrul este în interiorul tile-ului: iese pe latura cea mai apropiată
+            depth, nx, ny = min((x - left, -1, 0), (left + ts - x, 1, 0),
+                                (y - top, 0, -1), (top + ts - y, 0, 1))
+            depth += radius
+        x += nx * depth
+        y += ny * depth
+        normals.append((nx, ny))
+    return x, y, normals
+
+
+def escape_direction(clearance, tile_size, x, y):
+    """
+    Direcția în care distanța până la ziduri crește cel mai repede, în punctul (x, y)
+    
+    Args:
+        clearance: (clearance, grad_x, grad_y), ca în clearance_gradient
+        tile_size: Latura unui tile (pixeli)
+        x, y: Punctul (pixeli)
+    
+    Returns:
+        (ux, uy) - vector unitar, sau None dacă gradientul este nul (ex. la mijlocul
+        unui coridor, unde ambele direcții sunt la fel de bune)
+    """
+    _, grad_x, grad_y = clearance
+    height, width = grad_x.shape
+    tx = min(max(int(x // tile_size), 0), width - 1)
+    ty = min(max(int(y // tile_size), 0), height - 1)
+    gx = grad_x.item(ty, tx)
+    gy = grad_y.item(ty, tx)
+    length = math.hypot(gx, gy)
+    if length < 1e-6:
+        return None
+    return gx / length, gy / length
+
 
 class Wall:
     """Reprezintă un zid distructibil"""
-    def __init__(self, x, y, tile_size, is_border=False):
+    def __init__(self, x, y, tile_size, is_border=False, game_map=None):
         self.rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
         self.health = WALL_HEALTH if not is_border else 9999  # Zidurile de margine sunt indestructibile
         self.max_health = self.health
@@ -12,6 +187,7 @@ class Wall:
         self.is_border = is_border
         self.x = x
         self.y = y
+        self.game_map = game_map  # Harta notificată când zidul este distrus
     
     def take_damage(self, damage):
         """Primește damage"""
@@ -21,37 +197,41 @@ class Wall:
         self.health -= damage
         if self.health <= 0:
             self.health = 0
-            self.alive = False
+            if self.alive:
+                self.alive = False
+                # Sincronizează harta (bitmap-ul de ocupare)
+                if self.game_map is not None:
+                    self.game_map.on_wall_destroyed(self)
+        # Culoarea s-a schimbat: tile-ul trebuie redesenat în fundalul hărții
+        if self.game_map is not None:
+            self.game_map.dirty_tiles.add((self.x, self.y))
+    
+    def color(self):
+        """Culoarea zidului, bazată pe health"""
+        if self.is_border:
+            return (50, 50, 50)  # Foarte închis pentru margini
+        health_percent = self.health / self.max_health
+        color_value = int(80 + (155 - 80) * (1 - health_percent))
+        return (color_value, color_value, color_value)
     
     def draw(self, screen, camera_x=0, camera_y=0):
         """Desenează zidul"""
         if not self.alive:
             return
         
-        rect = pygame.Rect(
-            self.rect.x - camera_x,
-            self.rect.y - camera_y,
-            self.rect.width,
-            self.rect.height
-        )
-        
-        # Culoare bazată pe health
-        if self.is_border:
-            color = (50, 50, 50)  # Foarte închis pentru margini
-        else:
-            health_percent = self.health / self.max_health
-            color_value = int(80 + (155 - 80) * (1 - health_percent))
-            color = (color_value, color_value, color_value)
-        
-        pygame.draw.rect(screen, color, rect)
+        rect = self.rect.move(-camera_x, -camera_y)
+        pygame.draw.rect(screen, self.color(), rect)
         pygame.draw.rect(screen, (40, 40, 40), rect, 2)
 
 class GameMap:
-    def __init__(self, game_mode="Survival"):
+    def __init__(self, game_mode="Survival", rng=None, next_hops=False):
         self.width = MAP_WIDTH
         self.height = MAP_HEIGHT
         self.tile_size = TILE_SIZE
         self.game_mode = game_mode
+        self.rng = resolve_rng(rng)  # Generatorul meciului (implicit modulul random)
+        # Precalculează tabelul de drumuri minime între toate tile-urile (doar pe hărți mici)
+        self.use_next_hops = next_hops and self.width * self.height <= NEXT_HOP_MAX_CELLS
         
         # 0 = gol, 1 = obstacol
         self.tiles = [[0 for _ in range(self.width)] for _ in range(self.height)]
@@ -100,8 +280,8 @@ class GameMap:
         
         while num_obstacles > 0 and attempts < max_attempts:
             attempts += 1
-            x = random.randint(2, self.width - 3)
-            y = random.randint(2, self.height - 3)
+            x = self.rng.randint(2, self.width - 3)
+            y = self.rng.randint(2, self.height - 3)
             
             # Verifică dacă e în zona de spawn
             in_spawn_zone = False
@@ -119,7 +299,7 @@ class GameMap:
                 continue  # Nu plasează obstacole în zona centrală
             
             # Creează grupuri de obstacole (redus dimensiunea maximă)
-            size = random.randint(1, 2)  # Redus de la 3 la 2 (maxim 2x2)
+            size = self.rng.randint(1, 2)  # Redus de la 3 la 2 (maxim 2x2)
             can_place = True
             
             # Verifică dacă poate plasa grupul întreg
@@ -185,8 +365,8 @@ class GameMap:
         
         while num_obstacles > 0 and attempts < max_attempts:
             attempts += 1
-            x = random.randint(2, self.width - 3)
-            y = random.randint(2, self.height - 3)
+            x = self.rng.randint(2, self.width - 3)
+            y = self.rng.randint(2, self.height - 3)
             
             # Verifică dacă e în zonele KOTH
             in_koth_zone = False
@@ -199,7 +379,7 @@ class GameMap:
                 continue
             
             # Plasează un obstacol mai mic (1-2 tile-uri)
-            size = random.randint(1, 2)
+            size = self.rng.randint(1, 2)
             can_place = True
             
             for dx in range(size):
@@ -256,8 +436,8 @@ class GameMap:
         
         while num_obstacles > 0 and attempts < max_attempts:
             attempts += 1
-            x = random.randint(self.width // 3, 2 * self.width // 3)  # Doar în zona centrală
-            y = random.randint(self.height // 3, 2 * self.height // 3)
+            x = self.rng.randint(self.width // 3, 2 * self.width // 3)  # Doar în zona centrală
+            y = self.rng.randint(self.height // 3, 2 * self.height // 3)
             
             # Verifică dacă e în zonele CTF
             in_ctf_zone = False
@@ -289,14 +469,160 @@ class GameMap:
     def create_obstacle_walls(self):
         """Creează obiecte Wall pentru coliziuni și damage"""
         self.obstacles = []
+        # Indexul în self.obstacles al zidului de pe fiecare tile (-1 = fără zid)
+        self.wall_index = np.full((self.height, self.width), -1, dtype=np.int32)
+        # Tile-uri ocupate de ziduri vii (actualizat imediat ce un zid este distrus)
+        self.occupancy = np.zeros((self.height, self.width), dtype=bool)
         for y in range(self.height):
             for x in range(self.width):
                 if self.tiles[y][x] == 1:
                     # Verifică dacă e zid de margine
                     is_border = (x == 0 or x == self.width - 1 or 
                                 y == 0 or y == self.height - 1)
-                    wall = Wall(x, y, self.tile_size, is_border)
+                    wall = Wall(x, y, self.tile_size, is_border, game_map=self)
+                    self.wall_index[y, x] = len(self.obstacles)
                     self.obstacles.append(wall)
+                    self.occupancy[y, x] = True
+        # Graful de navigare pentru pathfinding (reconstruit doar când se distruge un zid)
+        self.nav_grid = NavGrid(game_map=self)
+        # Câmpuri de flux către destinațiile comune (invalidate de versiunea grafului)
+        self.flow_fields = FlowFieldCache(self.nav_grid)
+        # Următorul tile pe drumul minim între oricare două tile-uri (opțional)
+        self.next_hops = NextHopTable(self.nav_grid) if self.use_next_hops else None
+        # Graf abstract pe clustere pentru drumuri lungi (doar pe hărți mari)
+        self.hpa = HierarchicalPlanner(self.nav_grid) if self.width * self.height >= HPA_MIN_CELLS else None
+        # Distanța până la cel mai apropiat zid și gradientul ei (recalculate leneș)
+        self._clearance = None
+        # Fundalul pre-randat (iarbă + ziduri) și tile-urile de redesenat în el
+        self._background = None
+        self.dirty_tiles = set()
+    
+    def on_wall_destroyed(self, wall):
+        """Apelat de Wall.take_damage când zidul este distrus"""
+        self.occupancy[wall.y, wall.x] = False
+        self.nav_grid.invalidate()
+        self._clearance = None
+    
+    def clearance_field(self):
+        """
+        Câmpul de distanță până la ziduri, recalculat doar după distrugerea unui zid
+        
+        Returns:
+            (clearance, grad_x, grad_y) - matrici (height, width): distanța în tile-uri
+            de la fiecare tile la cel mai apropiat zid viu și gradientul ei
+        """
+        if self._clearance is None:
+            self._clearance = clearance_gradient(self.occupancy)
+        return self._clearance
+    
+    def clearance_at(self, x, y):
+        """Distanța (în tile-uri) de la tile-ul punctului (x, y) la cel mai apropiat zid"""
+        clearance = self.clearance_field()[0]
+        tx = min(max(int(x // self.tile_size), 0), self.width - 1)
+        ty = min(max(int(y // self.tile_size), 0), self.height - 1)
+        return clearance.item(ty, tx)
+    
+    def escape_direction(self, x, y):
+        """Direcția de ieșire dintre ziduri în punctul (x, y) (vezi escape_direction)"""
+        return escape_direction(self.clearance_field(), self.tile_size, x, y)
+    
+    def is_area_blocked(self, left, top, width, height):
+        """
+        Verifică dacă un dreptunghi se suprapune cu un zid viu
+        
+        Echivalent cu colliderect între pygame.Rect(left, top, width, height) și
+        fiecare zid, dar citește doar tile-urile acoperite de dreptunghi.
+        
+        Returns:
+            True dacă dreptunghiul atinge un zid, False altfel
+        """
+        # Trunchiere la întregi, ca pygame.Rect
+        left = int(left)
+        top = int(top)
+        ts = self.tile_size
+        tx0 = max(left // ts, 0)
+        tx1 = min((left + width - 1) // ts, self.width - 1)
+        ty0 = max(top // ts, 0)
+        ty1 = min((top + height - 1) // ts, self.height - 1)
+        occupancy = self.occupancy
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                if occupancy.item(ty, tx):
+                    return True
+        return False
+    
+    def raycast(self, x0, y0, x1, y1):
+        """
+        Parcurge exact tile-urile traversate de segmentul (x0, y0) -> (x1, y1)
+        (DDA / Amanatides-Woo) și se oprește la primul zid viu
+        
+        Returns:
+            (tx, ty) - tile-ul zidului care blochează segmentul, sau None dacă e liber
+        """
+        ts = self.tile_size
+        tx, ty = int(x0 // ts), int(y0 // ts)
+        end_tx, end_ty = int(x1 // ts), int(y1 // ts)
+        dx = x1 - x0
+        dy = y1 - y0
+        
+        # t (între 0 și 1 pe segment) la care se trece următoarea linie verticală / orizontală
+        if dx > 0:
+            step_x, t_max_x, t_delta_x = 1, ((tx + 1) * ts - x0) / dx, ts / dx
+        elif dx < 0:
+            step_x, t_max_x, t_delta_x = -1, (tx * ts - x0) / dx, -ts / dx
+        else:
+            step_x, t_max_x, t_delta_x = 0, math.inf, math.inf
+        if dy > 0:
+            step_y, t_max_y, t_delta_y = 1, ((ty + 1) * ts - y0) / dy, ts / dy
+        elif dy < 0:
+            step_y, t_max_y, t_delta_y = -1, (ty * ts - y0) / dy, -ts / dy
+        else:
+            step_y, t_max_y, t_delta_y = 0, math.inf, math.inf
+        
+        occupancy = self.occupancy
+        width, height = self.width, self.height
+        while True:
+            # Tile-urile din afara hărții nu conțin ziduri
+            if 0 <= tx < width and 0 <= ty < height and occupancy.item(ty, tx):
+                return (tx, ty)
+            if tx == end_tx and ty == end_ty:
+                return None
+            if t_max_x < t_max_y:
+                if t_max_x > 1:
+                    return None
+                tx += step_x
+                t_max_x += t_delta_x
+            else:
+                if t_max_y > 1:
+                    return None
+                ty += step_y
+                t_max_y += t_delta_y
+    
+    def resolve_circle(self, x, y, radius):
+        """Scoate un cerc din zidurile vii ale hărții (vezi resolve_circle)"""
+        return resolve_circle(self.occupancy, self.tile_size, x, y, radius)
+    
+    def segment_clear(self, x0, y0, x1, y1, half_size=0):
+        """
+        Verifică dacă un pătrat cu latura 2 * half_size (agentul) poate aluneca
+        în linie dreaptă de la (x0, y0) la (x1, y1) fără să atingă un zid
+        
+        Banda măturată de pătrat este delimitată de două raze paralele cu
+        segmentul; un zid (mai lat decât banda) care o atinge taie una dintre
+        cele trei raze (centru și margini).
+        """
+        dx = x1 - x0
+        dy = y1 - y0
+        length = math.hypot(dx, dy)
+        if length == 0 or half_size == 0:
+            return self.raycast(x0, y0, x1, y1) is None
+        ux, uy = dx / length, dy / length
+        # Semi-lățimea pătratului perpendicular pe direcția de mers
+        extent = half_size * (abs(ux) + abs(uy))
+        px, py = -uy * extent, ux * extent
+        return (self.raycast(x0, y0, x1, y1) is None and
+                self.raycast(x0 + px, y0 + py, x1 + px, y1 + py) is None and
+                self.raycast(x0 - px, y0 - py, x1 - px, y1 - py) is None)
     
     def update_obstacles(self):
         """Actualizează obstacole - elimină cele distruse din tiles"""
@@ -315,30 +641,23 @@ class GameMap:
         
         for attempt in range(max_attempts):
             if team_id == 0:  # Stânga sus
-                x = margin + random.randint(0, 2 * TILE_SIZE)
-                y = margin + random.randint(0, 2 * TILE_SIZE)
+                x = margin + self.rng.randint(0, 2 * TILE_SIZE)
+                y = margin + self.rng.randint(0, 2 * TILE_SIZE)
             elif team_id == 1:  # Dreapta jos
-                x = self.width * TILE_SIZE - margin - random.randint(0, 2 * TILE_SIZE)
-                y = self.height * TILE_SIZE - margin - random.randint(0, 2 * TILE_SIZE)
+                x = self.width * TILE_SIZE - margin - self.rng.randint(0, 2 * TILE_SIZE)
+                y = self.height * TILE_SIZE - margin - self.rng.randint(0, 2 * TILE_SIZE)
             elif team_id == 2:  # Dreapta sus
-                x = self.width * TILE_SIZE - margin - random.randint(0, 2 * TILE_SIZE)
-                y = margin + random.randint(0, 2 * TILE_SIZE)
+                x = self.width * TILE_SIZE - margin - self.rng.randint(0, 2 * TILE_SIZE)
+                y = margin + self.rng.randint(0, 2 * TILE_SIZE)
             else:  # Stânga jos
-                x = margin + random.randint(0, 2 * TILE_SIZE)
-                y = self.height * TILE_SIZE - margin - random.randint(0, 2 * TILE_SIZE)
+                x = margin + self.rng.randint(0, 2 * TILE_SIZE)
+                y = self.height * TILE_SIZE - margin - self.rng.randint(0, 2 * TILE_SIZE)
             
             # Verifică dacă poziția e liberă (fără obstacole)
             # Folosește un rect mai mare pentru a se asigura că e suficient spațiu
             margin = AGENT_SIZE + 5  # Spațiu suplimentar pentru a evita coliziunile
-            spawn_rect = pygame.Rect(x - margin, y - margin, 
-                                     margin * 2, margin * 2)
-            collision = False
-            
-            # Verifică coliziunea cu obstacolele
-            for obstacle in self.obstacles:
-                if obstacle.alive and spawn_rect.colliderect(obstacle.rect):
-                    collision = True
-                    break
+            # Verifică coliziunea cu obstacolele (doar tile-urile acoperite)
+            collision = self.is_area_blocked(x - margin, y - margin, margin * 2, margin * 2)
             
             # Verifică și dacă poziția e în interiorul hărții (nu pe margini)
             if (x < AGENT_SIZE or x > self.width * TILE_SIZE - AGENT_SIZE or
@@ -353,28 +672,22 @@ class GameMap:
         safe_margin = margin + AGENT_SIZE
         for attempt in range(20):
             if team_id == 0:  # Stânga sus
-                x = safe_margin + random.randint(0, 3 * TILE_SIZE)
-                y = safe_margin + random.randint(0, 3 * TILE_SIZE)
+                x = safe_margin + self.rng.randint(0, 3 * TILE_SIZE)
+                y = safe_margin + self.rng.randint(0, 3 * TILE_SIZE)
             elif team_id == 1:  # Dreapta jos
-                x = self.width * TILE_SIZE - safe_margin - random.randint(0, 3 * TILE_SIZE)
-                y = self.height * TILE_SIZE - safe_margin - random.randint(0, 3 * TILE_SIZE)
+                x = self.width * TILE_SIZE - safe_margin - self.rng.randint(0, 3 * TILE_SIZE)
+                y = self.height * TILE_SIZE - safe_margin - self.rng.randint(0, 3 * TILE_SIZE)
             elif team_id == 2:  # Dreapta sus
-                x = self.width * TILE_SIZE - safe_margin - random.randint(0, 3 * TILE_SIZE)
-                y = safe_margin + random.randint(0, 3 * TILE_SIZE)
+                x = self.width * TILE_SIZE - safe_margin - self.rng.randint(0, 3 * TILE_SIZE)
+                y = safe_margin + self.rng.randint(0, 3 * TILE_SIZE)
             else:  # Stânga jos
-                x = safe_margin + random.randint(0, 3 * TILE_SIZE)
-                y = self.height * TILE_SIZE - safe_margin - random.randint(0, 3 * TILE_SIZE)
+                x = safe_margin + self.rng.randint(0, 3 * TILE_SIZE)
+                y = self.height * TILE_SIZE - safe_margin - self.rng.randint(0, 3 * TILE_SIZE)
             
             # Verifică coliziunea
             margin_check = AGENT_SIZE + 5
-            spawn_rect = pygame.Rect(x - margin_check, y - margin_check, 
-                                     margin_check * 2, margin_check * 2)
-            collision = False
-            
-            for obstacle in self.obstacles:
-                if obstacle.alive and spawn_rect.colliderect(obstacle.rect):
-                    collision = True
-                    break
+            collision = self.is_area_blocked(x - margin_check, y - margin_check,
+                                             margin_check * 2, margin_check * 2)
             
             if not collision and (AGENT_SIZE <= x <= self.width * TILE_SIZE - AGENT_SIZE and
                                   AGENT_SIZE <= y <= self.height * TILE_SIZE - AGENT_SIZE):
@@ -390,11 +703,42 @@ class GameMap:
         else:
             return safe_margin, self.height * TILE_SIZE - safe_margin
     
-    def draw(self, screen, camera_x=0, camera_y=0):
-        """Desenează harta"""
-        # Fundal
-        screen.fill((34, 139, 34))  # Verde
+    def background(self):
+        """
+        Suprafața cu harta pre-randată (iarbă și ziduri), actualizată doar pe
+        tile-urile din dirty_tiles (ziduri avariate sau distruse)
+        """
+        if self._background is None:
+            size = (self.width * self.tile_size, self.height * self.tile_size)
+            self._background = pygame.Surface(size)
+            # Același format de pixeli ca ecranul, pentru blit rapid
+            if pygame.display.get_init() and pygame.display.get_surface() is not None:
+                self._background = self._background.convert()
+            self._background.fill(MAP_BACKGROUND_COLOR)
+            for obstacle in self.obstacles:
+                obstacle.draw(self._background)
         
-        # Desenează obstacole (ziduri)
-        for obstacle in self.obstacles:
-            obstacle.draw(screen, camera_x, camera_y)
\ No newline at end of file
+        # Zidurile își desenează conturul în interiorul tile-ului, deci un tile se
+        # poate redesena singur fără să atingă vecinii
+        for tx, ty in self.dirty_tiles:
+            self._background.fill(MAP_BACKGROUND_COLOR, (tx * self.tile_size, ty * self.tile_size,
+                                                         self.tile_size, self.tile_size))
+            index = self.wall_index[ty, tx]
+            if index >= 0:
+                self.obstacles[index].draw(self._background)
+        self.dirty_tiles.clear()
+        return self._background
+    
+    def draw(self, screen, camera_x=0, camera_y=0):
+        """Desenează harta (un singur blit al fundalului pre-randat)"""
+        area = screen.blit(self.background(), (-camera_x, -camera_y))
+        # Benzile de ecran neacoperite de hartă (ex. sub hartă)
+        width, height = screen.get_size()
+        if area.top > 0:
+            screen.fill(MAP_BACKGROUND_COLOR, (0, 0, width, area.top))
+        if area.bottom < height:
+            screen.fill(MAP_BACKGROUND_COLOR, (0, area.bottom, width, height - area.bottom))
+        if area.left > 0:
+            screen.fill(MAP_BACKGROUND_COLOR, (0, area.top, area.left, area.height))
+        if area.right < width:
+            screen.fill(MAP_BACKGROUND_COLOR, (area.right, area.top, width - area.right, area.height))
\ No newline at end of file
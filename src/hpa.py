@@ -0,0 +1,240 @@
+"""
+Căutare ierarhică de drum (HPA*) pentru hărți mari.
+
+Harta este împărțită în clustere de HPA_CLUSTER_SIZE x HPA_CLUSTER_SIZE tile-uri.
+Pe fiecare latură comună a două clustere, fiecare segment continuu de tile-uri
+libere de ambele părți devine o intrare: o pereche de noduri abstracte (câte unul
+în fiecare cluster) legate cu o muchie de cost 1. În interiorul unui cluster,
+nodurile abstracte sunt legate cu costul drumului minim care nu iese din cluster.
+
+O căutare conectează temporar start-ul și destinația la intrările clusterelor
+lor, rulează A* pe graful abstract (câteva sute de noduri în loc de zeci de mii
+de tile-uri) și întoarce traseul de noduri abstracte. Drumul pe tile-uri este
+rafinat leneș, segment cu segment, pe măsură ce agentul înaintează.
+
+Când un zid este distrus se recalculează doar intrările clusterelor care conțin
+tile-uri schimbate și costurile interne ale acestora și ale vecinilor lor.
+"""
+
+import heapq
+import numpy as np
+from pathfinding import astar, costs_from, octile_distance, SearchCounter
+
+HPA_CLUSTER_SIZE = 16  # Latura unui cluster (tile-uri)
+HPA_MIN_CELLS = 2500  # Harta trebuie să aibă cel puțin atâtea tile-uri pentru HPA*
+# Segmentele de intrare mai lungi decât atât primesc câte o intrare la fiecare capăt
+HPA_LONG_ENTRANCE = 6
+
+
+class HierarchicalPlanner:
+    """Graf abstract de intrări între clustere, peste un NavGrid"""
+
+    def __init__(self, nav, cluster_size=HPA_CLUSTER_SIZE):
+        """
+        Args:
+            nav: NavGrid-ul hărții
+            cluster_size: Latura unui cluster (tile-uri)
+        """
+        self.nav = nav
+        self.cluster_size = cluster_size
+        self.cluster_cols = -(-nav.width // cluster_size)
+        self.cluster_rows = -(-nav.height // cluster_size)
+
+        # Clusterul fiecărui nod și nodurile fiecărui cluster
+        tx = np.arange(nav.width) // cluster_size
+        ty = np.arange(nav.height) // cluster_size
+        cluster_grid = ty[:, None] * self.cluster_cols + tx[None, :]
+        self.cluster_of = cluster_grid.ravel().tolist()
+        self.cluster_nodes = [set() for _ in range(self.cluster_rows * self.cluster_cols)]
+        for node, cluster in enumerate(self.cluster_of):
+            self.cluster_nodes[cluster].add(node)
+
+        self.border_links = {}  # (cluster_a, cluster_b) -> [(nod_a, nod_b)]
+        self.links = {}  # nod abstract -> {nod din clusterul vecin: cost}
+        self.intra = [{} for _ in self.cluster_nodes]  # cluster -> {nod: {nod: cost}}
+        self.updated_clusters = 0  # Clustere recalculate la ultima sincronizare (pentru profilare)
+
+        for border in self._borders():
+            self._build_border(border)
+        self._rebuild_links()
+        for cluster in range(len(self.cluster_nodes)):
+            self._build_intra(cluster)
+        self.version = nav.version
+        self._blocked = nav.blocked.copy()
+
+    def _borders(self, clusters=None):
+        """Perechile (cluster, vecin din dreapta/de jos) care ating clusterele date (implicit toate)"""
+        cols, rows = self.cluster_cols, self.cluster_rows
+        borders = set()
+        for cluster in (clusters if clusters is not None else range(cols * rows)):
+            cy, cx = divmod(cluster, cols)
+            if cx + 1 < cols:
+                borders.add((cluster, cluster + 1))
+            if cy + 1 < rows:
+                borders.add((cluster, cluster + cols))
+            if cx > 0:
+                borders.add((cluster - 1, cluster))
+            if cy > 0:
+                borders.add((cluster - cols, cluster))
+        return sorted(borders)
+
+    def _build_border(self, border):
+        """Găsește intrările de pe latura comună a două clustere"""
+        nav = self.nav
+        size = self.cluster_size
+        a, b = border
+        ay, ax = divmod(a, self.cluster_cols)
+        if b == a + 1:
+            # Latură verticală: coloana din dreapta lui a și prima coloană a lui b
+            x = (ax + 1) * size - 1
+            pairs = [((x, y), (x + 1, y)) for y in range(ay * size, min((ay + 1) * size, nav.height))]
+        else:
+            y = (ay + 1) * size - 1
+            pairs = [((x, y), (x, y + 1)) for x in range(ax * size, min((ax + 1) * size, nav.width))]
+
+        # Segmente continue de perechi libere de ambele părți
+        runs, run = [], []
+        for inside, outside in pairs:
+            if nav.is_walkable(*inside) and nav.is_walkable(*outside):
+                run.append((nav.node(*inside), nav.node(*outside)))
+            elif run:
+                runs.append(run)
+                run = []
+        if run:
+            runs.append(run)
+
+        links = []
+        for run in runs:
+            if len(run) > HPA_LONG_ENTRANCE:
+                links.extend((run[0], run[-1]))
+            else:
+                links.append(run[len(run) // 2])
+        self.border_links[border] = links
+
+    def _rebuild_links(self):
+        """Muchiile dintre clustere (cost 1) din intrările tuturor laturilor"""
+        links = {}
+        for pairs in self.border_links.values():
+            for a, b in pairs:
+                links.setdefault(a, {})[b] = 1.0
+                links.setdefault(b, {})[a] = 1.0
+        self.links = links
+
+    def _entrances(self, cluster):
+        """Nodurile abstracte aflate în cluster"""
+        return [node for node in self.links if self.cluster_of[node] == cluster]
+
+    def _build_intra(self, cluster):
+        """Costurile drumurilor minime din interiorul clusterului între nodurile lui abstracte"""
+        within = self.cluster_nodes[cluster]
+        entrances = self._entrances(cluster)
+        intra = {}
+        for node in entrances:
+            costs = costs_from(self.nav, node, within)
+            intra[node] = {other: costs[other] for other in entrances if other != node and other in costs}
+        self.intra[cluster] = intra
+
+    def ensure_current(self):
+        """Actualizează doar clusterele atinse de tile-urile schimbate de la ultima sincronizare"""
+        if self.version == self.nav.version:
+            return
+        self.nav.adjacency()  # Reconstruiește graful de tile-uri dacă e nevoie
+        changed = np.argwhere(self.nav.blocked != self._blocked)
+        dirty = {self.cluster_of[self.nav.node(int(tx), int(ty))] for ty, tx in changed}
+        for border in self._borders(dirty):
+            self._build_border(border)
+        self._rebuild_links()
+        # Intrările clusterelor vecine se pot schimba și ele
+        affected = set(dirty)
+        for a, b in self._borders(dirty):
+            affected.update((a, b))
+        for cluster in affected:
+            self._build_intra(cluster)
+        self.updated_clusters = len(affected)
+        self.version = self.nav.version
+        self._blocked = self.nav.blocked.copy()
+
+    def find_route(self, start, goal):
+        """
+        Traseul abstract de la start la goal
+
+        Args:
+            start, goal: Tile-uri (tx, ty)
+
+        Returns:
+            Lista de tile-uri intermediare (intrări între clustere) terminată cu goal,
+            sau None dacă goal nu poate fi atins
+        """
+        self.ensure_current()
+        nav = self.nav
+        start_node, goal_node = nav.node(*start), nav.node(*goal)
+        start_cluster, goal_cluster = self.cluster_of[start_node], self.cluster_of[goal_node]
+
+        # Conectează temporar start-ul și destinația la intrările clusterelor lor
+        start_costs = costs_from(nav, start_node, self.cluster_nodes[start_cluster])
+        goal_costs = costs_from(nav, goal_node, self.cluster_nodes[goal_cluster])
+        if start_cluster == goal_cluster and goal_node in start_costs:
+            return [goal]
+
+        start_edges = {node: start_costs[node] for node in self._entrances(start_cluster) if node in start_costs}
+        goal_edges = {node: goal_costs[node] for node in self._entrances(goal_cluster) if node in goal_costs}
+
+        def h(node):
+            return octile_distance(nav.tile(node), goal)
+
+        # A* pe graful abstract; nodul start are muchiile lui către intrările clusterului
+        # (și, dacă este el însuși o intrare, și muchiile ei din graful abstract)
+        g = {start_node: 0.0}
+        came_from = {}
+        closed = set()
+        heap = [(h(start_node), 0, start_node)]
+        counter = 0
+        while heap:
+            _, _, current = heapq.heappop(heap)
+            if current in closed:
+                continue
+            closed.add(current)
+            if current == goal_node:
+                SearchCounter.expansions += len(closed)
+                route = []
+                while current in came_from:
+                    route.append(nav.tile(current))
+                    current = came_from[current]
+                route.reverse()
+                return route
+
+            edges = list(self.intra[self.cluster_of[current]].get(current, {}).items())
+            edges.extend(self.links.get(current, {}).items())
+            if current == start_node:
+                edges.extend(start_edges.items())
+            if current in goal_edges:
+                edges.append((goal_node, goal_edges[current]))
+            for neighbor, cost in edges:
+                if neighbor in closed:
+                    continue
+                tentative = g[current] + cost
+                if tentative < g.get(neighbor, float('inf')):
+                    g[neighbor] = tentative
+                    came_from[neighbor] = current
+                    counter += 1
+                    heapq.heappush(heap, (tentative + h(neighbor), counter, neighbor))
+        SearchCounter.expansions += len(closed)
+        return None
+
+    def refine(self, start, waypoint):
+        """
+        Drumul pe tile-uri de la start până la următorul nod din traseu
+
+        Căutarea este limitată la clusterele celor două capete; dacă agentul a
+        ieșit între timp din zonă, se caută pe toată harta.
+
+        Returns:
+            (path, reached) ca la astar
+        """
+        nav = self.nav
+        clusters = {self.cluster_of[nav.node(*start)], self.cluster_of[nav.node(*waypoint)]}
+        within = set().union(*(self.cluster_nodes[c] for c in clusters))
+        path, reached = astar(nav, start, waypoint, max_expansions=len(within), within=within)
+        if not reached:
+            path, reached = astar(nav, start, waypoint, max_expansions=nav.width * nav.height)
+        return path, reached
@@ -1,23 +1,27 @@
 import pygame
-import random
 from config import *
+from sim_clock import resolve_clock
+from text_cache import resolve_text_cache
 
 
 class KingOfTheHillMode:
-    def __init__(self, agents, game_map, statistics_tracker=None):
+    def __init__(self, agents, game_map, statistics_tracker=None, clock=None, grid=None, text_cache=None):
         self.agents = agents
         self.game_map = game_map
         self.statistics_tracker = statistics_tracker
+        self.clock = resolve_clock(clock)  # Sursa de timp (SimClock sau timp real)
+        self.text_cache = resolve_text_cache(text_cache)  # Fonturi și texte randate
+        self.grid = grid  # SpatialGrid al agenților (None = parcurgere liniară)
         self.time_limit = KOTH_TIME_LIMIT
         self.time_to_win = KOTH_TIME_TO_WIN
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.clock.get_ticks()
         self.end_time = None  # Timpul când jocul s-a terminat
         self.game_over = False
         self.winner = None
        
         # Timp acumulat în zonă pentru fiecare echipă (în secunde)
         self.team_zone_time = {0: 0.0, 1: 0.0}
-        self.last_update_time = pygame.time.get_ticks()
+        self.last_update_time = self.clock.get_ticks()
        
         # O SINGURĂ ZONĂ CENTRALĂ pe care se luptă ambele echipe
         center_x = (MAP_WIDTH * TILE_SIZE) / 2
@@ -44,7 +48,7 @@ class KingOfTheHillMode:
         if self.game_over:
             return
        
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
        
         # Verifică timpul
         elapsed_time = (current_time - self.start_time) / 1000
@@ -85,7 +89,14 @@ class KingOfTheHillMode:
         # Verifică câți agenți din fiecare echipă sunt în zona centrală
         agents_in_zone = {0: 0, 1: 0}
        
-        for agent in self.agents:
+        if self.grid is not None:
+            # Reindexează după respawn-uri și citește doar agenții din celulele zonei
+            self.grid.refresh()
+            agents = [self.grid.items[slot] for slot in self.grid.query_rect(self.central_zone)]
+        else:
+            agents = self.agents
+       
+        for agent in agents:
             if not agent.alive:
                 continue
            
@@ -114,7 +125,8 @@ class KingOfTheHillMode:
                     agent.y = spawn_y
                     agent.health = AGENT_MAX_HEALTH
                     agent.alive = True
-                    agent.path = []
+                    agent.path.clear()
+                    agent.route.clear()
                     agent.target = None
                     agent.velocity_x = 0
                     agent.velocity_y = 0
@@ -129,7 +141,7 @@ class KingOfTheHillMode:
    
     def on_agent_death(self, agent):
         """Apelat când un agent moare"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
        
         # Verifică dacă agentul nu e deja în coadă (evită duplicate)
         already_in_queue = any(a == agent for a, _ in self.respawn_queue)
@@ -148,7 +160,7 @@ class KingOfTheHillMode:
         self.game_over = True
         # Salvează momentul când jocul s-a terminat pentru timer
         if self.end_time is None:
-            self.end_time = pygame.time.get_ticks()
+            self.end_time = self.clock.get_ticks()
         # Îngheață statisticile DPS
         if self.statistics_tracker:
             self.statistics_tracker.freeze_dps()
@@ -159,16 +171,14 @@ class KingOfTheHillMode:
         if self.game_over and self.end_time is not None:
             elapsed = (self.end_time - self.start_time) / 1000
         else:
-            elapsed = (pygame.time.get_ticks() - self.start_time) / 1000
+            elapsed = (self.clock.get_ticks() - self.start_time) / 1000
         return max(0, self.time_limit - elapsed)
    
     def draw_ui(self, screen):
         """Desenează UI-ul modului King of the Hill"""
-        font = pygame.font.Font(None, 36)
-        small_font = pygame.font.Font(None, 24)
        
         # Timp rămas
-        time_text = font.render(f"Time: {int(self.get_remaining_time())}s", True, (255, 255, 255))
+        time_text = self.text_cache.render(36, f"Time: {int(self.get_remaining_time())}s", (255, 255, 255))
         screen.blit(time_text, (SCREEN_WIDTH // 2 - 60, 10))
        
         # Timp în zonă pentru fiecare echipă
@@ -176,7 +186,7 @@ class KingOfTheHillMode:
         for team_id in [0, 1]:
             zone_time = self.team_zone_time[team_id]
             time_str = f"{zone_time:.1f}s"
-            text = font.render(f"Team {team_id + 1}: {time_str}/{self.time_to_win}s", True, TEAM_COLORS[team_id])
+            text = self.text_cache.render(36, f"Team {team_id + 1}: {time_str}/{self.time_to_win}s", TEAM_COLORS[team_id])
             x_pos = 10 if team_id == 0 else SCREEN_WIDTH - 250
             screen.blit(text, (x_pos, y_offset))
        
@@ -191,7 +201,7 @@ class KingOfTheHillMode:
        
         for team_id in [0, 1]:
             count = teams_alive.get(team_id, 0)
-            text = small_font.render(f"Alive: {count}", True, TEAM_COLORS[team_id])
+            text = self.text_cache.render(24, f"Alive: {count}", TEAM_COLORS[team_id])
             x_pos = 10 if team_id == 0 else SCREEN_WIDTH - 150
             screen.blit(text, (x_pos, y_offset))
        
@@ -222,55 +232,53 @@ class KingOfTheHillMode:
         pygame.draw.rect(screen, (255, 255, 0), self.central_zone, 3)
        
         # Text în zonă
-        zone_font = pygame.font.Font(None, 24)
-        zone_text = zone_font.render("CENTRAL ZONE", True, (255, 255, 255))
+        zone_text = self.text_cache.render(24, "CENTRAL ZONE", (255, 255, 255))
         text_rect = zone_text.get_rect(center=(self.central_zone.centerx, self.central_zone.centery))
         screen.blit(zone_text, text_rect)
        
         # Afișează DPS
         if self.statistics_tracker:
             y_offset = 130
-            small_font = pygame.font.Font(None, 20)
            
             for team_id in [0, 1]:
                 dps_in = self.statistics_tracker.get_koth_dps(team_id, in_zone=True)
                 dps_out = self.statistics_tracker.get_koth_dps(team_id, in_zone=False)
                
-                text = small_font.render(f"DPS in zone: {dps_in:.1f}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"DPS in zone: {dps_in:.1f}", TEAM_COLORS[team_id])
                 x_pos = 10 if team_id == 0 else SCREEN_WIDTH - 200
                 screen.blit(text, (x_pos, y_offset))
                
-                text = small_font.render(f"DPS out zone: {dps_out:.1f}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"DPS out zone: {dps_out:.1f}", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 20))
                
                 # Statistici suplimentare
                 avg_time_alive = self.statistics_tracker.get_team_avg_time_alive(team_id)
-                text = small_font.render(f"Avg time alive: {avg_time_alive:.1f}s", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Avg time alive: {avg_time_alive:.1f}s", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 40))
                
                 avg_distance = self.statistics_tracker.get_team_avg_distance(team_id)
-                text = small_font.render(f"Avg distance: {avg_distance:.0f}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Avg distance: {avg_distance:.0f}", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 60))
                
                 #kills, deaths, assists = self.statistics_tracker.get_team_kda(team_id)
-                #text = small_font.render(f"K/D/A: {kills}/{deaths}/{assists}", True, TEAM_COLORS[team_id])
+                #text = self.text_cache.render(20, f"K/D/A: {kills}/{deaths}/{assists}", TEAM_COLORS[team_id])
                 #screen.blit(text, (x_pos, y_offset + 80))
                
                 # Total bullets fired
                 total_shots = self.statistics_tracker.get_team_total_shots(team_id)
-                text = small_font.render(f"Bullets fired: {total_shots}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Bullets fired: {total_shots}", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 100))
        
         # Mesaj de victorie
         if self.game_over:
-            game_over_text = font.render("GAME OVER!", True, (255, 255, 0))
+            game_over_text = self.text_cache.render(36, "GAME OVER!", (255, 255, 0))
             screen.blit(game_over_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 50))
            
             if self.winner is not None:
-                winner_text = font.render(f"Team {self.winner + 1} Wins!", True, TEAM_COLORS[self.winner])
+                winner_text = self.text_cache.render(36, f"Team {self.winner + 1} Wins!", TEAM_COLORS[self.winner])
                 screen.blit(winner_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2))
             else:
-                draw_text = font.render("Draw!", True, (255, 255, 255))
+                draw_text = self.text_cache.render(36, "Draw!", (255, 255, 255))
                 screen.blit(draw_text, (SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT // 2))
 
 
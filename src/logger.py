@@ -72,6 +72,12 @@ class GameLogger:
         """Log a debug message."""
         self._logger.debug(message)
     
+    def set_level(self, level):
+        """Set the minimum level for the logger and all its handlers."""
+        self._logger.setLevel(level)
+        for handler in self._logger.handlers:
+            handler.setLevel(level)
+    
     def game_event(self, event_type, details):
         """Log a game event with structured information."""
         self._logger.info(f"[{event_type}] {details}")
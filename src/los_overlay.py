@@ -0,0 +1,87 @@
+"""
+Strat comun pentru conurile de vedere (LoS) ale agenților.
+
+În loc ca fiecare agent să aloce o suprafață RGBA cât ecranul și să o
+compună integral peste ecran doar pentru un triunghi semi-transparent, toate
+conurile unui frame sunt desenate pe aceeași suprafață, alocată o singură
+dată. La începutul frame-ului se șterg doar dreptunghiurile conurilor din
+frame-ul anterior, iar la final se compun pe ecran doar dreptunghiurile
+conurilor curente (cele care se suprapun, unite într-un singur blit).
+"""
+
+import math
+import pygame
+from config import *
+
+# Opacitatea conurilor (0-255)
+LOS_ALPHA = 50
+
+
+def los_cone(x, y, facing_angle, camera_x=0, camera_y=0):
+    """
+    Vârfurile conului de vedere, în coordonate de ecran
+
+    Returns:
+        [centru, capăt stânga, capăt dreapta]
+    """
+    half_angle = math.radians(AGENT_LOS_ANGLE / 2)
+    angle1 = facing_angle - half_angle
+    angle2 = facing_angle + half_angle
+    return [
+        (int(x - camera_x), int(y - camera_y)),
+        (int(x + math.cos(angle1) * AGENT_LOS_RANGE - camera_x),
+         int(y + math.sin(angle1) * AGENT_LOS_RANGE - camera_y)),
+        (int(x + math.cos(angle2) * AGENT_LOS_RANGE - camera_x),
+         int(y + math.sin(angle2) * AGENT_LOS_RANGE - camera_y)),
+    ]
+
+
+class LosOverlay:
+    """Suprafață RGBA refolosită de la un frame la altul pentru conurile LoS"""
+
+    def __init__(self):
+        self.surface = None
+        self._rects = []  # Dreptunghiurile desenate în frame-ul curent (șterse la următorul)
+
+    def begin(self, screen):
+        """Pregătește stratul pentru un frame nou (șterge doar conurile vechi)"""
+        size = screen.get_size()
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            for rect in self._merged_rects():
+                self.surface.fill((0, 0, 0, 0), rect)
+        self._rects = []
+
+    def add_cone(self, points, color):
+        """
+        Desenează un con pe strat
+
+        Args:
+            points: Vârfurile conului (vezi los_cone)
+            color: Culoarea agentului (RGB); opacitatea este LOS_ALPHA
+        """
+        rect = pygame.draw.polygon(self.surface, (*color, LOS_ALPHA), points)
+        if rect.width and rect.height:
+            self._rects.append(rect)
+
+    def draw(self, screen):
+        """Compune conurile frame-ului pe ecran"""
+        for area in self._merged_rects():
+            screen.blit(self.surface, area, area)
+
+    def _merged_rects(self):
+        """
+        Dreptunghiurile conurilor, cu cele care se suprapun unite într-unul singur
+        (un pixel compus de două ori peste ecran ar fi mai opac, iar zonele comune
+        ar fi șterse de mai multe ori)
+        """
+        merged = []
+        for rect in self._rects:
+            rect = rect.copy()
+            index = rect.collidelist(merged)
+            while index >= 0:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
@@ -1,6 +1,5 @@
 import pygame
 import sys
-import random
 from config import *
 from game_map import GameMap
 from agent import Agent
@@ -8,38 +7,78 @@ from survival_mode import SurvivalMode
 from koth_mode import KingOfTheHillMode
 from ctf_mode import CaptureTheFlagMode
 from menu import Menu
-from projectile import Projectile
+from projectile_pool import ProjectilePool
 from communication import MessageBus
 from statistics import StatisticsTracker
 from logger import logger
+from sim_clock import SimClock, FixedStepLoop
+from match_rng import MatchRng
+from agent_store import AgentStore
+from spatial_grid import SpatialGrid
+from visibility import VisibilitySystem
+from path_scheduler import PathScheduler
+from reservation import ReservationTable
+from los_overlay import LosOverlay
+from text_cache import resolve_text_cache
 
 
 
 
 class Game:
-    def __init__(self, game_mode="Survival"):
+    def __init__(self, game_mode="Survival", headless=False, seed=None, next_hops=NEXT_HOP_TABLE):
+        """
+        Args:
+            game_mode: Modul de joc
+            headless: Fără fereastră (meciuri batch)
+            seed: Sămânța meciului (None = aleatoare)
+            next_hops: Precalculează tabelul de drumuri minime al hărții (NextHopTable)
+        """
         pygame.init()
         logger.info(f"Initializing game - Mode: {game_mode}")
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(f"Synapse Strike - {game_mode} Mode")
+        # În modul headless (batch) nu se creează fereastră - se apelează doar update()
+        self.headless = headless
+        if headless:
+            self.screen = None
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption(f"Synapse Strike - {game_mode} Mode")
         self.clock = pygame.time.Clock()
         self.running = True
         self.game_mode_name = game_mode
+        # Ceasul simulării - avansează cu un pas fix la fiecare update()
+        self.sim_clock = SimClock()
+        # Generatorul aleator al meciului - aceeași sămânță reproduce același meci
+        self.rng = MatchRng(seed)
+        self.seed = self.rng.match_seed
+        logger.info(f"Match seed: {self.seed}")
         # Team communication modes: randomly assign "FULL", "LIMITED", or "NONE" for each team
         communication_types = ["FULL", "LIMITED", "NONE"]
         self.team_communication_modes = {}
         for team_id in range(2):  # Assuming 2 teams
-            mode = random.choice(communication_types)
+            mode = self.rng.choice(communication_types)
             self.team_communication_modes[team_id] = mode
             logger.info(f"Team {team_id} has communication {mode}")
         # Bus de mesaje pentru comunicare între agenți
-        self.message_bus = MessageBus()
+        self.message_bus = MessageBus(clock=self.sim_clock)
        
         # Creează harta (cu parametri specifici pentru game mode)
-        self.game_map = GameMap(game_mode)
+        self.next_hops = next_hops
+        self.game_map = GameMap(game_mode, rng=self.rng, next_hops=next_hops)
         logger.info(f"Game map created for {game_mode} mode")
        
         # Creează agenții bazat pe modul de joc
+        # Starea agenților stă în array-uri NumPy comune (AgentStore), indexate după slot
+        self.agent_store = AgentStore()
+        # Index spațial al agenților, reconstruit la fiecare tick (slack = deplasarea maximă într-un tick)
+        self.spatial_grid = SpatialGrid(slack=AGENT_SPEED * 4)
+        # Matricea de vizibilitate (cine pe cine vede), recalculată la fiecare tick
+        self.visibility = VisibilitySystem(self.game_map)
+        # Cererile de pathfinding ale agenților, servite cu buget per tick
+        self.path_scheduler = PathScheduler()
+        # Rezervările spațiu-timp ale fiecărei echipe (WHCA*), în modurile cu destinații comune
+        self.team_reservations = {}
+        if COOPERATIVE_PATHS and game_mode in ["King of the Hill", "Capture the Flag"]:
+            self.team_reservations = {team_id: ReservationTable() for team_id in range(2)}
         self.agents = []
        
         if game_mode == "King of the Hill":
@@ -51,8 +90,8 @@ class Game:
                     x, y = self.game_map.get_spawn_position(team_id, num_teams)
                    
                     # Alocă roluri: unii atacatori, alții apărători (random)
-                    role = ROLE_ATTACKER #if random.random() < 0.5 else ROLE_DEFENDER
-                    agent = Agent(x, y, team_id, role)
+                    role = ROLE_ATTACKER #if self.rng.random() < 0.5 else ROLE_DEFENDER
+                    agent = Agent(x, y, team_id, role, clock=self.sim_clock, rng=self.rng, store=self.agent_store, grid=self.spatial_grid, game_map=self.game_map, visibility=self.visibility, path_scheduler=self.path_scheduler, reservations=self.team_reservations.get(team_id))
                     agent.agent_id = f"agent_{team_id}_{i}"
                     # Comunicarea se bazează pe modul echipei
                     agent.has_limited_communication = self.team_communication_modes[team_id] == "LIMITED"
@@ -67,7 +106,7 @@ class Game:
                 for i in range(agents_per_team):
                     x, y = self.game_map.get_spawn_position(team_id, num_teams)
                     # Toți agenții sunt atacatori
-                    agent = Agent(x, y, team_id, ROLE_ATTACKER)
+                    agent = Agent(x, y, team_id, ROLE_ATTACKER, clock=self.sim_clock, rng=self.rng, store=self.agent_store, grid=self.spatial_grid, game_map=self.game_map, visibility=self.visibility, path_scheduler=self.path_scheduler, reservations=self.team_reservations.get(team_id))
                     agent.agent_id = f"agent_{team_id}_{i}"
                     # Comunicarea se bazează pe modul echipei
                     agent.has_limited_communication = self.team_communication_modes[team_id] == "LIMITED"
@@ -83,7 +122,7 @@ class Game:
             for team_id in range(num_teams):
                 for i in range(agents_per_team):
                     x, y = self.game_map.get_spawn_position(team_id, num_teams)
-                    agent = Agent(x, y, team_id)
+                    agent = Agent(x, y, team_id, clock=self.sim_clock, rng=self.rng, store=self.agent_store, grid=self.spatial_grid, game_map=self.game_map, visibility=self.visibility, path_scheduler=self.path_scheduler, reservations=self.team_reservations.get(team_id))
                     agent.agent_id = f"agent_{team_id}_{i}"
                     # Comunicarea se bazează pe modul echipei
                     agent.has_limited_communication = self.team_communication_modes[team_id] == "LIMITED"
@@ -92,11 +131,15 @@ class Game:
                     self.agents.append(agent)
             logger.info(f"Created {num_teams} teams with {agents_per_team} agents each for Survival mode")
        
-        # Lista de proiectile
-        self.projectiles = []
+        # Pool-ul de proiectile (array-uri NumPy, actualizat vectorizat)
+        self.projectiles = ProjectilePool(self.agent_store, clock=self.sim_clock)
+        # Stratul comun pentru conurile de vedere (refolosit la fiecare frame)
+        self.los_overlay = LosOverlay()
+        # Fonturile și textele UI, comune cu meniul (încărcate o singură dată)
+        self.text_cache = resolve_text_cache()
        
         # Creează tracker-ul de statistici
-        self.statistics_tracker = StatisticsTracker()
+        self.statistics_tracker = StatisticsTracker(clock=self.sim_clock)
        
         # Inițializează statistici pentru agenți
         for agent in self.agents:
@@ -112,16 +155,16 @@ class Game:
 
         # Inițializează modul de joc ales
         if game_mode == "Survival":
-            self.game_mode = SurvivalMode(self.agents, self.statistics_tracker)
+            self.game_mode = SurvivalMode(self.agents, self.statistics_tracker, clock=self.sim_clock, text_cache=self.text_cache)
             logger.info("Survival mode initialized")
         elif game_mode == "King of the Hill":
-            self.game_mode = KingOfTheHillMode(self.agents, self.game_map, self.statistics_tracker)
+            self.game_mode = KingOfTheHillMode(self.agents, self.game_map, self.statistics_tracker, clock=self.sim_clock, grid=self.spatial_grid, text_cache=self.text_cache)
             logger.info("King of the Hill mode initialized")
             # Setează zona centrală ca țintă pentru toți agenții
             for agent in self.agents:
                 agent.target_zone = self.game_mode.central_zone
         elif game_mode == "Capture the Flag":
-            self.game_mode = CaptureTheFlagMode(self.agents, self.game_map, self.statistics_tracker, message_bus=self.message_bus)
+            self.game_mode = CaptureTheFlagMode(self.agents, self.game_map, self.statistics_tracker, message_bus=self.message_bus, clock=self.sim_clock, rng=self.rng, grid=self.spatial_grid, text_cache=self.text_cache)
             logger.info("Capture the Flag mode initialized")
             # Setează referințe pentru fiecare agent
             for agent in self.agents:
@@ -133,17 +176,21 @@ class Game:
                 agent.own_flag = self.game_mode.flags[agent.team_id]  # Steagul propriu (pentru apărare)
         else:
             # Default la Survival dacă nu recunoaște modul
-            self.game_mode = SurvivalMode(self.agents, self.statistics_tracker)
+            self.game_mode = SurvivalMode(self.agents, self.statistics_tracker, clock=self.sim_clock, text_cache=self.text_cache)
    
     def run(self):
         """Bucla principală a jocului"""
+        # Simularea avansează cu pas fix, după timpul real scurs; randarea este
+        # limitată la RENDER_FPS și interpolează între ultimele două stări
+        loop = FixedStepLoop()
         while self.running:
             result = self.handle_events()
             if result == "MENU":
                 return "MENU"
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            for _ in range(loop.advance(self.clock.tick(RENDER_FPS))):
+                self.agent_store.snapshot_positions()
+                self.update()
+            self.draw(loop.alpha)
        
         pygame.quit()
         return None
@@ -159,7 +206,7 @@ class Game:
                 elif event.key == pygame.K_r and self.game_mode.game_over:
                     # Reporni jocul cu același mod
                     logger.info(f"Restarting game in {self.game_mode_name} mode")
-                    self.__init__(self.game_mode_name)
+                    self.__init__(self.game_mode_name, self.headless, next_hops=self.next_hops)
                 elif event.key == pygame.K_m and self.game_mode.game_over:
                     # Înapoi la meniu
                     logger.info("Returning to menu")
@@ -170,7 +217,11 @@ class Game:
     def update(self):
         """Actualizează starea jocului"""
         if not self.game_mode.game_over:
-            current_time = pygame.time.get_ticks()
+            current_time = self.sim_clock.get_ticks()
+            # Reindexează agenții pe grilă pentru interogările de vecinătate din acest tick
+            self.spatial_grid.index_agents(self.agent_store)
+            # Vizibilitatea tuturor perechilor de agenți, calculată o singură dată pe tick
+            self.visibility.update(self.agent_store)
            
             # Actualizează agenții
             for agent in self.agents:
@@ -197,85 +248,82 @@ class Game:
                     self.statistics_tracker.on_shot_fired(agent)
                     agent.try_attack(current_time, self.projectiles)
            
-            # Actualizează proiectilele
-            for projectile in self.projectiles[:]:
-                projectile.update(current_time)
-               
-                # Verifică coliziuni cu agenți
-                for agent in self.agents:
-                    was_alive_before = agent.alive
-                    if projectile.check_collision_with_agent(agent):
-                        # Track damage și hit
-                        if projectile.owner and projectile.team_id != agent.team_id:
-                            self.statistics_tracker.on_damage_dealt(
-                                projectile.owner,
-                                projectile.damage,
-                                agent
-                            )
-                            self.statistics_tracker.on_shot_hit(projectile.owner)
-                           
-                            # Pentru KOTH, verifică dacă damage-ul a fost provocat în zonă sau în afara zonei
-                            # Verificăm poziția agentului care a tras (owner), nu a celui lovit
-                            if self.game_mode_name == "King of the Hill" and self.statistics_tracker and projectile.owner:
-                                in_zone = False
-                                if hasattr(self.game_mode, 'central_zone'):
-                                    # Zona centrală unică
-                                    if self.game_mode.central_zone.collidepoint(projectile.owner.x, projectile.owner.y):
-                                        in_zone = True
-                                else:
-                                    # Fallback pentru vechea versiune cu multiple zone
-                                    for zone in self.game_mode.zones.values():
-                                        if zone.collidepoint(projectile.owner.x, projectile.owner.y):
-                                            in_zone = True
-                                            break
-                                self.statistics_tracker.on_koth_damage(projectile.owner, projectile.damage, in_zone)
-                       
-                        # Verifică dacă agentul tocmai a murit (din cauza proiectilului)
-                        if was_alive_before and not agent.alive:
-                            self.statistics_tracker.on_agent_death(agent)
-                            logger.game_event("KILL", f"Agent {agent.agent_id} killed by projectile from {projectile.owner.agent_id if projectile.owner else 'unknown'}")
-                            if self.game_mode_name in ["King of the Hill", "Capture the Flag"]:
-                                self.game_mode.on_agent_death(agent)
-                        break
-               
-                # Verifică coliziuni cu obstacole
-                hit_obstacle = projectile.check_collision_with_obstacles(self.game_map.obstacles)
-                if hit_obstacle:
-                    hit_obstacle.take_damage(PROJECTILE_DAMAGE)
-               
-                # Elimină proiectile moarte
-                if not projectile.alive:
-                    self.projectiles.remove(projectile)
+            # Calculează căile cerute în acest tick (în limita bugetului; restul așteaptă)
+            self.path_scheduler.run()
            
+            # Actualizează proiectilele (un singur pas vectorizat pentru tot pool-ul)
+            hits, wall_hits = self.projectiles.update(current_time, self.game_map)
+            for owner, agent, damage in hits:
+                # Track damage și hit
+                if owner:
+                    self.statistics_tracker.on_damage_dealt(owner, damage, agent)
+                    self.statistics_tracker.on_shot_hit(owner)
+
+                    # Pentru KOTH, verifică dacă damage-ul a fost provocat în zonă sau în afara zonei
+                    # Verificăm poziția agentului care a tras (owner), nu a celui lovit
+                    if self.game_mode_name == "King of the Hill" and self.statistics_tracker:
+                        in_zone = False
+                        if hasattr(self.game_mode, 'central_zone'):
+                            # Zona centrală unică
+                            if self.game_mode.central_zone.collidepoint(owner.x, owner.y):
+                                in_zone = True
+                        else:
+                            # Fallback pentru vechea versiune cu multiple zone
+                            for zone in self.game_mode.zones.values():
+                                if zone.collidepoint(owner.x, owner.y):
+                                    in_zone = True
+                                    break
+                        self.statistics_tracker.on_koth_damage(owner, damage, in_zone)
+
+                # Verifică dacă agentul tocmai a murit (din cauza proiectilului)
+                if not agent.alive:
+                    self.statistics_tracker.on_agent_death(agent)
+                    logger.game_event("KILL", f"Agent {agent.agent_id} killed by projectile from {owner.agent_id if owner else 'unknown'}")
+                    if self.game_mode_name in ["King of the Hill", "Capture the Flag"]:
+                        self.game_mode.on_agent_death(agent)
+
+            # Damage pe obstacolele lovite
+            for wall in wall_hits:
+                wall.take_damage(PROJECTILE_DAMAGE)
+
             # Actualizează obstacole (elimină cele distruse)
             self.game_map.update_obstacles()
             # Curăță mesaje expirate
             self.message_bus.cleanup(current_time)
        
         self.game_mode.update()
+       
+        # Avansează ceasul simulării cu un pas fix
+        self.sim_clock.tick()
    
-    def draw(self):
-        """Desenează totul"""
+    def draw(self, alpha=1.0):
+        """
+        Desenează totul
+
+        Args:
+            alpha: Fracțiunea scursă din pasul următor al simulării; agenții și
+                   proiectilele se desenează interpolat între ultimele două stări
+        """
         self.game_map.draw(self.screen)
        
         # Desenează proiectilele
-        for projectile in self.projectiles:
-            projectile.draw(self.screen)
+        self.projectiles.draw(self.screen, alpha=alpha)
        
-        # Desenează agenții
+        # Desenează agenții; conurile de vedere se compun împreună, într-un singur strat
+        positions = self.agent_store.interpolated_positions(alpha)
+        self.los_overlay.begin(self.screen)
         for agent in self.agents:
-            agent.draw(self.screen)
+            agent.draw(self.screen, los_overlay=self.los_overlay, position=positions[agent.slot])
+        self.los_overlay.draw(self.screen)
        
         # Desenează proiectilele
-        for projectile in self.projectiles:
-            projectile.draw(self.screen)
+        self.projectiles.draw(self.screen, alpha=alpha)
        
         self.game_mode.draw_ui(self.screen)
        
         # Instrucțiuni
         if self.game_mode.game_over:
-            font = pygame.font.Font(None, 24)
-            restart_text = font.render("Press R to restart, M for menu, ESC to quit", True, (255, 255, 255))
+            restart_text = self.text_cache.render(24, "Press R to restart, M for menu, ESC to quit", (255, 255, 255))
             self.screen.blit(restart_text, (SCREEN_WIDTH // 2 - 180, SCREEN_HEIGHT - 30))
        
         pygame.display.flip()
@@ -284,6 +332,12 @@ class Game:
 
 
 def main():
+    # Subcomanda "batch": rulează meciuri headless în paralel (python main.py batch ...)
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from batch_runner import main as batch_main
+        batch_main(sys.argv[2:])
+        return
+    
     while True:
         # Afișează meniul
         menu = Menu()
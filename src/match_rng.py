@@ -0,0 +1,33 @@
+"""
+Generatoare de numere aleatoare per meci.
+
+Fiecare meci deține un MatchRng derivat dintr-o singură sămânță, folosit de hartă,
+agenți și modurile de joc în locul modulului global random. Cu aceeași sămânță
+(și același SimClock) un meci se rejoacă identic - util pentru benchmark-uri și
+pentru reproducerea meciurilor lente sau patologice.
+"""
+
+import random
+import secrets
+import numpy as np
+
+
+class MatchRng(random.Random):
+    """random.Random al unui meci, plus un numpy Generator din aceeași sămânță"""
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Sămânța meciului (int); dacă lipsește se alege una aleator
+        """
+        if seed is None:
+            seed = secrets.randbits(63)
+        self.match_seed = seed
+        super().__init__(seed)
+        # Flux separat pentru operațiile vectorizate NumPy
+        self.np = np.random.default_rng(np.random.SeedSequence(seed))
+
+
+def resolve_rng(rng=None):
+    """Returnează generatorul primit sau modulul global random (comportament istoric)"""
+    return rng if rng is not None else random
@@ -1,5 +1,6 @@
 import pygame
 from config import *
+from text_cache import resolve_text_cache
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color):
@@ -10,13 +11,13 @@ class Button:
         self.current_color = color
         self.is_hovered = False
     
-    def draw(self, screen, font):
+    def draw(self, screen, text_cache, font_size):
         # Desenează butonul
         pygame.draw.rect(screen, self.current_color, self.rect)
         pygame.draw.rect(screen, (0, 0, 0), self.rect, 2)  # Border
         
         # Desenează textul
-        text_surf = font.render(self.text, True, (255, 255, 255))
+        text_surf = text_cache.render(font_size, self.text, (255, 255, 255))
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
     
@@ -39,10 +40,11 @@ class Menu:
         self.clock = pygame.time.Clock()
         self.running = True
         
-        # Fonturi
-        self.title_font = pygame.font.Font(None, 72)
-        self.button_font = pygame.font.Font(None, 36)
-        self.info_font = pygame.font.Font(None, 24)
+        # Fonturi și texte randate (cache comun cu jocul)
+        self.text_cache = resolve_text_cache()
+        self.title_font_size = 72
+        self.button_font_size = 36
+        self.info_font_size = 24
         
         # Culori butoane
         button_color = (80, 80, 200)
@@ -127,27 +129,27 @@ class Menu:
         self.screen.fill((30, 30, 60))
         
         # Titlu
-        title_surf = self.title_font.render("SYNAPSE STRIKE", True, (255, 215, 0))
+        title_surf = self.text_cache.render(self.title_font_size, "SYNAPSE STRIKE", (255, 215, 0))
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
         self.screen.blit(title_surf, title_rect)
         
         # Subtitlu
-        subtitle_surf = self.button_font.render("Select Game Mode", True, (200, 200, 200))
+        subtitle_surf = self.text_cache.render(self.button_font_size, "Select Game Mode", (200, 200, 200))
         subtitle_rect = subtitle_surf.get_rect(center=(SCREEN_WIDTH // 2, 160))
         self.screen.blit(subtitle_surf, subtitle_rect)
         
         # Butoane
         for btn in self.buttons:
-            btn.draw(self.screen, self.button_font)
+            btn.draw(self.screen, self.text_cache, self.button_font_size)
         
         # Descriere mod selectat
         if self.current_description:
-            desc_surf = self.info_font.render(self.current_description, True, (200, 200, 200))
+            desc_surf = self.text_cache.render(self.info_font_size, self.current_description, (200, 200, 200))
             desc_rect = desc_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80))
             self.screen.blit(desc_surf, desc_rect)
         
         # Instrucțiuni
-        instr_surf = self.info_font.render("Press ESC to quit", True, (150, 150, 150))
+        instr_surf = self.text_cache.render(self.info_font_size, "Press ESC to quit", (150, 150, 150))
         instr_rect = instr_surf.get_rect(bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20))
         self.screen.blit(instr_surf, instr_rect)
         
@@ -0,0 +1,138 @@
+"""
+Graf de navigare pe tile-uri, partajat de toate căutările de drum.
+
+Tile-urile blocate și vecinii fiecărui tile (8 direcții, fără tăierea colțurilor
+pe lângă ziduri) sunt precalculate în format CSR: pentru nodul n = y * width + x,
+vecinii sunt neighbor_node[neighbor_start[n]:neighbor_start[n + 1]], cu costurile
+din neighbor_cost. Graful se reconstruiește doar după ce un zid este distrus;
+`version` crește la fiecare astfel de schimbare, ca rezultatele calculate pe
+graf (drumuri, câmpuri de flux) să poată fi invalidate.
+"""
+
+import numpy as np
+from config import *
+
+# Direcțiile vecinilor, în ordinea în care sunt explorate, și costul fiecăreia
+NEIGHBOR_OFFSETS = [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+STRAIGHT_COST = 1.0
+DIAGONAL_COST = 1.4
+
+
+def wall_footprint(occupancy):
+    """
+    Tile-urile blocate de zidurile dintr-un bitmap de ocupare
+
+    Marginea dreapta-jos a dreptunghiului unui zid este inclusă, deci fiecare zid
+    blochează și tile-ul din dreapta, de dedesubt și cel diagonal (aceeași
+    convenție ca rasterizarea dreptunghiurilor din from_obstacles).
+    """
+    blocked = occupancy.copy()
+    blocked[:, 1:] |= occupancy[:, :-1]
+    blocked[1:, :] |= occupancy[:-1, :]
+    blocked[1:, 1:] |= occupancy[:-1, :-1]
+    return blocked
+
+
+class NavGrid:
+    """Tile-uri blocate și adiacență CSR pentru căutarea de drum"""
+
+    def __init__(self, game_map=None, blocked=None):
+        """
+        Args:
+            game_map: Harta care deține graful (blocajele sunt citite din occupancy)
+            blocked: Matrice bool (height, width) fixă, pentru grafuri fără hartă
+        """
+        self.game_map = game_map
+        self._fixed_blocked = blocked
+        if game_map is not None:
+            self.width, self.height = game_map.width, game_map.height
+        else:
+            self.height, self.width = blocked.shape
+        self.version = 0
+        self._build()
+
+    @classmethod
+    def from_obstacles(cls, obstacles, width=MAP_WIDTH, height=MAP_HEIGHT, tile_size=TILE_SIZE):
+        """Graf construit dintr-o listă arbitrară de obstacole (dreptunghiurile zidurilor vii)"""
+        blocked = np.zeros((height, width), dtype=bool)
+        for obstacle in obstacles:
+            if not obstacle.alive:
+                continue
+            rect = obstacle.rect
+            x1, y1 = rect.x // tile_size, rect.y // tile_size
+            x2, y2 = (rect.x + rect.width) // tile_size, (rect.y + rect.height) // tile_size
+            blocked[max(y1, 0):y2 + 1, max(x1, 0):x2 + 1] = True
+        return cls(blocked=blocked)
+
+    def invalidate(self):
+        """Apelat când un zid este distrus: graful se reconstruiește la următoarea citire"""
+        self.version += 1
+        self._built_version = None
+
+    def _build(self):
+        """Recalculează tile-urile blocate și adiacența CSR"""
+        if self.game_map is not None:
+            blocked = wall_footprint(self.game_map.occupancy)
+        else:
+            blocked = self._fixed_blocked
+        self.blocked = blocked
+        h, w = self.height, self.width
+
+        # Tile-urile blocate plus o bordură blocată, ca vecinii din afara hărții să fie respinși
+        padded = np.ones((h + 2, w + 2), dtype=bool)
+        padded[1:-1, 1:-1] = blocked
+
+        def shifted(dx, dy):
+            return padded[1 + dy:h + 1 + dy, 1 + dx:w + 1 + dx]
+
+        nodes = np.arange(h * w).reshape(h, w)
+        valid = []
+        for dx, dy in NEIGHBOR_OFFSETS:
+            ok = ~shifted(dx, dy)
+            if dx and dy:
+                # Fără tăierea colțurilor: ambele tile-uri ortogonale trebuie să fie libere
+                ok = ok & ~shifted(dx, 0) & ~shifted(0, dy)
+            valid.append(ok.ravel())
+        valid = np.stack(valid, axis=1)
+
+        # Rând cu rând (nod, apoi direcție): ordinea vecinilor din NEIGHBOR_OFFSETS
+        offsets = np.array([dy * w + dx for dx, dy in NEIGHBOR_OFFSETS])
+        costs = np.array([DIAGONAL_COST if dx and dy else STRAIGHT_COST for dx, dy in NEIGHBOR_OFFSETS])
+        node_index, direction = np.nonzero(valid)
+        self.neighbor_node = (nodes.ravel()[node_index] + offsets[direction]).tolist()
+        self.neighbor_cost = costs[direction].tolist()
+        self.neighbor_start = [0] + np.cumsum(valid.sum(axis=1)).tolist()
+        self._built_version = self.version
+
+    def adjacency(self):
+        """
+        Returns:
+            (neighbor_start, neighbor_node, neighbor_cost) - listele CSR actualizate
+        """
+        if self._built_version != self.version:
+            self._build()
+        return self.neighbor_start, self.neighbor_node, self.neighbor_cost
+
+    def node(self, tx, ty):
+        """Indexul nodului pentru tile-ul (tx, ty)"""
+        return ty * self.width + tx
+
+    def node_at(self, x, y):
+        """Nodul tile-ului care conține punctul (x, y), lipit de marginea hărții"""
+        tx = min(max(int(x // TILE_SIZE), 0), self.width - 1)
+        ty = min(max(int(y // TILE_SIZE), 0), self.height - 1)
+        return ty * self.width + tx
+
+    def tile(self, node):
+        """Tile-ul (tx, ty) al unui nod"""
+        ty, tx = divmod(node, self.width)
+        return tx, ty
+
+    def in_bounds(self, tx, ty):
+        return 0 <= tx < self.width and 0 <= ty < self.height
+
+    def is_walkable(self, tx, ty):
+        """True dacă tile-ul este în hartă și neblocat"""
+        if self._built_version != self.version:
+            self._build()
+        return self.in_bounds(tx, ty) and not self.blocked.item(ty, tx)
@@ -0,0 +1,183 @@
+"""
+Tabel precalculat de drumuri minime între toate perechile de tile-uri.
+
+Pe hărțile mici (harta implicită are 25 x 18 = 450 de tile-uri) matricea
+distanțelor și matricea "următorul tile de la A spre B" au doar ~200k intrări,
+deci pot fi calculate o dată per hartă. Distanțele se obțin prin relaxări
+Bellman-Ford vectorizate (NumPy) pentru toate sursele deodată: fiecare iterație
+relaxează toate muchiile unei direcții pentru toate sursele.
+
+Distrugerea unui zid doar adaugă muchii în graf, deci distanțele vechi rămân
+margini superioare valide: reparația pornește relaxarea din matricea existentă
+și converge în câteva iterații.
+"""
+
+import numpy as np
+from nav_grid import NEIGHBOR_OFFSETS, STRAIGHT_COST, DIAGONAL_COST
+from pathfinding import SearchCounter
+
+# Peste acest număr de tile-uri tabelul nu se construiește (memorie O(n²))
+NEXT_HOP_MAX_CELLS = 2048
+
+# Distanțele sunt păstrate în zecimi (costuri întregi 10 / 14): sumele sunt
+# exacte, deci egalitățile dintre drumuri nu depind de ordinea adunărilor
+COST_SCALE = 10
+# Distanța "fără drum" în matricea int16; orice drum real pe o hartă de cel mult
+# NEXT_HOP_MAX_CELLS tile-uri are costul sub această valoare
+UNREACHABLE = 30000
+
+
+class NextHopTable:
+    """Distanțe (în zecimi) și următorul tile pentru toate perechile de tile-uri ale unui NavGrid"""
+
+    def __init__(self, nav):
+        """
+        Args:
+            nav: NavGrid-ul hărții
+        """
+        self.nav = nav
+        self.size = nav.width * nav.height
+        self.next_hop = np.full((self.size, self.size), -1, dtype=np.int16)
+        self.iterations = 0  # Iterații de relaxare la ultimul calcul (pentru profilare)
+
+        edges = self._edges_by_direction()
+        self.dist = np.full((self.size, self.size), UNREACHABLE, dtype=np.int16)
+        np.fill_diagonal(self.dist, 0.0)
+        self.iterations = self._relax(self.dist, edges)
+        self._build_next_hops(edges)
+
+    def _edges_by_direction(self):
+        """Muchiile grafului grupate pe direcție, în ordinea NEIGHBOR_OFFSETS: [(u, v, cost)]"""
+        neighbor_start, neighbor_node, _ = self.nav.adjacency()
+        start = np.array(neighbor_start)
+        target = np.array(neighbor_node, dtype=np.intp)
+        source = np.repeat(np.arange(start.size - 1), np.diff(start))
+        offset = target - source
+        width = self.nav.width
+        edges = []
+        for dx, dy in NEIGHBOR_OFFSETS:
+            mask = offset == dy * width + dx
+            cost = np.int16(round((DIAGONAL_COST if dx and dy else STRAIGHT_COST) * COST_SCALE))
+            edges.append((source[mask], target[mask], cost))
+        self.version = self.nav.version
+        self._edge_codes = np.sort(np.concatenate([u * self.size + v for u, v, _ in edges]))
+        return edges
+
+    @staticmethod
+    def _relax(dist, edges):
+        """
+        Bellman-Ford pentru mai multe surse deodată, pornind de la margini superioare
+
+        Fiecare rând din dist conține distanțele de la o sursă; se aplică
+        dist[:, v] = min(dist[:, v], dist[:, u] + c) până nu mai scade nimic.
+        Într-o direcție fiecare tile apare o singură dată ca destinație, deci
+        relaxarea se face pe coloane întregi, direcție cu direcție.
+
+        Returns:
+            Numărul de iterații
+        """
+        iterations = 0
+        changed = True
+        while changed:
+            changed = False
+            iterations += 1
+            for source, target, cost in edges:
+                candidate = dist[:, source] + cost
+                current = dist[:, target]
+                if (candidate < current).any():
+                    dist[:, target] = np.minimum(current, candidate)
+                    changed = True
+        return iterations
+
+    def _build_next_hops(self, edges):
+        """next_hop[a, b] = vecinul n al lui a cu cel mai mic cost(a, n) + dist[n, b]"""
+        dist = self.dist
+        best = np.full_like(dist, UNREACHABLE)
+        next_hop = self.next_hop
+        next_hop.fill(-1)
+        # La egalitate rămâne prima direcție din NEIGHBOR_OFFSETS
+        for source, target, cost in edges:
+            candidate = dist[target] + cost
+            better = candidate < best[source]
+            best[source] = np.where(better, candidate, best[source])
+            next_hop[source] = np.where(better, target[:, None], next_hop[source])
+        next_hop[dist == 0] = -1
+
+    def _repair(self):
+        """
+        Actualizează tabelul după ce graful a primit muchii noi (zid distrus)
+
+        Orice drum care s-a scurtat trece printr-un capăt K al unei muchii noi,
+        deci dist'[s, t] = min(dist[s, t], dist'[s, k] + dist'[k, t]). Se
+        relaxează doar rândurile și coloanele nodurilor din K.
+        """
+        old_codes = self._edge_codes
+        edges = self._edges_by_direction()
+        added = np.setdiff1d(self._edge_codes, old_codes, assume_unique=True)
+        if added.size:
+            keys = np.unique(np.concatenate((added // self.size, added % self.size)))
+            dist = self.dist
+
+            # dist'[k, :] - de la nodurile cheie, pe muchiile grafului
+            from_keys = dist[keys]
+            iterations = self._relax(from_keys, edges)
+            # dist'[:, k] - către nodurile cheie, pe muchiile inversate
+            reversed_edges = [(v, u, c) for u, v, c in edges]
+            to_keys = np.ascontiguousarray(dist[:, keys].T)
+            iterations += self._relax(to_keys, reversed_edges)
+            self.iterations = iterations
+
+            # Sumele se fac în int32 (două distanțe UNREACHABLE depășesc int16)
+            to_keys = to_keys.astype(np.int32)
+            for i in range(keys.size):
+                through = to_keys[i][:, None] + from_keys[i][None, :]
+                np.minimum(dist, np.minimum(through, UNREACHABLE), out=dist, casting="unsafe")
+        self._build_next_hops(edges)
+
+    def ensure_current(self):
+        """Repară tabelul dacă graful s-a schimbat (zid distrus) de la ultimul calcul"""
+        if self.version != self.nav.version:
+            self._repair()
+
+    def distance(self, start, goal):
+        """Costul drumului minim între două tile-uri (inf dacă nu există drum)"""
+        self.ensure_current()
+        nav = self.nav
+        dist = self.dist.item(nav.node(*start), nav.node(*goal))
+        return dist / COST_SCALE if dist < UNREACHABLE else float('inf')
+
+    def next_tile(self, start, goal):
+        """
+        Următorul tile de la start spre goal
+
+        Returns:
+            (tx, ty), sau None dacă start == goal sau goal nu poate fi atins
+        """
+        self.ensure_current()
+        nav = self.nav
+        node = self.next_hop.item(nav.node(*start), nav.node(*goal))
+        return nav.tile(node) if node >= 0 else None
+
+    def path(self, start, goal):
+        """
+        Drumul minim de la start (exclus) la goal, urmând tabelul
+
+        Returns:
+            Lista de tile-uri, sau None dacă goal nu poate fi atins
+        """
+        self.ensure_current()
+        nav = self.nav
+        current = nav.node(*start)
+        goal_node = nav.node(*goal)
+        if current == goal_node:
+            return []
+        row = self.next_hop[:, goal_node].tolist()
+        if row[current] < 0:
+            return None
+        tiles = []
+        while current != goal_node:
+            current = row[current]
+            tiles.append(nav.tile(current))
+        # Fiecare pas citit din tabel contează ca un nod expandat în bugetul per tick
+        SearchCounter.expansions += len(tiles)
+        return tiles
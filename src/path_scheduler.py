@@ -0,0 +1,138 @@
+"""
+Planificator de cereri de pathfinding cu buget per tick.
+
+Agenții nu mai recalculează calea imediat: trimit o cerere, iar la sfârșitul
+tick-ului PathScheduler servește cererile în ordinea priorității (carrier >
+chaser > atacator > explorator, apoi în ordinea sosirii) până la epuizarea
+bugetului de noduri expandate (și, opțional, de timp). Cererile rămase așteaptă
+tick-ul următor; până atunci agentul continuă pe calea veche.
+
+Astfel, după un val de respawn-uri sau distrugerea unui zid, recalculările se
+împart pe mai multe tick-uri în loc să lovească toate același frame.
+"""
+
+import heapq
+import time
+from config import *
+from pathfinding import SearchCounter
+
+# Prioritățile cererilor (valoare mai mică = servită mai devreme)
+PRIORITY_CARRIER = 0
+PRIORITY_CHASER = 1
+PRIORITY_ATTACKER = 2
+PRIORITY_EXPLORER = 3
+
+
+class PathScheduler:
+    """Coadă de priorități pentru cererile de cale, servită cu buget per tick"""
+
+    def __init__(self, budget_expansions=PATH_BUDGET_EXPANSIONS, budget_ms=PATH_BUDGET_MS):
+        """
+        Args:
+            budget_expansions: Noduri expandate per tick (None = fără limită)
+            budget_ms: Timp de calcul per tick în ms (None = fără limită)
+        """
+        self.budget_expansions = budget_expansions
+        self.budget_ms = budget_ms
+        self._queue = []  # Heap de intrări [prioritate, ordine, agent, țintă, tick-ul cererii]
+        self._pending = {}  # agent -> intrarea lui din heap (o singură cerere activă per agent)
+        self._counter = 0
+        self.tick = 0
+
+        # Metrici
+        self.peak_queue_length = 0
+        self.served_total = 0
+        self.deferred_total = 0  # Cereri rămase în coadă la sfârșitul unui tick (cumulat)
+        self.wait_ticks_total = 0
+        self.served_last_tick = 0
+        self.expansions_last_tick = 0
+        self.ms_last_tick = 0.0
+
+    def __len__(self):
+        return len(self._pending)
+
+    def submit(self, agent, target, priority):
+        """
+        Adaugă (sau actualizează) cererea unui agent
+
+        O cerere nouă de la un agent care are deja una în coadă înlocuiește ținta;
+        cererea își păstrează locul dacă prioritatea nu scade.
+
+        Args:
+            agent: Agentul care cere calea
+            target: Obiectul țintă (x, y), citit la momentul servirii, sau FlowField-ul
+                    unei destinații comune (cale cooperativă WHCA*)
+            priority: Una dintre constantele PRIORITY_*
+        """
+        entry = self._pending.get(agent)
+        if entry is not None:
+            entry[3] = target
+            if priority >= entry[0]:
+                return
+            entry[2] = None  # Intrarea veche rămâne în heap, dar este ignorată
+        self._counter += 1
+        request_tick = entry[4] if entry is not None else self.tick
+        entry = [priority, self._counter, agent, target, request_tick]
+        self._pending[agent] = entry
+        heapq.heappush(self._queue, entry)
+        self.peak_queue_length = max(self.peak_queue_length, len(self._pending))
+
+    def cancel(self, agent):
+        """Renunță la cererea în așteptare a agentului (ex. la moarte)"""
+        entry = self._pending.pop(agent, None)
+        if entry is not None:
+            entry[2] = None
+
+    def is_pending(self, agent):
+        """True dacă agentul are o cerere în așteptare"""
+        return agent in self._pending
+
+    def run(self):
+        """
+        Servește cereri până la epuizarea bugetului (cel puțin una per tick)
+
+        Returns:
+            Numărul de cereri servite
+        """
+        start_expansions = SearchCounter.expansions
+        start_time = time.perf_counter()
+        served = 0
+        while self._queue:
+            if served:
+                if self.budget_expansions is not None and \
+                        SearchCounter.expansions - start_expansions >= self.budget_expansions:
+                    break
+                if self.budget_ms is not None and \
+                        (time.perf_counter() - start_time) * 1000 >= self.budget_ms:
+                    break
+            _, _, agent, target, request_tick = heapq.heappop(self._queue)
+            if agent is None:
+                continue
+            del self._pending[agent]
+            # Agentul a murit între timp: cererea nu mai contează
+            if not agent.alive:
+                continue
+            agent.find_path_to_target(agent.game_map.obstacles, target)
+            served += 1
+            self.wait_ticks_total += self.tick - request_tick
+
+        self.served_last_tick = served
+        self.served_total += served
+        self.deferred_total += len(self._pending)
+        self.expansions_last_tick = SearchCounter.expansions - start_expansions
+        self.ms_last_tick = (time.perf_counter() - start_time) * 1000
+        self.tick += 1
+        return served
+
+    def metrics(self):
+        """Metrici pentru profilare: lungimea cozii și costul servirii"""
+        return {
+            "queue_length": len(self._pending),
+            "peak_queue_length": self.peak_queue_length,
+            "served_total": self.served_total,
+            "served_last_tick": self.served_last_tick,
+            "deferred_total": self.deferred_total,
+            "mean_wait_ticks": self.wait_ticks_total / self.served_total if self.served_total else 0.0,
+            "expansions_last_tick": self.expansions_last_tick,
+            "ms_last_tick": self.ms_last_tick,
+        }
@@ -0,0 +1,244 @@
+"""
+Căutare de drum pe graful de navigare (NavGrid).
+
+A* cu heuristică octilă: pe o grilă cu 8 direcții și costuri 1.0 / 1.4 este
+exact costul drumului fără ziduri, deci heuristica este consistentă și fiecare
+nod este expandat cel mult o dată (set închis, fără re-deschideri).
+"""
+
+import heapq
+from collections import deque
+from config import WHCA_WINDOW
+from nav_grid import STRAIGHT_COST, DIAGONAL_COST
+
+# Limită de siguranță pentru expandări (harta implicită are 450 de tile-uri)
+MAX_EXPANSIONS = 500
+# Limita pentru căutarea cooperativă (stări (tile, pas) din fereastră)
+WHCA_MAX_EXPANSIONS = 400
+
+
+class SearchCounter:
+    """Numărul total de noduri expandate de căutări (bugetul per tick al PathScheduler)"""
+    expansions = 0
+
+
+def octile_distance(a, b):
+    """Costul minim între două tile-uri (tx, ty) pe o grilă fără obstacole"""
+    dx = abs(a[0] - b[0])
+    dy = abs(a[1] - b[1])
+    if dx < dy:
+        dx, dy = dy, dx
+    return STRAIGHT_COST * (dx - dy) + DIAGONAL_COST * dy
+
+
+def astar(nav, start, goal, max_expansions=MAX_EXPANSIONS, within=None):
+    """
+    A* de la tile-ul start la tile-ul goal
+
+    Dacă goal nu poate fi atins (blocat, în afara hărții sau peste limita de
+    expandări), drumul duce la nodul expandat cel mai apropiat de goal.
+
+    Args:
+        nav: NavGrid-ul hărții
+        start: Tile-ul de pornire (tx, ty), în hartă
+        goal: Tile-ul destinație (tx, ty)
+        max_expansions: Numărul maxim de noduri expandate
+        within: Mulțimea nodurilor permise (ex. tile-urile unor clustere HPA*), None = toată harta
+
+    Returns:
+        (path, reached): lista de tile-uri (fără start) și True dacă drumul ajunge în goal
+    """
+    neighbor_start, neighbor_node, neighbor_cost = nav.adjacency()
+    width = nav.width
+    goal_x, goal_y = goal
+    start_node = nav.node(*start)
+    goal_node = nav.node(goal_x, goal_y) if nav.in_bounds(goal_x, goal_y) else -1
+
+    def h(node):
+        ty, tx = divmod(node, width)
+        dx = abs(tx - goal_x)
+        dy = abs(ty - goal_y)
+        if dx < dy:
+            dx, dy = dy, dx
+        return STRAIGHT_COST * (dx - dy) + DIAGONAL_COST * dy
+
+    # (f, h, counter, nod): la f egal câștigă nodul mai apropiat de goal, apoi cel mai vechi
+    h_start = h(start_node)
+    open_heap = [(h_start, h_start, 0, start_node)]
+    g = {start_node: 0.0}
+    came_from = {}
+    closed = set()
+    counter = 0
+    best_node, best_h = start_node, h_start
+
+    while open_heap and len(closed) < max_expansions:
+        _, h_current, _, current = heapq.heappop(open_heap)
+        if current in closed:
+            continue  # Intrare veche (nodul a fost deja expandat cu un cost mai mic)
+        closed.add(current)
+
+        if current == goal_node:
+            SearchCounter.expansions += len(closed)
+            return _reconstruct(came_from, current, width), True
+        if h_current < best_h:
+            best_node, best_h = current, h_current
+
+        g_current = g[current]
+        for k in range(neighbor_start[current], neighbor_start[current + 1]):
+            neighbor = neighbor_node[k]
+            if neighbor in closed or (within is not None and neighbor not in within):
+                continue
+            tentative = g_current + neighbor_cost[k]
+            if tentative < g.get(neighbor, float('inf')):
+                g[neighbor] = tentative
+                came_from[neighbor] = current
+                counter += 1
+                h_neighbor = h(neighbor)
+                heapq.heappush(open_heap, (tentative + h_neighbor, h_neighbor, counter, neighbor))
+
+    SearchCounter.expansions += len(closed)
+    return _reconstruct(came_from, best_node, width), False
+
+
+def cooperative_astar(nav, start, goal_cost, reservations, agent, start_step,
+                      window=WHCA_WINDOW, max_expansions=WHCA_MAX_EXPANSIONS):
+    """
+    A* cooperativ cu fereastră (WHCA*) în spațiu-timp
+    
+    Stările sunt perechi (tile, pas); din fiecare stare agentul trece într-un
+    tile vecin sau așteaptă pe loc un pas (cost STRAIGHT_COST), fără să intre în
+    tile-uri rezervate de coechipieri la acel pas. Heuristica este costul exact
+    până la destinație pe harta fără rezervări (ex. FlowField.cost), deci o
+    stare de la capătul ferestrei are f = costul total estimat al drumului.
+    
+    Args:
+        nav: NavGrid-ul hărții
+        start: Tile-ul de pornire (tx, ty), în hartă
+        goal_cost: Costul până la destinație pentru fiecare nod (0 în destinație)
+        reservations: ReservationTable-ul echipei
+        agent: Agentul care planifică (rezervările proprii sunt ignorate)
+        start_step: Pasul de timp curent
+        window: Numărul de pași coordonați
+        max_expansions: Numărul maxim de stări expandate
+    
+    Returns:
+        Lista nodurilor ocupate la pașii start_step + 1, ... (un nod repetat = așteptare),
+        terminată la capătul ferestrei sau într-o destinație liberă până la capătul ei;
+        None dacă nu s-a găsit o astfel de stare
+    """
+    neighbor_start, neighbor_node, neighbor_cost = nav.adjacency()
+    start_node = nav.node(*start)
+    
+    def settled(node, t):
+        """Destinație liberă de la pasul t până la capătul ferestrei"""
+        return goal_cost[node] == 0 and all(
+            reservations.is_free(node, start_step + k, agent) for k in range(t + 1, window + 1))
+    
+    # Start-ul poate fi un tile blocat (cost infinit) din care agentul doar iese
+    state = (start_node, 0)
+    open_heap = [(0.0, 0, state)]
+    g = {state: 0.0}
+    came_from = {}
+    closed = set()
+    counter = 0
+    while open_heap and len(closed) < max_expansions:
+        _, _, state = heapq.heappop(open_heap)
+        if state in closed:
+            continue
+        closed.add(state)
+        current, t = state
+        if t == window or settled(current, t):
+            SearchCounter.expansions += len(closed)
+            nodes = []
+            while state in came_from:
+                nodes.append(state[0])
+                state = came_from[state]
+            nodes.reverse()
+            return nodes
+        
+        step = start_step + t + 1
+        g_current = g[state]
+        moves = [(current, STRAIGHT_COST)]  # Așteptare pe loc
+        moves.extend((neighbor_node[k], neighbor_cost[k])
+                     for k in range(neighbor_start[current], neighbor_start[current + 1]))
+        for neighbor, cost in moves:
+            next_state = (neighbor, t + 1)
+            h = goal_cost[neighbor]
+            if next_state in closed or h == float('inf') or \
+                    not reservations.can_move(current, neighbor, step, agent):
+                continue
+            tentative = g_current + cost
+            if tentative < g.get(next_state, float('inf')):
+                g[next_state] = tentative
+                came_from[next_state] = state
+                counter += 1
+                heapq.heappush(open_heap, (tentative + h, counter, next_state))
+    
+    SearchCounter.expansions += len(closed)
+    return None
+
+
+def _reconstruct(came_from, node, width):
+    """Tile-urile de la start (exclus) până la nod"""
+    path = []
+    while node in came_from:
+        ty, tx = divmod(node, width)
+        path.append((tx, ty))
+        node = came_from[node]
+    path.reverse()
+    return path
+
+
+def costs_from(nav, source, within=None):
+    """
+    Dijkstra complet dintr-un nod: costul minim până la fiecare nod atins
+
+    Args:
+        nav: NavGrid-ul hărții
+        source: Nodul de pornire
+        within: Mulțimea nodurilor permise, None = toată harta
+
+    Returns:
+        Dicționar nod -> cost
+    """
+    neighbor_start, neighbor_node, neighbor_cost = nav.adjacency()
+    cost = {source: 0.0}
+    heap = [(0.0, source)]
+    while heap:
+        current_cost, current = heapq.heappop(heap)
+        if current_cost > cost[current]:
+            continue
+        for k in range(neighbor_start[current], neighbor_start[current + 1]):
+            neighbor = neighbor_node[k]
+            if within is not None and neighbor not in within:
+                continue
+            new_cost = current_cost + neighbor_cost[k]
+            if new_cost < cost.get(neighbor, float('inf')):
+                cost[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost, neighbor))
+    SearchCounter.expansions += len(cost)
+    return cost
+
+
+def smooth_path(start, points, is_clear):
+    """
+    Netezirea căii prin "string pulling": un punct intermediar este eliminat
+    dacă următorul punct se vede direct din ultimul punct păstrat
+
+    Args:
+        start: Poziția de pornire (x, y)
+        points: Punctele căii (centre de tile-uri), în ordine
+        is_clear: Funcție (a, b) -> True dacă segmentul a -> b este liber
+
+    Returns:
+        deque cu punctele păstrate (ultimul punct este păstrat mereu)
+    """
+    smoothed = deque()
+    anchor = start
+    for i in range(len(points) - 1):
+        if not is_clear(anchor, points[i + 1]):
+            smoothed.append(points[i])
+            anchor = points[i]
+    if points:
+        smoothed.append(points[-1])
+    return smoothed
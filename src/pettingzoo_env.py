@@ -1,6 +1,5 @@
 import numpy as np
 import pygame
-import random
 from pettingzoo import AECEnv
 from pettingzoo.utils import wrappers
 from gymnasium.spaces import Box, Discrete
@@ -8,7 +7,13 @@ from config import *
 from agent import Agent
 from communication import MessageBus
 from game_map import GameMap
-from projectile import Projectile
+from projectile_pool import ProjectilePool
+from sim_clock import SimClock
+from match_rng import MatchRng
+from agent_store import AgentStore
+from spatial_grid import SpatialGrid
+from visibility import VisibilitySystem
+from los_overlay import LosOverlay
 
 class MicroBattleEnv(AECEnv):
     """Environment PettingZoo pentru Micro Battle"""
@@ -19,17 +24,31 @@ class MicroBattleEnv(AECEnv):
         "is_parallelizable": False,
     }
     
-    def __init__(self, game_mode="Survival", render_mode=None):
+    def __init__(self, game_mode="Survival", render_mode=None, render_every=1):
+        """
+        Args:
+            game_mode: Modul de joc
+            render_mode: "human" (fereastră), "rgb_array" (frame-uri NumPy, fără
+                         fereastră) sau None
+            render_every: Pentru "rgb_array", un frame nou la fiecare render_every
+                          runde; între ele render() returnează ultimul frame
+        """
         super().__init__()
         
         self.game_mode = game_mode
         self.render_mode = render_mode
+        self.render_every = max(1, render_every)
+        
+        # Ceasul simulării - avansează un tick după fiecare rundă completă de agenți
+        self.sim_clock = SimClock()
+        # Generatorul aleator al episodului (re-seed-uit la reset(seed))
+        self.rng = MatchRng()
         
         # Creează harta
-        self.game_map = GameMap(game_mode)
+        self.game_map = GameMap(game_mode, rng=self.rng)
         
         # Creează bus de mesaje
-        self.message_bus = MessageBus()
+        self.message_bus = MessageBus(clock=self.sim_clock)
 
         # Creează agenții
         self.agents_list = []
@@ -39,19 +58,34 @@ class MicroBattleEnv(AECEnv):
         self._setup_spaces()
         
         # Variabile de stare
-        self.projectiles = []
+        self.projectiles = ProjectilePool(self.agent_store, clock=self.sim_clock)
         self.current_time = 0
         
         # Screen pentru rendering
         if render_mode == "human":
             pygame.init()
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        elif render_mode == "rgb_array":
+            # Suprafață offscreen (nu cere display; merge și cu SDL_VIDEODRIVER=dummy)
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
         else:
             self.screen = None
+        # Ultimul frame rgb_array și runda (tick-ul) în care a fost randat
+        self._last_frame = None
+        self._last_frame_tick = None
+        # Stratul comun pentru conurile de vedere (refolosit la fiecare frame)
+        self.los_overlay = LosOverlay()
     
     def _create_agents(self):
         """Creează agenții pentru joc"""
         num_teams = 2
+        # Pornește de la o listă goală (reset() nu trebuie să acumuleze agenți vechi)
+        self.agents_list = []
+        self.agent_store = AgentStore()
+        # Index spațial al agenților, reconstruit după fiecare rundă completă
+        self.spatial_grid = SpatialGrid(slack=AGENT_SPEED * 4)
+        # Matricea de vizibilitate, partajată de agenți și de observații
+        self.visibility = VisibilitySystem(self.game_map)
         
         if self.game_mode == "King of the Hill":
             agents_per_team = KOTH_AGENTS_PER_TEAM
@@ -63,13 +97,15 @@ class MicroBattleEnv(AECEnv):
         for team_id in range(num_teams):
             for i in range(agents_per_team):
                 x, y = self.game_map.get_spawn_position(team_id, num_teams)
-                agent = Agent(x, y, team_id)
+                agent = Agent(x, y, team_id, clock=self.sim_clock, rng=self.rng, store=self.agent_store, grid=self.spatial_grid, game_map=self.game_map, visibility=self.visibility)
                 agent_id = f"agent_{team_id}_{i}"
                 agent.agent_id = agent_id
                 # Unii agenți au comunicare limitată (doar cu vecinii apropiați)
-                agent.has_limited_communication = random.random() < 0.5
+                agent.has_limited_communication = self.rng.random() < 0.5
                 agent.update_color()
                 self.agents_list.append((agent_id, agent))
+        self.spatial_grid.index_agents(self.agent_store)
+        self.visibility.update(self.agent_store)
         
         # Creează lista de nume agenți pentru PettingZoo
         self.possible_agents = [agent_id for agent_id, _ in self.agents_list]
@@ -118,18 +154,25 @@ class MicroBattleEnv(AECEnv):
     def reset(self, seed=None, options=None):
         """Resetează environment-ul"""
         if seed is not None:
-            np.random.seed(seed)
+            # Generator nou derivat din sămânță și hartă regenerată cu el,
+            # astfel încât episodul să fie reproductibil
+            self.rng = MatchRng(seed)
+            self.game_map = GameMap(self.game_mode, rng=self.rng)
+        # Repornește ceasul simulării
+        self.sim_clock.reset()
         # Reinițializează bus (curăță mesaje vechi)
-        self.message_bus = MessageBus()
+        self.message_bus = MessageBus(clock=self.sim_clock)
 
         # Resetează agenții
         self._create_agents()
         
-        # Resetează proiectile
-        self.projectiles = []
+        # Resetează proiectile (pool nou pe store-ul agenților recreați)
+        self.projectiles = ProjectilePool(self.agent_store, clock=self.sim_clock)
         
         # Resetează timp
-        self.current_time = pygame.time.get_ticks()
+        self.current_time = self.sim_clock.get_ticks()
+        self._last_frame = None
+        self._last_frame_tick = None
         
         # Setează agenții activi
         self.agents = self.possible_agents[:]
@@ -177,10 +220,12 @@ class MicroBattleEnv(AECEnv):
                agent.health / AGENT_MAX_HEALTH,
                agent.team_id]
         
-        # Adaugă informații despre inamici (max 10 cei mai apropiați)
+        # Adaugă informații despre inamicii din LoS (max 10 cei mai apropiați),
+        # citiți din matricea de vizibilitate a rundei curente
         enemies = []
-        for other_id, other_agent in self.agents_list:
-            if other_agent.team_id != agent.team_id and other_agent.alive:
+        for slot in self.visibility.visible_targets(agent.slot):
+            other_agent = self.agent_store.agents[slot]
+            if other_agent.alive:
                 distance = agent.distance_to(other_agent)
                 enemies.append((distance, other_agent))
         
@@ -228,13 +273,12 @@ class MicroBattleEnv(AECEnv):
             
             # Tragere
             if shoot > 0.5:
-                current_time = pygame.time.get_ticks()
+                current_time = self.sim_clock.get_ticks()
                 if current_time - agent.last_attack_time >= AGENT_ATTACK_COOLDOWN:
-                    projectile = Projectile(agent.x, agent.y, shoot_angle, agent.team_id, PROJECTILE_DAMAGE, owner=agent)
-                    self.projectiles.append(projectile)
+                    self.projectiles.spawn(agent.x, agent.y, shoot_angle, agent.team_id, PROJECTILE_DAMAGE, owner=agent)
                     agent.last_attack_time = current_time
             
-            current_time = pygame.time.get_ticks()
+            current_time = self.sim_clock.get_ticks()
             # Livrează mesaje echipei și procesează inbox
             if self.message_bus:
                 agent.inbox = self.message_bus.collect(agent.team_id, current_time, receiving_agent=agent)
@@ -268,7 +312,11 @@ class MicroBattleEnv(AECEnv):
         if self.agent_selection == self.agents[0]:
             self._update_projectiles()
             if self.message_bus:
-                self.message_bus.cleanup(pygame.time.get_ticks())
+                self.message_bus.cleanup(self.sim_clock.get_ticks())
+            self.spatial_grid.index_agents(self.agent_store)
+            self.visibility.update(self.agent_store)
+            # Avansează ceasul simulării cu un pas fix
+            self.sim_clock.tick()
     
     def _calculate_reward(self, agent):
         """Calculează recompensa pentru un agent"""
@@ -288,50 +336,64 @@ class MicroBattleEnv(AECEnv):
     
     def _update_projectiles(self):
         """Actualizează toate proiectilele"""
-        current_time = pygame.time.get_ticks()
-        all_agents = [a for _, a in self.agents_list]
-        
-        for projectile in self.projectiles[:]:
-            projectile.update(current_time)
-            
-            # Verifică coliziuni
-            for agent in all_agents:
-                if projectile.check_collision_with_agent(agent):
-                    break
-            
-            # Verifică coliziuni cu obstacole
-            projectile.check_collision_with_obstacles(self.game_map.obstacles)
-            
-            if not projectile.alive:
-                self.projectiles.remove(projectile)
+        current_time = self.sim_clock.get_ticks()
+        # Coliziunile cu agenții aplică damage; zidurile doar opresc proiectilele
+        self.projectiles.update(current_time, self.game_map)
     
     def render(self):
-        """Rendează environment-ul"""
-        if self.render_mode == "human" and self.screen:
-            self.screen.fill((34, 139, 34))
-            
-            # Desenează harta
-            self.game_map.draw(self.screen)
-            
-            # Desenează proiectile
-            for projectile in self.projectiles:
-                projectile.draw(self.screen)
-            
-            # Desenează agenții
-            for _, agent in self.agents_list:
-                agent.draw(self.screen)
-            
+        """
+        Rendează environment-ul
+
+        Returns:
+            Pentru "rgb_array", frame-ul ca array uint8 (SCREEN_HEIGHT, SCREEN_WIDTH, 3);
+            altfel None
+        """
+        if self.screen is None:
+            return None
+        if self.render_mode == "human":
+            self._draw_frame()
             pygame.display.flip()
+            return None
+
+        # rgb_array: se desenează doar la fiecare render_every runde
+        tick = self.sim_clock.tick_count
+        if self._last_frame is not None and tick - self._last_frame_tick < self.render_every:
+            return self._last_frame
+        self._draw_frame()
+        # O singură copiere: vederea pixels3d (x, y) este transpusă în (y, x) la copiere;
+        # vederea se eliberează imediat, altfel suprafața rămâne blocată pentru blit
+        pixels = pygame.surfarray.pixels3d(self.screen)
+        self._last_frame = pixels.transpose(1, 0, 2).copy()
+        del pixels
+        self._last_frame_tick = tick
+        return self._last_frame
+
+    def _draw_frame(self):
+        """Desenează starea curentă pe suprafața de randare"""
+        self.screen.fill((34, 139, 34))
+        
+        # Desenează harta
+        self.game_map.draw(self.screen)
+        
+        # Desenează proiectile
+        self.projectiles.draw(self.screen)
+        
+        # Desenează agenții; conurile de vedere se compun împreună, într-un singur strat
+        self.los_overlay.begin(self.screen)
+        for _, agent in self.agents_list:
+            agent.draw(self.screen, los_overlay=self.los_overlay)
+        self.los_overlay.draw(self.screen)
     
     def close(self):
         """Închide environment-ul"""
-        if self.screen:
+        if self.render_mode == "human" and self.screen:
             pygame.quit()
+        self.screen = None
 
 # Wrapper pentru a face environment-ul compatibil cu PettingZoo
-def env(game_mode="Survival", render_mode=None):
+def env(game_mode="Survival", render_mode=None, render_every=1):
     """Creează environment-ul PettingZoo"""
-    env = MicroBattleEnv(game_mode, render_mode)
+    env = MicroBattleEnv(game_mode, render_mode, render_every=render_every)
     
     # CaptureStdoutWrapper funcționează doar cu render_mode="human"
     if render_mode == "human":
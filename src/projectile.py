@@ -1,9 +1,10 @@
 import pygame
 import math
 from config import *
+from sim_clock import resolve_clock
 
 class Projectile:
-    def __init__(self, x, y, angle, team_id, damage=PROJECTILE_DAMAGE, owner=None):
+    def __init__(self, x, y, angle, team_id, damage=PROJECTILE_DAMAGE, owner=None, clock=None):
         """
         Inițializează un proiectil
         
@@ -13,6 +14,7 @@ class Projectile:
             team_id: Echipa din care face parte proiectilul
             damage: Damage-ul pe care îl provoacă
             owner: Agentul care a tras proiectilul (pentru tracking statistici)
+            clock: Sursa de timp (SimClock); implicit timpul real pygame
         """
         self.x = x
         self.y = y
@@ -23,7 +25,7 @@ class Projectile:
         self.speed = PROJECTILE_SPEED
         self.size = PROJECTILE_SIZE
         self.alive = True
-        self.creation_time = pygame.time.get_ticks()
+        self.creation_time = resolve_clock(clock).get_ticks()
         self.lifetime = PROJECTILE_LIFETIME
         
         # Calculează velocity-ul bazat pe unghi
@@ -0,0 +1,226 @@
+"""
+Pool vectorizat de proiectile.
+
+Toate proiectilele unui meci stau în array-uri NumPy (poziție, viteză, echipă,
+slot-ul agentului care a tras, momentul expirării, damage). Proiectilele active
+ocupă mereu prefixul [0:count); coada [count:capacity) este lista de slot-uri
+libere refolosite de spawn. La fiecare pas se mută toate proiectilele deodată,
+coliziunile cu agenții se calculează ca o matrice de distanțe proiectil x agent,
+iar cele cu zidurile se caută doar în tile-urile acoperite de fiecare proiectil.
+Proiectilele moarte sunt eliminate prin swap-remove (golurile se umplu cu
+proiectile vii de la sfârșit), fără list.remove.
+"""
+
+import math
+import numpy as np
+import pygame
+from config import *
+from sim_clock import resolve_clock
+
+# Câmp -> dtype pentru fiecare array din pool
+PROJECTILE_FIELDS = {
+    "x": np.float64,
+    "y": np.float64,
+    "velocity_x": np.float64,
+    "velocity_y": np.float64,
+    "team_id": np.int32,
+    "owner": np.int32,       # Slot-ul agentului care a tras (-1 = necunoscut)
+    "expire_time": np.int64,  # Momentul (ms) după care proiectilul expiră
+    "damage": np.float64,
+}
+
+# Distanța de coliziune proiectil - agent
+HIT_RADIUS = PROJECTILE_SIZE + AGENT_SIZE // 2
+
+
+class ProjectilePool:
+    """Array-uri NumPy cu toate proiectilele active ale unui meci"""
+
+    def __init__(self, store, capacity=64, clock=None):
+        """
+        Args:
+            store: AgentStore-ul meciului (agenți țintă și owner-i)
+            capacity: Numărul inițial de slot-uri (crește automat la nevoie)
+            clock: Sursa de timp (SimClock); implicit timpul real pygame
+        """
+        self.store = store
+        self.clock = resolve_clock(clock)
+        self.capacity = max(1, capacity)
+        self.count = 0  # Proiectile active (prefixul array-urilor)
+        self.size = PROJECTILE_SIZE
+        for name, dtype in PROJECTILE_FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, angle, team_id, damage=PROJECTILE_DAMAGE, owner=None):
+        """
+        Adaugă un proiectil nou într-un slot liber
+
+        Args:
+            x, y: Poziția inițială
+            angle: Unghiul de deplasare (în radiani)
+            team_id: Echipa din care face parte proiectilul
+            damage: Damage-ul pe care îl provoacă
+            owner: Agentul care a tras proiectilul (pentru tracking statistici)
+
+        Returns:
+            Indexul proiectilului în pool
+        """
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        i = self.count
+        self.count += 1
+        self.x[i] = x
+        self.y[i] = y
+        self.velocity_x[i] = math.cos(angle) * PROJECTILE_SPEED
+        self.velocity_y[i] = math.sin(angle) * PROJECTILE_SPEED
+        self.team_id[i] = team_id
+        self.owner[i] = owner.slot if owner is not None else -1
+        self.expire_time[i] = self.clock.get_ticks() + PROJECTILE_LIFETIME
+        self.damage[i] = damage
+        return i
+
+    def _grow(self, new_capacity):
+        """Mărește capacitatea păstrând proiectilele active"""
+        for name, dtype in PROJECTILE_FIELDS.items():
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = new_capacity
+
+    def clear(self):
+        """Elimină toate proiectilele"""
+        self.count = 0
+
+    def update(self, current_time, game_map):
+        """
+        Avansează toate proiectilele cu un pas și rezolvă coliziunile
+
+        Damage-ul pe agenți este aplicat aici (ca în Projectile.check_collision_with_agent);
+        damage-ul pe ziduri este lăsat apelantului.
+
+        Args:
+            current_time: Timpul curent al simulării (ms)
+            game_map: Harta (pentru wall_index)
+
+        Returns:
+            (hits, wall_hits): lista de (owner, agent, damage) pentru agenții loviți,
+            în ordinea proiectilelor, și lista de ziduri lovite
+        """
+        n = self.count
+        if n == 0:
+            return [], []
+
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.velocity_x[:n]
+        y += self.velocity_y[:n]
+
+        # Expirat (față de momentul de dinainte de mișcare) sau ieșit din hartă
+        alive = self.expire_time[:n] >= current_time
+        alive &= (x >= 0) & (x <= MAP_WIDTH * TILE_SIZE) & (y >= 0) & (y <= MAP_HEIGHT * TILE_SIZE)
+
+        hits = self._resolve_agent_hits(alive)
+        wall_hits = self._resolve_wall_hits(alive, game_map)
+
+        self._compact(alive)
+        return hits, wall_hits
+
+    def _resolve_agent_hits(self, alive):
+        """Coliziuni proiectil - agent: matrice de distanțe, rezolvată în ordinea proiectilelor"""
+        store = self.store
+        m = store.count
+        if m == 0 or not alive.any():
+            return []
+
+        n = self.count
+        dx = self.x[:n, None] - store.x[None, :m]
+        dy = self.y[:n, None] - store.y[None, :m]
+        candidates = (dx * dx + dy * dy < HIT_RADIUS * HIT_RADIUS)
+        # Doar proiectile vii, agenți vii, din echipa adversă
+        candidates &= alive[:, None] & store.alive[None, :m]
+        candidates &= self.team_id[:n, None] != store.team_id[None, :m]
+
+        hits = []
+        agents = store.agents
+        for i in np.flatnonzero(candidates.any(axis=1)):
+            # Un agent ucis de un proiectil anterior nu mai poate fi lovit
+            for slot in np.flatnonzero(candidates[i]):
+                agent = agents[slot]
+                if agent.alive:
+                    damage = self.damage.item(i)
+                    agent.take_damage(damage)
+                    owner_slot = self.owner.item(i)
+                    owner = agents[owner_slot] if owner_slot >= 0 else None
+                    hits.append((owner, agent, damage))
+                    alive[i] = False
+                    break
+        return hits
+
+    def _resolve_wall_hits(self, alive, game_map):
+        """Coliziuni proiectil - zid: doar tile-urile (cel mult 4) acoperite de fiecare proiectil"""
+        live = np.flatnonzero(alive)
+        if live.size == 0:
+            return []
+
+        # Dreptunghiul proiectilului, trunchiat la întregi ca pygame.Rect: colțul
+        # stânga-sus și cel dreapta-jos, convertite în coordonate de tile
+        corners = np.trunc(np.stack((self.x[live], self.y[live])) - self.size)
+        low = (corners // TILE_SIZE).astype(np.intp)
+        high = ((corners + (self.size * 2 - 1)) // TILE_SIZE).astype(np.intp)
+        limit = np.array([[game_map.width - 1], [game_map.height - 1]])
+        for corner in (low, high):
+            np.minimum(np.maximum(corner, 0, out=corner), limit, out=corner)
+        (tx0, ty0), (tx1, ty1) = low, high
+
+        # Ordinea colțurilor respectă ordinea listei de obstacole (rând cu rând)
+        grid = game_map.wall_index
+        wall_ids = np.stack((grid[ty0, tx0], grid[ty0, tx1], grid[ty1, tx0], grid[ty1, tx1]), axis=1)
+        has_wall = wall_ids >= 0
+
+        wall_hits = []
+        obstacles = game_map.obstacles
+        for row in np.flatnonzero(has_wall.any(axis=1)):
+            for wall_id in wall_ids[row][has_wall[row]]:
+                wall = obstacles[wall_id]
+                # Un zid distrus de un proiectil anterior nu mai oprește proiectilul
+                if wall.alive:
+                    wall_hits.append(wall)
+                    alive[live[row]] = False
+                    break
+        return wall_hits
+
+    def _compact(self, alive):
+        """Elimină proiectilele moarte prin swap-remove (umple golurile cu proiectile vii de la final)"""
+        n = self.count
+        new_count = int(np.count_nonzero(alive))
+        if new_count == n:
+            return
+        holes = np.flatnonzero(~alive[:new_count])
+        movers = new_count + np.flatnonzero(alive[new_count:n])
+        for name in PROJECTILE_FIELDS:
+            array = getattr(self, name)
+            array[holes] = array[movers]
+        self.count = new_count
+
+    def draw(self, screen, camera_x=0, camera_y=0, alpha=1.0):
+        """
+        Desenează proiectilele
+
+        Args:
+            screen: Suprafața pe care se desenează
+            camera_x, camera_y: Deplasarea camerei
+            alpha: Fracțiunea scursă din pasul următor; proiectilele merg în linie
+                   dreaptă, deci poziția anterioară este poziția curentă minus viteza
+        """
+        back = alpha - 1.0
+        for i in range(self.count):
+            x = self.x.item(i) + self.velocity_x.item(i) * back
+            y = self.y.item(i) + self.velocity_y.item(i) * back
+            center = (int(x - camera_x), int(y - camera_y))
+            pygame.draw.circle(screen, PROJECTILE_COLOR, center, self.size)
+            # Desenează un contur negru
+            pygame.draw.circle(screen, (0, 0, 0), center, self.size, 1)
@@ -0,0 +1,89 @@
+"""
+Tabel de rezervări spațiu-timp pentru căutarea cooperativă de drum (WHCA*).
+
+Fiecare echipă are un tabel comun. Când un agent își planifică drumul, primii
+pași (fereastra WHCA_WINDOW) sunt rezervați ca perechi (tile, pas de timp);
+coechipierii care planifică după el evită acele tile-uri în acele momente
+(așteaptă sau ocolesc) și nu pot traversa aceeași muchie în sens opus în
+același pas. După fereastră drumurile nu mai sunt coordonate.
+
+Un pas de timp este timpul în care un agent traversează un tile
+(TILE_SIZE / AGENT_SPEED tick-uri).
+"""
+
+from config import *
+
+# Durata unui pas de timp (ms simulate): traversarea unui tile cu viteza agentului
+WHCA_STEP_MS = TILE_SIZE / AGENT_SPEED * SIM_MS_PER_TICK
+
+
+class ReservationTable:
+    """Rezervările (tile, pas) ale agenților unei echipe"""
+
+    def __init__(self, step_ms=WHCA_STEP_MS):
+        """
+        Args:
+            step_ms: Durata unui pas de timp în milisecunde
+        """
+        self.step_ms = step_ms
+        self._cells = {}  # (nod, pas) -> agent
+        self._edges = {}  # (nod_din, nod_în, pas de sosire) -> agent
+        self._owned = {}  # agent -> (chei celule, chei muchii)
+
+    def __len__(self):
+        return len(self._cells)
+
+    def step_at(self, time_ms):
+        """Pasul de timp care conține momentul dat"""
+        return int(time_ms // self.step_ms)
+
+    def _holder(self, owner, agent):
+        """True dacă rezervarea aparține altui agent, încă în viață"""
+        return owner is not None and owner is not agent and owner.alive
+
+    def is_free(self, node, step, agent=None):
+        """True dacă tile-ul nu este rezervat de alt agent la pasul dat"""
+        return not self._holder(self._cells.get((node, step)), agent)
+
+    def can_move(self, from_node, to_node, step, agent=None):
+        """
+        True dacă agentul poate ajunge din from_node în to_node la pasul dat:
+        to_node este liber și niciun alt agent nu face mutarea inversă (schimb de locuri)
+        """
+        if self._holder(self._cells.get((to_node, step)), agent):
+            return False
+        return from_node == to_node or not self._holder(self._edges.get((to_node, from_node, step)), agent)
+
+    def reserve(self, agent, nodes, start_step):
+        """
+        Înlocuiește rezervările agentului cu drumul dat
+
+        Args:
+            agent: Agentul care rezervă
+            nodes: Nodurile ocupate la pașii start_step, start_step + 1, ...
+            start_step: Pasul primului nod (poziția curentă)
+        """
+        self.release(agent)
+        cells, edges = [], []
+        for i, node in enumerate(nodes):
+            key = (node, start_step + i)
+            self._cells[key] = agent
+            cells.append(key)
+            if i and nodes[i - 1] != node:
+                key = (nodes[i - 1], node, start_step + i)
+                self._edges[key] = agent
+                edges.append(key)
+        self._owned[agent] = (cells, edges)
+
+    def release(self, agent):
+        """Șterge toate rezervările agentului"""
+        owned = self._owned.pop(agent, None)
+        if owned is None:
+            return
+        cells, edges = owned
+        for key in cells:
+            if self._cells.get(key) is agent:
+                del self._cells[key]
+        for key in edges:
+            if self._edges.get(key) is agent:
+                del self._edges[key]
@@ -0,0 +1,198 @@
+"""
+Index spațial pe grilă uniformă pentru interogări de vecinătate.
+
+Punctele (agenți din AgentStore sau expeditori de mesaje) sunt grupate pe celule
+de SPATIAL_CELL_SIZE pixeli, în format CSR: indicii punctelor sortați după celulă
+plus offset-ul de început al fiecărei celule. O interogare citește doar celulele
+atinse de cercul/dreptunghiul căutat, deci costul depinde de densitatea locală,
+nu de populația totală.
+
+Pozițiile, echipa și starea alive sunt citite din array-urile primite la rebuild
+(pentru agenți - vederi direct în AgentStore), deci filtrele folosesc mereu
+valorile curente. Doar apartenența la celule este calculată la rebuild; `slack`
+lărgește căutarea pentru punctele care s-au mișcat de atunci.
+"""
+
+import numpy as np
+from config import *
+
+# Sub acest număr de candidați filtrarea se face element cu element: pentru
+# câțiva agenți overhead-ul apelurilor NumPy depășește costul buclei
+VECTORIZE_MIN_CANDIDATES = 32
+
+
+class SpatialGrid:
+    """Grilă uniformă de celule cu indicii punctelor din fiecare celulă"""
+
+    def __init__(self, width=MAP_WIDTH * TILE_SIZE, height=MAP_HEIGHT * TILE_SIZE,
+                 cell_size=SPATIAL_CELL_SIZE, slack=0.0):
+        """
+        Args:
+            width, height: Dimensiunea zonei acoperite (pixels)
+            cell_size: Latura unei celule (pixels)
+            slack: Distanța maximă parcursă de un punct între rebuild-uri (pixels)
+        """
+        self.cell_size = cell_size
+        self.cols = max(1, int(np.ceil(width / cell_size)))
+        self.rows = max(1, int(np.ceil(height / cell_size)))
+        self.slack = slack
+
+        self.x = self.y = self.team_id = self.alive = None
+        self.items = None  # Obiectele corespunzătoare indicilor (ex. agenții store-ului)
+        # CSR: indicii punctelor sortați după celulă și începutul fiecărei celule
+        # (liste Python - feliile mici sunt mai ieftine decât pe array-uri)
+        self.order = []
+        self.cell_start = [0] * (self.rows * self.cols + 1)
+
+    def rebuild(self, x, y, team_id=None, alive=None, items=None):
+        """
+        Reconstruiește bucket-urile din pozițiile curente
+
+        Args:
+            x, y: Array-uri cu pozițiile punctelor
+            team_id: Array cu echipa fiecărui punct (pentru filtrele pe echipă)
+            alive: Array bool; punctele cu False sunt ignorate de interogări
+            items: Lista de obiecte indexată la fel ca array-urile
+        """
+        self.x = x
+        self.y = y
+        self.team_id = team_id
+        self.alive = alive
+        self.items = items
+
+        cells = self._cell_of(x, y)
+        counts = np.bincount(cells, minlength=self.rows * self.cols)
+        self.order = np.argsort(cells, kind="stable").tolist()
+        self.cell_start = [0] + np.cumsum(counts).tolist()
+
+    def refresh(self):
+        """Recalculează celulele din valorile curente ale acelorași array-uri"""
+        if self.x is not None:
+            self.rebuild(self.x, self.y, self.team_id, self.alive, self.items)
+
+    def index_agents(self, store):
+        """Reconstruiește grila din toți agenții unui AgentStore"""
+        self.rebuild(store.view("x"), store.view("y"), store.view("team_id"),
+                     store.view("alive"), store.agents)
+
+    def _cell_of(self, x, y):
+        """Indexul celulei pentru fiecare punct (punctele din afara zonei sunt lipite de margine)"""
+        col = np.clip((np.asarray(x) // self.cell_size).astype(np.intp), 0, self.cols - 1)
+        row = np.clip((np.asarray(y) // self.cell_size).astype(np.intp), 0, self.rows - 1)
+        return row * self.cols + col
+
+    def _candidates(self, left, top, right, bottom):
+        """Indicii punctelor din celulele care acoperă dreptunghiul (lărgit cu slack), crescător"""
+        cs = self.cell_size
+        col0 = min(max(int((left - self.slack) // cs), 0), self.cols - 1)
+        col1 = min(max(int((right + self.slack) // cs), 0), self.cols - 1)
+        row0 = min(max(int((top - self.slack) // cs), 0), self.rows - 1)
+        row1 = min(max(int((bottom + self.slack) // cs), 0), self.rows - 1)
+
+        # Celulele unui rând sunt consecutive în CSR: o singură felie pe rând
+        order, start = self.order, self.cell_start
+        candidates = []
+        for row in range(row0, row1 + 1):
+            base = row * self.cols
+            candidates.extend(order[start[base + col0]:start[base + col1 + 1]])
+        candidates.sort()
+        return candidates
+
+    def _accept(self, index, team_id, enemy_of):
+        """Verifică un punct: în viață și din echipa cerută (sau din altă echipă decât enemy_of)"""
+        if self.alive is not None and not self.alive.item(index):
+            return False
+        if team_id is not None and self.team_id.item(index) != team_id:
+            return False
+        if enemy_of is not None and self.team_id.item(index) == enemy_of:
+            return False
+        return True
+
+    def _team_mask(self, candidates, team_id, enemy_of):
+        """Varianta vectorizată a _accept pentru un array de candidați"""
+        mask = np.ones(candidates.size, dtype=bool)
+        if self.alive is not None:
+            mask &= self.alive[candidates]
+        if team_id is not None:
+            mask &= self.team_id[candidates] == team_id
+        if enemy_of is not None:
+            mask &= self.team_id[candidates] != enemy_of
+        return mask
+
+    def query_radius(self, x, y, radius, team_id=None, enemy_of=None):
+        """
+        Punctele aflate la cel mult `radius` de (x, y)
+
+        Args:
+            x, y: Centrul căutării
+            radius: Raza căutării (inclusiv)
+            team_id: Doar puncte din această echipă
+            enemy_of: Doar puncte din alte echipe decât aceasta
+
+        Returns:
+            Lista indicilor punctelor, în ordine crescătoare
+        """
+        if self.x is None:
+            return []
+        candidates = self._candidates(x - radius, y - radius, x + radius, y + radius)
+        radius_sq = radius * radius
+
+        if len(candidates) >= VECTORIZE_MIN_CANDIDATES:
+            candidates = np.array(candidates, dtype=np.intp)
+            dx = self.x[candidates] - x
+            dy = self.y[candidates] - y
+            mask = self._team_mask(candidates, team_id, enemy_of) & (dx * dx + dy * dy <= radius_sq)
+            return candidates[mask].tolist()
+
+        found = []
+        xs, ys = self.x, self.y
+        for i in candidates:
+            if self._accept(i, team_id, enemy_of):
+                dx = xs.item(i) - x
+                dy = ys.item(i) - y
+                if dx * dx + dy * dy <= radius_sq:
+                    found.append(i)
+        return found
+
+    def query_rect(self, rect, team_id=None, enemy_of=None):
+        """
+        Punctele din interiorul unui dreptunghi (aceeași convenție ca Rect.collidepoint)
+
+        Returns:
+            Lista indicilor punctelor, în ordine crescătoare
+        """
+        if self.x is None:
+            return []
+        left, top = rect.left, rect.top
+        right, bottom = rect.right, rect.bottom
+        found = []
+        for i in self._candidates(left, top, right, bottom):
+            if self._accept(i, team_id, enemy_of):
+                px = self.x.item(i)
+                py = self.y.item(i)
+                if left <= px < right and top <= py < bottom:
+                    found.append(i)
+        return found
+
+    def nearest(self, x, y, k=1, max_radius=None, team_id=None, enemy_of=None):
+        """
+        Cele mai apropiate k puncte de (x, y)
+
+        Dublează raza căutării până găsește cel puțin k puncte; toate punctele
+        din afara razei sunt mai departe decât cele găsite.
+
+        Returns:
+            Lista indicilor punctelor, sortați după distanță
+        """
+        if self.x is None or k <= 0:
+            return []
+        limit = max_radius if max_radius is not None else float(self.cell_size * (self.cols + self.rows))
+        radius = min(self.cell_size, limit)
+        while True:
+            found = self.query_radius(x, y, radius, team_id, enemy_of)
+            if len(found) >= k or radius >= limit:
+                break
+            radius = min(radius * 2, limit)
+        # Sortarea este stabilă: la distanțe egale rămâne primul indicele mai mic
+        found.sort(key=lambda i: (self.x.item(i) - x) ** 2 + (self.y.item(i) - y) ** 2)
+        return found[:k]
@@ -1,11 +1,12 @@
-import pygame
 from collections import defaultdict
+from sim_clock import resolve_clock
 
 
 class StatisticsTracker:
     """Tracker pentru statistici generale și specifice modurilor de joc"""
    
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = resolve_clock(clock)  # Sursa de timp (SimClock sau timp real)
         self.reset()
    
     def reset(self):
@@ -57,22 +58,22 @@ class StatisticsTracker:
             'current_carriers': {}  # {agent_id: capture_time}
         }
        
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.clock.get_ticks()
    
     def on_agent_spawn(self, agent):
         """Apelat când un agent spawn-uiește"""
         agent_id = id(agent)
-        self.agent_stats[agent_id]['spawn_time'] = pygame.time.get_ticks()
+        self.agent_stats[agent_id]['spawn_time'] = self.clock.get_ticks()
         self.agent_stats[agent_id]['last_position'] = (agent.x, agent.y)
         self.agent_stats[agent_id]['team_id'] = agent.team_id  # Stocăm team_id
    
     def on_agent_death(self, agent, killer=None):
         """Apelat când un agent moare"""
         agent_id = id(agent)
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
        
         # Actualizează timpul de viață
-        if self.agent_stats[agent_id]['spawn_time']:
+        if self.agent_stats[agent_id]['spawn_time'] is not None:
             time_alive = (current_time - self.agent_stats[agent_id]['spawn_time']) / 1000.0
             self.agent_stats[agent_id]['time_alive'] += time_alive
        
@@ -256,14 +257,14 @@ class StatisticsTracker:
             return self.team_stats[team_id]['final_dps']
        
         # Altfel calculează în timp real
-        elapsed = (pygame.time.get_ticks() - self.start_time) / 1000.0
+        elapsed = (self.clock.get_ticks() - self.start_time) / 1000.0
         if elapsed == 0:
             return 0.0
         return self.team_stats[team_id]['total_damage_dealt'] / elapsed
    
     def freeze_dps(self):
         """Îngheață valorile DPS când jocul se termină"""
-        elapsed = (pygame.time.get_ticks() - self.start_time) / 1000.0
+        elapsed = (self.clock.get_ticks() - self.start_time) / 1000.0
         for team_id in [0, 1]:
             if elapsed > 0:
                 self.team_stats[team_id]['final_dps'] = self.team_stats[team_id]['total_damage_dealt'] / elapsed
@@ -273,6 +274,23 @@ class StatisticsTracker:
     def get_team_total_shots(self, team_id):
         """Returnează totalul de gloanțe trase de echipă"""
         return self.team_stats[team_id]['total_shots_fired']
+   
+    def get_team_summary(self, team_id):
+        """Returnează agregatele unei echipe într-un dicționar (pentru rapoarte batch)"""
+        team = self.team_stats[team_id]
+        shots_hit = sum(stats['shots_hit'] for stats in self.agent_stats.values()
+                        if stats['team_id'] == team_id)
+        return {
+            'damage_dealt': team['total_damage_dealt'],
+            'damage_taken': team['total_damage_taken'],
+            'kills': team['total_kills'],
+            'deaths': team['total_deaths'],
+            'shots_fired': team['total_shots_fired'],
+            'shots_hit': shots_hit,
+            'dps': self.get_team_dps(team_id),
+            'avg_time_alive': self.get_team_avg_time_alive(team_id),
+            'avg_distance': self.get_team_avg_distance(team_id)
+        }
 
 
 
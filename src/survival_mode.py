@@ -1,13 +1,17 @@
 import pygame
 from config import *
+from sim_clock import resolve_clock
+from text_cache import resolve_text_cache
 
 
 class SurvivalMode:
-    def __init__(self, agents, statistics_tracker=None):
+    def __init__(self, agents, statistics_tracker=None, clock=None, text_cache=None):
         self.agents = agents
         self.statistics_tracker = statistics_tracker
+        self.clock = resolve_clock(clock)  # Sursa de timp (SimClock sau timp real)
+        self.text_cache = resolve_text_cache(text_cache)  # Fonturi și texte randate
         self.time_limit = SURVIVAL_TIME_LIMIT
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.clock.get_ticks()
         self.end_time = None  # Timpul când jocul s-a terminat
         self.game_over = False
         self.winner = None
@@ -18,7 +22,7 @@ class SurvivalMode:
             return
        
         # Verifică timpul
-        elapsed_time = (pygame.time.get_ticks() - self.start_time) / 1000
+        elapsed_time = (self.clock.get_ticks() - self.start_time) / 1000
         if elapsed_time >= self.time_limit:
             self.end_game_by_time()
             return
@@ -37,7 +41,7 @@ class SurvivalMode:
             self.game_over = True
             # Salvează momentul când jocul s-a terminat pentru timer
             if self.end_time is None:
-                self.end_time = pygame.time.get_ticks()
+                self.end_time = self.clock.get_ticks()
             # Îngheață statisticile DPS
             if self.statistics_tracker:
                 self.statistics_tracker.freeze_dps()
@@ -56,7 +60,7 @@ class SurvivalMode:
         self.game_over = True
         # Salvează momentul când jocul s-a terminat pentru timer
         if self.end_time is None:
-            self.end_time = pygame.time.get_ticks()
+            self.end_time = self.clock.get_ticks()
         # Îngheață statisticile DPS
         if self.statistics_tracker:
             self.statistics_tracker.freeze_dps()
@@ -67,22 +71,19 @@ class SurvivalMode:
         if self.game_over and self.end_time is not None:
             elapsed = (self.end_time - self.start_time) / 1000
         else:
-            elapsed = (pygame.time.get_ticks() - self.start_time) / 1000
+            elapsed = (self.clock.get_ticks() - self.start_time) / 1000
         return max(0, self.time_limit - elapsed)
    
     def draw_ui(self, screen):
         """Desenează UI-ul modului Survival"""
-        font = pygame.font.Font(None, 36)
-        small_font = pygame.font.Font(None, 24)
        
         # Timp rămas (pe mijloc, ca la celelalte moduri)
-        time_text = font.render(f"Time: {int(self.get_remaining_time())}s", True, (255, 255, 255))
+        time_text = self.text_cache.render(36, f"Time: {int(self.get_remaining_time())}s", (255, 255, 255))
         screen.blit(time_text, (SCREEN_WIDTH // 2 - 60, 10))
        
         # Statistici pentru fiecare echipă pe părțile laterale
         if self.statistics_tracker:
             y_offset = 50
-            small_font_stats = pygame.font.Font(None, 20)
            
             for team_id in [0, 1]:
                 # Număr de jucători în viață
@@ -94,37 +95,37 @@ class SurvivalMode:
                         teams_alive[agent.team_id] += 1
                
                 players_alive = teams_alive.get(team_id, 0)
-                text = small_font_stats.render(f"Players alive: {players_alive}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Players alive: {players_alive}", TEAM_COLORS[team_id])
                 x_pos = 10 if team_id == 0 else SCREEN_WIDTH - 200
                 screen.blit(text, (x_pos, y_offset))
                
                 # DPS
                 dps = self.statistics_tracker.get_team_dps(team_id)
-                text = small_font_stats.render(f"DPS: {dps:.1f}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"DPS: {dps:.1f}", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 20))
                
                 # Avg time alive
                 avg_time_alive = self.statistics_tracker.get_team_avg_time_alive(team_id)
-                text = small_font_stats.render(f"Avg time alive: {avg_time_alive:.1f}s", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Avg time alive: {avg_time_alive:.1f}s", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 40))
                
                 # Avg distance traveled
                 avg_distance = self.statistics_tracker.get_team_avg_distance(team_id)
-                text = small_font_stats.render(f"Avg distance: {avg_distance:.0f}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Avg distance: {avg_distance:.0f}", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 60))
                
                 # Total bullets fired
                 total_shots = self.statistics_tracker.get_team_total_shots(team_id)
-                text = small_font_stats.render(f"Bullets fired: {total_shots}", True, TEAM_COLORS[team_id])
+                text = self.text_cache.render(20, f"Bullets fired: {total_shots}", TEAM_COLORS[team_id])
                 screen.blit(text, (x_pos, y_offset + 80))
        
         # Mesaj de victorie
         if self.game_over:
-            game_over_text = font.render("GAME OVER!", True, (255, 255, 0))
+            game_over_text = self.text_cache.render(36, "GAME OVER!", (255, 255, 0))
             screen.blit(game_over_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 50))
            
             if self.winner is not None:
-                winner_text = font.render(f"Team {self.winner + 1} Wins!", True, TEAM_COLORS[self.winner])
+                winner_text = self.text_cache.render(36, f"Team {self.winner + 1} Wins!", TEAM_COLORS[self.winner])
                 screen.blit(winner_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2))
 
 
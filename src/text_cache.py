@@ -0,0 +1,84 @@
+"""
+Cache pentru fonturi și textele randate ale interfeței.
+
+Interfața modurilor de joc și meniul creau fonturile la fiecare frame și
+randau din nou fiecare etichetă, deși valorile se schimbă de câteva ori pe
+secundă. TextCache încarcă fiecare font o singură dată și păstrează ultimele
+suprafețe randate, indexate după (font, text, culoare); cele nefolosite de
+cel mai mult timp sunt eliminate (LRU).
+"""
+
+from collections import OrderedDict
+import pygame
+
+# Numărul maxim de suprafețe text păstrate în cache
+TEXT_CACHE_SIZE = 256
+
+
+class TextCache:
+    """Fonturi încărcate o singură dată și suprafețe text memorate (LRU)"""
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Args:
+            max_size: Numărul maxim de suprafețe păstrate
+        """
+        self.max_size = max_size
+        self._fonts = {}  # (nume, mărime) -> pygame.font.Font
+        self._surfaces = OrderedDict()  # (nume, mărime, text, culoare) -> Surface
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def font(self, size, name=None):
+        """Fontul cerut, încărcat la prima folosire"""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, size, text, color, name=None):
+        """
+        Suprafața textului (antialiasing activ), randată doar la prima cerere
+
+        Args:
+            size: Mărimea fontului
+            text: Textul de afișat
+            color: Culoarea textului (RGB)
+            name: Fișierul fontului (None = fontul implicit pygame)
+
+        Returns:
+            pygame.Surface cu textul; nu trebuie modificată (este partajată)
+        """
+        key = (name, size, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, name).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Golește suprafețele memorate (fonturile rămân încărcate)"""
+        self._surfaces.clear()
+
+
+# Instanță partajată pentru interfețele fără cache explicit
+_shared_text_cache = TextCache()
+
+
+def resolve_text_cache(text_cache=None):
+    """Returnează cache-ul primit sau cache-ul partajat implicit"""
+    return text_cache if text_cache is not None else _shared_text_cache
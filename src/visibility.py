@@ -0,0 +1,87 @@
+"""
+Matricea de vizibilitate a unui meci, calculată o dată pe tick.
+
+Pentru toate perechile (observator, țintă) din AgentStore se calculează într-o
+singură trecere vectorizată filtrul de rază și de con de vedere. Conul se
+verifică prin produs scalar (cos(unghi) >= cos(jumătatea conului)), fără atan2
+și fără normalizarea unghiurilor. Doar perechile rămase sunt verificate cu
+raycast pe hartă. Rezultatul este o matrice bool partajată: agenții își citesc
+țintele vizibile din rândul lor, iar environment-ul RL o folosește pentru
+observații.
+"""
+
+import math
+import numpy as np
+from config import *
+
+
+class VisibilitySystem:
+    """Matrice visible[observator, țintă] pe slot-urile unui AgentStore"""
+
+    def __init__(self, game_map=None, los_range=AGENT_LOS_RANGE, los_angle=AGENT_LOS_ANGLE):
+        """
+        Args:
+            game_map: Harta ale cărei ziduri blochează vederea (None = fără ziduri)
+            los_range: Raza de vedere (pixels)
+            los_angle: Deschiderea conului de vedere (grade)
+        """
+        self.game_map = game_map
+        self.range_sq = los_range * los_range
+        self.cos_half_angle = math.cos(math.radians(los_angle / 2))
+        self.visible = np.zeros((0, 0), dtype=bool)
+        self.rays_cast = 0  # Raycast-uri făcute la ultimul update (pentru profilare)
+
+    def update(self, store):
+        """
+        Recalculează matricea din pozițiile și orientările curente
+
+        Args:
+            store: AgentStore-ul meciului
+        """
+        m = store.count
+        x = store.x[:m]
+        y = store.y[:m]
+        team_id = store.team_id[:m]
+        alive = store.alive[:m]
+
+        # Vectorul observator -> țintă pentru fiecare pereche
+        dx = x[None, :] - x[:, None]
+        dy = y[None, :] - y[:, None]
+        dist_sq = dx * dx + dy * dy
+
+        # Doar observatori vii și ținte vii din altă echipă, în rază
+        mask = alive[:, None] & alive[None, :]
+        mask &= team_id[:, None] != team_id[None, :]
+        mask &= dist_sq <= self.range_sq
+
+        # Conul de vedere: proiecția pe direcția privirii comparată cu distanța
+        facing = store.facing_angle[:m]
+        dot = np.cos(facing)[:, None] * dx + np.sin(facing)[:, None] * dy
+        mask &= dot >= self.cos_half_angle * np.sqrt(dist_sq)
+
+        # Raycast doar pe perechile care au trecut de filtrele ieftine
+        observers, targets = np.nonzero(mask)
+        self.rays_cast = observers.size
+        if self.game_map is not None:
+            raycast = self.game_map.raycast
+            for i, j in zip(observers.tolist(), targets.tolist()):
+                if raycast(x.item(i), y.item(i), x.item(j), y.item(j)) is not None:
+                    mask[i, j] = False
+
+        self.visible = mask
+
+    def covers(self, slot, obstacles):
+        """Verifică dacă matricea poate răspunde pentru observatorul `slot` și lista de obstacole dată"""
+        if slot >= self.visible.shape[0]:
+            return False
+        if self.game_map is None:
+            return not obstacles
+        return obstacles is self.game_map.obstacles
+
+    def can_see(self, observer_slot, target_slot):
+        """True dacă observatorul vedea ținta la ultimul update"""
+        return bool(self.visible[observer_slot, target_slot])
+
+    def visible_targets(self, slot):
+        """Slot-urile țintelor văzute de observatorul `slot`, în ordine crescătoare"""
+        return np.flatnonzero(self.visible[slot]).tolist()
@@ -10,6 +10,7 @@ import math
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from agent import Agent
+from game_map import GameMap
 from config import *
 
 
@@ -200,5 +201,44 @@ class TestAgentRoles(unittest.TestCase):
         self.assertIsNone(agent.role)
 
 
+
+class TestAgentLineOfSight(unittest.TestCase):
+    """Test line of sight through the map grid"""
+    
+    def setUp(self):
+        """Set up a map with border walls and one interior wall at tile (10, 8)"""
+        self.game_map = GameMap("Survival")
+        self.game_map.tiles = [[1 if x in (0, MAP_WIDTH - 1) or y in (0, MAP_HEIGHT - 1) else 0
+                                for x in range(MAP_WIDTH)] for y in range(MAP_HEIGHT)]
+        self.game_map.tiles[8][10] = 1
+        self.game_map.create_obstacle_walls()
+        self.wall_y = 8.5 * TILE_SIZE
+    
+    def test_visible_in_open(self):
+        """Test an enemy in the cone with no wall in between is visible"""
+        agent = Agent(100, 100, 0, game_map=self.game_map)
+        agent.facing_angle = 0
+        enemy = Agent(250, 100, 1)
+        
+        self.assertTrue(agent.is_in_line_of_sight(enemy, self.game_map.obstacles))
+    
+    def test_wall_blocks_sight(self):
+        """Test a wall between the agents blocks sight"""
+        agent = Agent(9 * TILE_SIZE - 40, self.wall_y, 0, game_map=self.game_map)
+        agent.facing_angle = 0
+        enemy = Agent(12 * TILE_SIZE, self.wall_y, 1)
+        
+        self.assertFalse(agent.is_in_line_of_sight(enemy, self.game_map.obstacles))
+    
+    def test_obstacle_list_without_map(self):
+        """Test agents without a map check the given obstacle list"""
+        agent = Agent(9 * TILE_SIZE - 40, self.wall_y, 0)
+        agent.facing_angle = 0
+        enemy = Agent(12 * TILE_SIZE, self.wall_y, 1)
+        
+        self.assertFalse(agent.is_in_line_of_sight(enemy, self.game_map.obstacles))
+        self.assertTrue(agent.is_in_line_of_sight(enemy, []))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit tests for the structure-of-arrays agent store
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from agent_store import AgentStore
+from agent import Agent
+from config import *
+
+
+class TestAgentStore(unittest.TestCase):
+    """Test AgentStore allocation and population views"""
+
+    def test_allocate_grows_capacity(self):
+        """Test slots keep their data when the store grows"""
+        store = AgentStore(capacity=2)
+        agents = [Agent(10 * i, 20 * i, i % 2, store=store) for i in range(5)]
+
+        self.assertEqual(store.count, 5)
+        self.assertGreaterEqual(store.capacity, 5)
+        self.assertEqual([agent.slot for agent in agents], [0, 1, 2, 3, 4])
+        self.assertEqual(store.view("x").tolist(), [0, 10, 20, 30, 40])
+        self.assertIs(store.agents[3], agents[3])
+
+    def test_agent_reads_and_writes_store(self):
+        """Test agent attributes are views over the store arrays"""
+        store = AgentStore()
+        agent = Agent(100, 200, 1, store=store)
+
+        agent.x = 150
+        store.y[agent.slot] = 250
+
+        self.assertEqual(store.x[agent.slot], 150)
+        self.assertEqual(agent.y, 250)
+        self.assertIsInstance(agent.y, float)
+        self.assertIsInstance(agent.alive, bool)
+
+    def test_positions(self):
+        """Test positions returns an (N, 2) array"""
+        store = AgentStore()
+        Agent(1, 2, 0, store=store)
+        Agent(3, 4, 1, store=store)
+
+        self.assertEqual(store.positions().tolist(), [[1, 2], [3, 4]])
+
+    def test_alive_queries(self):
+        """Test alive slot and team count queries skip dead agents"""
+        store = AgentStore()
+        agents = [Agent(0, 0, team, store=store) for team in [0, 0, 1, 1]]
+        agents[1].alive = False
+
+        self.assertEqual(store.alive_slots().tolist(), [0, 2, 3])
+        self.assertEqual(store.alive_slots(team_id=1).tolist(), [2, 3])
+        self.assertEqual(store.team_alive_counts(), {0: 1, 1: 2})
+
+    def test_standalone_agent_has_private_store(self):
+        """Test agents created without a store still work independently"""
+        agent1 = Agent(0, 0, 0)
+        agent2 = Agent(5, 5, 1)
+
+        self.assertIsNot(agent1.store, agent2.store)
+        self.assertEqual(agent2.x, 5)
+
+
+    def test_interpolated_positions(self):
+        """Test drawn positions blend the last two steps and snap on teleports"""
+        store = AgentStore()
+        walker = Agent(0, 0, 0, store=store)
+        respawned = Agent(0, 0, 1, store=store)
+
+        self.assertEqual(store.interpolated_positions(0.5).tolist(), [[0, 0], [0, 0]])
+        store.snapshot_positions()
+        walker.x = 4
+        respawned.x = TILE_SIZE * 10
+
+        self.assertEqual(store.interpolated_positions(0.25).tolist(), [[1, 0], [TILE_SIZE * 10, 0]])
+        self.assertEqual(store.interpolated_positions(1.0).tolist(), store.positions().tolist())
+
+if __name__ == '__main__':
+    unittest.main()
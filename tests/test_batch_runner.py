@@ -0,0 +1,94 @@
+"""
+Unit tests for headless batch runner
+"""
+import unittest
+import sys
+import os
+import io
+import json
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batch_runner import collect_match_result, _write_results, parse_args
+from main import Game
+
+
+class TestHeadlessGame(unittest.TestCase):
+    """Test Game construction without a display"""
+
+    def test_headless_game_has_no_screen(self):
+        """Test headless game does not open a window"""
+        game = Game("Survival", headless=True)
+
+        self.assertIsNone(game.screen)
+        self.assertTrue(game.headless)
+
+    def test_headless_game_advances_simulated_time(self):
+        """Test update advances the simulation clock"""
+        game = Game("King of the Hill", headless=True)
+
+        for _ in range(10):
+            game.update()
+
+        self.assertEqual(game.sim_clock.tick_count, 10)
+
+
+class TestMatchResult(unittest.TestCase):
+    """Test per-match result collection"""
+
+    def test_result_fields(self):
+        """Test result contains winner, duration and team aggregates"""
+        game = Game("King of the Hill", headless=True)
+        for _ in range(5):
+            game.update()
+        game.game_mode.end_game_by_time()
+
+        result = collect_match_result(game, 3)
+
+        self.assertEqual(result["match"], 3)
+        self.assertEqual(result["mode"], "King of the Hill")
+        self.assertIn("winner", result)
+        self.assertGreaterEqual(result["duration_s"], 0)
+        self.assertIn("0", result["teams"])
+        self.assertIn("shots_fired", result["teams"]["1"])
+        self.assertIn("zone_time", result)
+
+    def test_result_is_json_serializable(self):
+        """Test result can be written as a JSON line"""
+        game = Game("Capture the Flag", headless=True)
+        game.game_mode.end_game_by_time()
+
+        line = json.dumps(collect_match_result(game, 0))
+
+        self.assertIn("scores", json.loads(line))
+
+    def test_write_results_summary(self):
+        """Test results are streamed and summarised"""
+        results = [{"winner": 0, "duration_s": 10.0}, {"winner": None, "duration_s": 20.0}]
+        summary = {"matches": 0, "wins": {0: 0, 1: 0}, "draws": 0, "total_duration_s": 0.0}
+        output = io.StringIO()
+
+        _write_results(results, output, summary)
+
+        self.assertEqual(len(output.getvalue().splitlines()), 2)
+        self.assertEqual(summary["matches"], 2)
+        self.assertEqual(summary["wins"][0], 1)
+        self.assertEqual(summary["draws"], 1)
+        self.assertAlmostEqual(summary["total_duration_s"], 30.0)
+
+
+class TestBatchArguments(unittest.TestCase):
+    """Test command line parsing"""
+
+    def test_parse_args(self):
+        """Test mode, matches and workers are parsed"""
+        args = parse_args(["--mode", "King of the Hill", "--matches", "5000", "--workers", "4"])
+
+        self.assertEqual(args.mode, "King of the Hill")
+        self.assertEqual(args.matches, 5000)
+        self.assertEqual(args.workers, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
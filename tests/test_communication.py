@@ -266,6 +266,22 @@ class TestLimitedCommunication(unittest.TestCase):
         
         self.assertEqual(len(messages), 1)
 
+    
+    def test_limited_team_indexed_once_per_tick(self):
+        """Test a LIMITED team gets nearby messages from before and after the per-tick index rebuild"""
+        self.bus.set_team_communication_modes({0: "LIMITED"})
+        receiver = Agent(120, 120, 0)
+        for i, x in enumerate([100, 900]):
+            self.bus.publish(Message(f"old_{i}", 0, "ENEMY_SPOTTED", {}, self.current_time, sender_x=x, sender_y=100))
+        self.bus.cleanup(self.current_time)
+        for i, x in enumerate([110, 800]):
+            self.bus.publish(Message(f"new_{i}", 0, "ENEMY_SPOTTED", {}, self.current_time, sender_x=x, sender_y=100))
+        
+        messages = self.bus.collect(0, self.current_time, receiving_agent=receiver)
+        
+        # Publishing does not rebuild the index; only cleanup (once per tick) does
+        self.assertEqual(self.bus._indexed_count, 2)
+        self.assertEqual([m.sender_id for m in messages], ["old_0", "new_0"])
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,129 @@
+"""
+Unit tests for shared goal flow fields
+"""
+import unittest
+import sys
+import os
+
+import pygame
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from flow_field import FlowField, FlowFieldCache
+from pathfinding import astar, octile_distance
+from game_map import GameMap
+from match_rng import MatchRng
+from agent import Agent
+from config import *
+
+
+class TestFlowField(unittest.TestCase):
+    """Test integration costs, directions and cache invalidation"""
+
+    def setUp(self):
+        """Set up a generated map and a goal tile"""
+        self.game_map = GameMap("King of the Hill", rng=MatchRng(6))
+        self.nav = self.game_map.nav_grid
+        self.goal = next((x, y) for y in range(MAP_HEIGHT // 2, MAP_HEIGHT) for x in range(MAP_WIDTH // 2, MAP_WIDTH)
+                         if self.nav.is_walkable(x, y))
+        self.field = FlowField(self.nav, [self.nav.node(*self.goal)])
+
+    def test_costs_match_astar(self):
+        """Test integration costs equal A* path costs"""
+        for y in range(MAP_HEIGHT):
+            for x in range(MAP_WIDTH):
+                if not self.nav.is_walkable(x, y):
+                    continue
+                path, reached = astar(self.nav, (x, y), self.goal, max_expansions=MAP_WIDTH * MAP_HEIGHT)
+                cost = self.field.cost[self.nav.node(x, y)]
+                if not reached:
+                    self.assertEqual(cost, float('inf'))
+                    continue
+                expected = sum(octile_distance(a, b) for a, b in zip([(x, y)] + path, path))
+                self.assertAlmostEqual(cost, expected)
+
+    def test_directions_lead_to_goal(self):
+        """Test following next waypoints from any reachable tile ends at the goal"""
+        for node, cost in enumerate(self.field.cost):
+            if cost == float('inf'):
+                continue
+            steps = 0
+            while self.field.next_node[node] >= 0:
+                node = self.field.next_node[node]
+                steps += 1
+                self.assertLess(steps, MAP_WIDTH * MAP_HEIGHT)
+            self.assertEqual(self.nav.tile(node), self.goal)
+
+    def test_waypoint_at_goal_is_none(self):
+        """Test a point inside the goal tile has no next waypoint"""
+        x, y = self.goal
+        self.assertIsNone(self.field.next_waypoint(x * TILE_SIZE + 5, y * TILE_SIZE + 5))
+
+    def test_cache_reuses_and_repairs(self):
+        """Test the cache keeps the same field and repairs it when a wall is destroyed"""
+        cache = FlowFieldCache(self.nav)
+        rect = pygame.Rect(10 * TILE_SIZE, 7 * TILE_SIZE, 3 * TILE_SIZE, 3 * TILE_SIZE)
+        first = cache.to_rect(rect)
+
+        self.assertIs(cache.to_rect(rect), first)
+        self.assertEqual(len(first.goal_nodes), 9)
+
+        wall = next(w for w in self.game_map.obstacles if not w.is_border)
+        wall.take_damage(WALL_HEALTH)
+        second = cache.to_rect(rect)
+
+        self.assertIs(second, first)
+        self.assertEqual(second.version, self.nav.version)
+        self.assertEqual(len(cache), 1)
+
+    def assert_matches_rebuild(self, field):
+        """Assert a repaired field has rebuilt costs and optimal directions"""
+        rebuilt = FlowField(self.nav, field.goal_nodes)
+        neighbor_start, neighbor_node, neighbor_cost = self.nav.adjacency()
+        for node, cost in enumerate(rebuilt.cost):
+            self.assertAlmostEqual(field.cost[node], cost)
+            self.assertEqual(field.next_node[node] < 0, rebuilt.next_node[node] < 0)
+            if field.next_node[node] >= 0:
+                best = min(field.cost[neighbor_node[k]] + neighbor_cost[k]
+                           for k in range(neighbor_start[node], neighbor_start[node + 1]))
+                k = neighbor_node.index(field.next_node[node], neighbor_start[node], neighbor_start[node + 1])
+                self.assertAlmostEqual(field.cost[field.next_node[node]] + neighbor_cost[k], best)
+
+    def test_repair_matches_rebuild(self):
+        """Test incremental repair after wall destruction matches a full rebuild"""
+        walls = [w for w in self.game_map.obstacles if not w.is_border]
+        for wall in walls[:6]:
+            wall.take_damage(WALL_HEALTH)
+            self.field.ensure_current()
+            self.assert_matches_rebuild(self.field)
+            self.assertLess(self.field.repaired_nodes, MAP_WIDTH * MAP_HEIGHT)
+
+    def test_repair_with_blocked_goal(self):
+        """Test repair when the goal tile itself is inside a wall footprint"""
+        wall = next(w for w in self.game_map.obstacles if not w.is_border)
+        goal = self.nav.node(wall.x, wall.y)
+        field = FlowField(self.nav, [goal])
+        neighbors = [w for w in self.game_map.obstacles
+                     if not w.is_border and w is not wall and abs(w.x - wall.x) <= 2 and abs(w.y - wall.y) <= 2]
+        for other in neighbors + [wall]:
+            other.take_damage(WALL_HEALTH)
+            field.ensure_current()
+            self.assert_matches_rebuild(field)
+
+    def test_agent_follows_field(self):
+        """Test navigate_to steers toward the field's next waypoint"""
+        start = next((x, y) for y in range(MAP_HEIGHT) for x in range(MAP_WIDTH)
+                     if self.nav.is_walkable(x, y) and self.field.cost[self.nav.node(x, y)] > 3)
+        agent = Agent(start[0] * TILE_SIZE + 16, start[1] * TILE_SIZE + 16, 0, game_map=self.game_map)
+        gx, gy = self.goal[0] * TILE_SIZE + 16, self.goal[1] * TILE_SIZE + 16
+
+        agent.navigate_to(gx, gy, 0, self.game_map.obstacles)
+
+        wx, wy = self.field.next_waypoint(agent.x, agent.y)
+        self.assertGreater(agent.velocity_x * (wx - agent.x) + agent.velocity_y * (wy - agent.y), 0)
+        self.assertAlmostEqual((agent.velocity_x ** 2 + agent.velocity_y ** 2) ** 0.5, agent.speed)
+
+
+if __name__ == '__main__':
+    unittest.main()
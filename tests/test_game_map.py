@@ -4,11 +4,18 @@ Unit tests for GameMap class
 import unittest
 import sys
 import os
+import random
+import math
+
+import pygame
+import numpy as np
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from game_map import GameMap, Wall
+from game_map import GameMap, Wall, distance_transform, MAP_BACKGROUND_COLOR
+from agent import Agent
+from match_rng import MatchRng
 from config import *
 
 
@@ -228,5 +235,311 @@ class TestGameMapCTF(unittest.TestCase):
         self.assertLess(len(game_map.obstacles), 200)
 
 
+
+class TestOccupancy(unittest.TestCase):
+    """Test the tile occupancy bitmap used for collisions"""
+    
+    def test_occupancy_matches_tiles(self):
+        """Test occupancy marks exactly the wall tiles"""
+        game_map = GameMap("Survival")
+        
+        self.assertEqual(game_map.occupancy.astype(int).tolist(), game_map.tiles)
+    
+    def test_destroyed_wall_clears_tile(self):
+        """Test killing a wall clears its tile immediately"""
+        game_map = GameMap("Survival")
+        wall = next(w for w in game_map.obstacles if not w.is_border)
+        
+        wall.take_damage(WALL_HEALTH)
+        
+        self.assertFalse(game_map.occupancy[wall.y, wall.x])
+        self.assertFalse(game_map.is_area_blocked(wall.rect.x, wall.rect.y, TILE_SIZE, TILE_SIZE))
+    
+    def test_area_blocked_matches_rect_scan(self):
+        """Test tile lookup gives the same answer as testing every wall rect"""
+        game_map = GameMap("Survival", rng=random.Random(3))
+        next(w for w in game_map.obstacles if not w.is_border).take_damage(WALL_HEALTH)
+        rng = random.Random(11)
+        
+        for _ in range(500):
+            x = rng.uniform(-20, MAP_WIDTH * TILE_SIZE + 20)
+            y = rng.uniform(-20, MAP_HEIGHT * TILE_SIZE + 20)
+            rect = pygame.Rect(x - AGENT_SIZE // 2, y - AGENT_SIZE // 2, AGENT_SIZE, AGENT_SIZE)
+            expected = any(w.alive and rect.colliderect(w.rect) for w in game_map.obstacles)
+            
+            self.assertEqual(game_map.is_area_blocked(x - AGENT_SIZE // 2, y - AGENT_SIZE // 2,
+                                                      AGENT_SIZE, AGENT_SIZE), expected)
+
+
+
+class TestRaycast(unittest.TestCase):
+    """Test DDA grid traversal line of sight"""
+    
+    def setUp(self):
+        """Set up a map with border walls and one interior wall at tile (10, 8)"""
+        self.game_map = GameMap("Survival")
+        self.game_map.tiles = [[1 if x in (0, MAP_WIDTH - 1) or y in (0, MAP_HEIGHT - 1) else 0
+                                for x in range(MAP_WIDTH)] for y in range(MAP_HEIGHT)]
+        self.game_map.tiles[8][10] = 1
+        self.game_map.create_obstacle_walls()
+    
+    def center(self, tx, ty):
+        """Pixel center of a tile"""
+        return (tx + 0.5) * TILE_SIZE, (ty + 0.5) * TILE_SIZE
+    
+    def test_clear_segment(self):
+        """Test a segment through empty tiles is clear"""
+        self.assertIsNone(self.game_map.raycast(*self.center(3, 3), *self.center(8, 12)))
+    
+    def test_blocked_segment(self):
+        """Test the first wall on the segment is returned"""
+        self.assertEqual(self.game_map.raycast(*self.center(5, 8), *self.center(20, 8)), (10, 8))
+        self.assertEqual(self.game_map.raycast(*self.center(20, 8), *self.center(5, 8)), (10, 8))
+    
+    def test_diagonal_clip(self):
+        """Test a segment clipping only the corner of a wall tile is blocked"""
+        x0, y0 = 10 * TILE_SIZE - 20, 8 * TILE_SIZE + 24
+        x1, y1 = 10 * TILE_SIZE + 20, 8 * TILE_SIZE - 16
+        
+        self.assertEqual(self.game_map.raycast(x0, y0, x1, y1), (10, 8))
+    
+    def test_destroyed_wall_does_not_block(self):
+        """Test destroyed walls no longer block the ray"""
+        wall = self.game_map.obstacles[self.game_map.wall_index[8, 10]]
+        wall.take_damage(WALL_HEALTH)
+        
+        self.assertIsNone(self.game_map.raycast(*self.center(5, 8), *self.center(20, 8)))
+    
+    def segment_hits_rect(self, x0, y0, x1, y1, rect):
+        """Reference Liang-Barsky segment/rectangle intersection"""
+        t0, t1 = 0.0, 1.0
+        dx, dy = x1 - x0, y1 - y0
+        for p, q in ((-dx, x0 - rect.left), (dx, rect.right - x0), (-dy, y0 - rect.top), (dy, rect.bottom - y0)):
+            if p == 0:
+                if q < 0:
+                    return False
+            elif p < 0:
+                t0 = max(t0, q / p)
+            else:
+                t1 = min(t1, q / p)
+        return t0 <= t1
+    
+    def test_matches_exact_intersection(self):
+        """Test raycast agrees with an exact segment/rectangle intersection"""
+        rng = random.Random(2)
+        game_map = GameMap("Survival", rng=random.Random(9))
+        for _ in range(300):
+            x0, y0 = rng.uniform(40, 760), rng.uniform(40, 530)
+            x1, y1 = rng.uniform(40, 760), rng.uniform(40, 530)
+            expected = any(w.alive and self.segment_hits_rect(x0, y0, x1, y1, w.rect) for w in game_map.obstacles)
+            
+            self.assertEqual(game_map.raycast(x0, y0, x1, y1) is not None, expected)
+    def test_segment_clear_uses_agent_width(self):
+        """Test a segment passing beside a wall is blocked for a wide agent only"""
+        # Horizontal segment whose centre line misses the wall at (10, 8) by 5 pixels
+        y = 8 * TILE_SIZE - 5
+        x0, x1 = 5 * TILE_SIZE, 15 * TILE_SIZE
+
+        self.assertTrue(self.game_map.segment_clear(x0, y, x1, y))
+        self.assertFalse(self.game_map.segment_clear(x0, y, x1, y, AGENT_SIZE / 2))
+        self.assertTrue(self.game_map.segment_clear(x0, y - TILE_SIZE, x1, y - TILE_SIZE, AGENT_SIZE / 2))
+
+
+
+class TestClearance(unittest.TestCase):
+    """Test the distance-to-wall field and escape directions"""
+    
+    def setUp(self):
+        """Set up a map with border walls and one interior wall at tile (10, 8)"""
+        self.game_map = GameMap("Survival")
+        self.game_map.tiles = [[1 if x in (0, MAP_WIDTH - 1) or y in (0, MAP_HEIGHT - 1) else 0
+                                for x in range(MAP_WIDTH)] for y in range(MAP_HEIGHT)]
+        self.game_map.tiles[8][10] = 1
+        self.game_map.create_obstacle_walls()
+    
+    def test_distance_transform_is_exact(self):
+        """Test the transform matches brute-force nearest-wall distances"""
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            occupied = rng.random((9, 13)) < 0.15
+            occupied[0, 0] = True
+            walls = np.argwhere(occupied)
+            expected = np.array([[np.sqrt(((walls - (y, x)) ** 2).sum(axis=1)).min() for x in range(13)]
+                                 for y in range(9)])
+            
+            self.assertTrue(np.allclose(distance_transform(occupied), expected))
+
+    def test_distance_transform_wide_rows(self):
+        """Test the row pass is exact on rows much wider than the grid is tall"""
+        occupied = np.zeros((2, 300), dtype=bool)
+        occupied[1, 7] = True
+        occupied[0, 250] = True
+        walls = np.argwhere(occupied)
+        expected = np.array([[np.sqrt(((walls - (y, x)) ** 2).sum(axis=1)).min() for x in range(300)]
+                             for y in range(2)])
+
+        self.assertTrue(np.allclose(distance_transform(occupied), expected))
+
+    def test_clearance_values(self):
+        """Test clearance is zero on walls and grows away from them"""
+        self.assertEqual(self.game_map.clearance_at(10.5 * TILE_SIZE, 8.5 * TILE_SIZE), 0)
+        self.assertEqual(self.game_map.clearance_at(12.5 * TILE_SIZE, 8.5 * TILE_SIZE), 2)
+        self.assertAlmostEqual(self.game_map.clearance_at(11.5 * TILE_SIZE, 9.5 * TILE_SIZE), math.sqrt(2))
+    
+    def test_refreshed_when_wall_dies(self):
+        """Test the field is recomputed after a wall is destroyed"""
+        self.assertEqual(self.game_map.clearance_at(10.5 * TILE_SIZE, 8.5 * TILE_SIZE), 0)
+        wall = self.game_map.obstacles[self.game_map.wall_index[8, 10]]
+        wall.take_damage(WALL_HEALTH)
+        
+        # Nearest remaining wall is the top border, 8 tiles up
+        self.assertEqual(self.game_map.clearance_at(10.5 * TILE_SIZE, 8.5 * TILE_SIZE), 8)
+    
+    def test_escape_direction_points_away(self):
+        """Test the escape direction next to a wall points away from it"""
+        ux, uy = self.game_map.escape_direction(11.5 * TILE_SIZE, 8.5 * TILE_SIZE)
+        
+        self.assertGreater(ux, 0.9)
+        self.assertAlmostEqual(math.hypot(ux, uy), 1.0)
+    
+    def test_escape_direction_none_on_plateau(self):
+        """Test a symmetric spot has no preferred escape direction"""
+        # Same distance to the walls on both sides of a three-tile vertical corridor
+        game_map = self.game_map
+        game_map.tiles = [[1 if x in (0, 4) or y in (0, MAP_HEIGHT - 1) else 0
+                           for x in range(MAP_WIDTH)] for y in range(MAP_HEIGHT)]
+        game_map.create_obstacle_walls()
+        
+        self.assertIsNone(game_map.escape_direction(2.5 * TILE_SIZE, 8.5 * TILE_SIZE))
+
+
+class TestResolveCircle(unittest.TestCase):
+    """Test circle-vs-tile collision resolution and wall sliding"""
+    
+    RADIUS = AGENT_SIZE / 2
+    
+    def setUp(self):
+        """Set up a map with a horizontal wall on row 8 (tiles 5-15) and a lone wall at (20, 12)"""
+        self.game_map = GameMap("Survival")
+        self.game_map.tiles = [[1 if x in (0, MAP_WIDTH - 1) or y in (0, MAP_HEIGHT - 1) else 0
+                                for x in range(MAP_WIDTH)] for y in range(MAP_HEIGHT)]
+        for x in range(5, 16):
+            self.game_map.tiles[8][x] = 1
+        self.game_map.tiles[12][20] = 1
+        self.game_map.create_obstacle_walls()
+    
+    def test_free_position_unchanged(self):
+        """Test a circle away from walls is not moved"""
+        self.assertEqual(self.game_map.resolve_circle(100.5, 100.5, self.RADIUS), (100.5, 100.5, []))
+    
+    def test_pushed_out_of_flat_wall(self):
+        """Test a circle overlapping a wall face is pushed out along its normal"""
+        x, y, normals = self.game_map.resolve_circle(6.5 * TILE_SIZE, 8 * TILE_SIZE - 4, self.RADIUS)
+        
+        self.assertEqual((x, y), (6.5 * TILE_SIZE, 8 * TILE_SIZE - self.RADIUS))
+        self.assertEqual(normals, [(0, -1)])
+    
+    def test_no_deflection_at_internal_edges(self):
+        """Test a circle on the seam between two wall tiles is pushed straight out"""
+        x, y, normals = self.game_map.resolve_circle(7 * TILE_SIZE, 8 * TILE_SIZE - 4, self.RADIUS)
+        
+        self.assertEqual((x, y), (7 * TILE_SIZE, 8 * TILE_SIZE - self.RADIUS))
+        self.assertEqual(normals, [(0, -1)])
+    
+    def test_pushed_away_from_corner(self):
+        """Test a circle overlapping a convex corner ends exactly one radius away from it"""
+        corner_x, corner_y = 21 * TILE_SIZE, 12 * TILE_SIZE
+        x, y, normals = self.game_map.resolve_circle(corner_x + 4, corner_y - 4, self.RADIUS)
+        
+        self.assertAlmostEqual(math.hypot(x - corner_x, y - corner_y), self.RADIUS)
+        self.assertAlmostEqual(normals[0][0], math.sqrt(0.5))
+        self.assertAlmostEqual(normals[0][1], -math.sqrt(0.5))
+    
+    def test_center_inside_wall_exits_nearest_side(self):
+        """Test a circle centred inside a wall tile leaves through the closest side"""
+        x, y, _ = self.game_map.resolve_circle(20 * TILE_SIZE + 5, 12.5 * TILE_SIZE, self.RADIUS)
+        
+        self.assertEqual((x, y), (20 * TILE_SIZE - self.RADIUS, 12.5 * TILE_SIZE))
+    
+    def test_agent_slides_along_wall(self):
+        """Test an agent moving diagonally into a wall keeps its tangential speed"""
+        agent = Agent(6 * TILE_SIZE, 8 * TILE_SIZE - self.RADIUS, 0, game_map=self.game_map)
+        agent.velocity_x, agent.velocity_y = 3.0, 2.0
+        
+        agent.apply_movement(self.game_map.obstacles)
+        
+        self.assertEqual((agent.x, agent.y), (6 * TILE_SIZE + 3, 8 * TILE_SIZE - self.RADIUS))
+        self.assertEqual((agent.velocity_x, agent.velocity_y), (3.0, 0.0))
+
+    def test_obstacle_list_uses_same_resolution(self):
+        """Test an ad-hoc obstacle list collides exactly like the same walls on the map"""
+        walls = [wall for wall in self.game_map.obstacles if wall.alive]
+        on_map = Agent(6 * TILE_SIZE, 8 * TILE_SIZE - self.RADIUS, 0, game_map=self.game_map)
+        ad_hoc = Agent(6 * TILE_SIZE, 8 * TILE_SIZE - self.RADIUS, 0)
+        for agent, obstacles in ((on_map, self.game_map.obstacles), (ad_hoc, walls)):
+            agent.velocity_x, agent.velocity_y = 3.0, 2.0
+            agent.apply_movement(obstacles)
+
+        self.assertEqual((ad_hoc.x, ad_hoc.y), (on_map.x, on_map.y))
+        self.assertEqual((ad_hoc.velocity_x, ad_hoc.velocity_y), (3.0, 0.0))
+
+
+class TestMapRendering(unittest.TestCase):
+    """Test the pre-rendered background and dirty-tile updates"""
+    
+    SCREEN = (MAP_WIDTH * TILE_SIZE, MAP_HEIGHT * TILE_SIZE + 24)
+    
+    def setUp(self):
+        """Set up a generated map and an interior wall"""
+        self.game_map = GameMap("Survival", rng=MatchRng(2))
+        self.wall = next(w for w in self.game_map.obstacles if not w.is_border)
+    
+    def full_redraw(self):
+        """Render the map the old way: fill, then draw every wall"""
+        surface = pygame.Surface(self.SCREEN)
+        surface.fill(MAP_BACKGROUND_COLOR)
+        for wall in self.game_map.obstacles:
+            wall.draw(surface)
+        return pygame.surfarray.array3d(surface)
+    
+    def cached_draw(self):
+        """Render the map through the cached background"""
+        screen = pygame.Surface(self.SCREEN)
+        screen.fill((255, 0, 255))
+        self.game_map.draw(screen)
+        return pygame.surfarray.array3d(screen)
+    
+    def test_matches_full_redraw(self):
+        """Test the cached map looks like a full redraw, including the uncovered strip"""
+        self.assertTrue(np.array_equal(self.cached_draw(), self.full_redraw()))
+    
+    def test_background_built_once(self):
+        """Test later frames reuse the same background surface"""
+        background = self.game_map.background()
+        self.game_map.draw(pygame.Surface(self.SCREEN))
+        
+        self.assertIs(self.game_map.background(), background)
+    
+    def test_damage_marks_tile_dirty(self):
+        """Test damaged and destroyed walls are redrawn in the background"""
+        self.cached_draw()
+        self.wall.take_damage(WALL_HEALTH // 2)
+        
+        self.assertEqual(self.game_map.dirty_tiles, {(self.wall.x, self.wall.y)})
+        self.assertTrue(np.array_equal(self.cached_draw(), self.full_redraw()))
+        self.assertFalse(self.game_map.dirty_tiles)
+        
+        self.wall.take_damage(WALL_HEALTH)
+        
+        self.assertTrue(np.array_equal(self.cached_draw(), self.full_redraw()))
+    
+    def test_border_damage_is_not_dirty(self):
+        """Test indestructible border walls never dirty the background"""
+        border = next(w for w in self.game_map.obstacles if w.is_border)
+        border.take_damage(WALL_HEALTH)
+        
+        self.assertFalse(self.game_map.dirty_tiles)
+
+
 if __name__ == '__main__':
     unittest.main()
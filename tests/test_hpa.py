@@ -0,0 +1,168 @@
+"""
+Unit tests for hierarchical pathfinding (HPA*) on large maps
+"""
+import unittest
+import sys
+import os
+import random
+
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from hpa import HierarchicalPlanner, HPA_MIN_CELLS
+from nav_grid import NavGrid
+from pathfinding import astar, octile_distance
+from game_map import GameMap
+from match_rng import MatchRng
+from agent import Agent
+from config import *
+
+SIZE = 160
+
+
+def make_blocked(seed):
+    """Build a large map with horizontal walls that leave a few gaps"""
+    rng = random.Random(seed)
+    blocked = np.zeros((SIZE, SIZE), dtype=bool)
+    for y in range(10, SIZE, 20):
+        blocked[y, :] = True
+        for _ in range(3):
+            gap = rng.randrange(SIZE - 4)
+            blocked[y, gap:gap + 3] = False
+    return blocked
+
+
+def path_cost(start, path):
+    """Sum of octile step costs along a tile path"""
+    return sum(octile_distance(a, b) for a, b in zip([start] + path, path))
+
+
+class TestHierarchicalPlanner(unittest.TestCase):
+    """Test abstract routes, refinement and per-cluster updates"""
+
+    def setUp(self):
+        """Set up a large synthetic nav grid"""
+        self.nav = NavGrid(blocked=make_blocked(5))
+        self.planner = HierarchicalPlanner(self.nav)
+        self.free = [(x, y) for y in range(SIZE) for x in range(SIZE) if self.nav.is_walkable(x, y)]
+
+    def refine_all(self, start, route):
+        """Refine every route segment into one tile path"""
+        path = []
+        current = start
+        for waypoint in route:
+            segment, reached = self.planner.refine(current, waypoint)
+            self.assertTrue(reached)
+            path.extend(segment)
+            current = waypoint
+        return path
+
+    def test_disabled_on_default_map(self):
+        """Test the planner is only built on large maps"""
+        game_map = GameMap("Survival", rng=MatchRng(1))
+        self.assertEqual(game_map.hpa is not None, MAP_WIDTH * MAP_HEIGHT >= HPA_MIN_CELLS)
+
+    def test_route_cost_close_to_optimal(self):
+        """Test refined routes reach the goal at a cost close to A*"""
+        rng = random.Random(2)
+        for _ in range(20):
+            start, goal = rng.choice(self.free), rng.choice(self.free)
+            optimal, reached = astar(self.nav, start, goal, max_expansions=SIZE * SIZE)
+            route = self.planner.find_route(start, goal)
+            if not reached:
+                self.assertIsNone(route)
+                continue
+            path = self.refine_all(start, route)
+
+            self.assertEqual(path[-1] if path else start, goal)
+            self.assertLessEqual(path_cost(start, path), path_cost(start, optimal) * 1.3 + 2)
+
+    def test_reaches_beyond_expansion_cap(self):
+        """Test far goals are routed even where bounded A* gives up"""
+        start, goal = self.free[0], self.free[-1]
+        _, reached = astar(self.nav, start, goal)
+        route = self.planner.find_route(start, goal)
+
+        self.assertFalse(reached)
+        self.assertIsNotNone(route)
+        self.assertEqual(route[-1], goal)
+        for waypoint in route:
+            _, reached = self.planner.refine(start, waypoint)
+            self.assertTrue(reached)
+            start = waypoint
+
+    def test_unreachable_goal(self):
+        """Test a walled-in goal has no route"""
+        blocked = np.zeros((SIZE, SIZE), dtype=bool)
+        blocked[SIZE - 3, SIZE - 3:] = True
+        blocked[SIZE - 3:, SIZE - 3] = True
+        planner = HierarchicalPlanner(NavGrid(blocked=blocked))
+
+        self.assertIsNone(planner.find_route((0, 0), (SIZE - 1, SIZE - 1)))
+
+    def test_start_or_goal_on_entrance(self):
+        """Test routes starting or ending exactly on an entrance tile match A* reachability"""
+        blocked = np.zeros((16, 32), dtype=bool)
+        blocked[:, 15] = True
+        blocked[5, 15] = False
+        nav = NavGrid(blocked=blocked)
+        planner = HierarchicalPlanner(nav)
+        self.assertIn(nav.node(15, 5), planner.links)
+
+        cases = [((15, 5), (25, 5)), ((16, 5), (5, 5)), ((14, 5), (25, 5)),
+                 ((5, 5), (15, 5)), ((25, 5), (16, 5)), ((15, 5), (16, 5))]
+        for start, goal in cases:
+            _, reached = astar(nav, start, goal, max_expansions=nav.width * nav.height)
+            route = planner.find_route(start, goal)
+
+            self.assertTrue(reached)
+            self.assertIsNotNone(route, (start, goal))
+            self.assertEqual(route[-1], goal)
+            current = start
+            for waypoint in route:
+                _, reached = planner.refine(current, waypoint)
+                self.assertTrue(reached)
+                current = waypoint
+
+    def test_update_touches_dirty_clusters_only(self):
+        """Test opening a wall rebuilds only nearby clusters and matches a fresh planner"""
+        self.nav.blocked[10, 40:44] = False
+        self.nav.invalidate()
+        self.planner.ensure_current()
+        fresh = HierarchicalPlanner(self.nav)
+
+        self.assertLessEqual(self.planner.updated_clusters, 12)
+        self.assertEqual(self.planner.links, fresh.links)
+        self.assertEqual(self.planner.intra, fresh.intra)
+
+    def test_agent_refines_route_lazily(self):
+        """Test agents refine one route segment at a time while following it"""
+        game_map = GameMap("Survival", rng=MatchRng(3))
+        game_map.hpa = HierarchicalPlanner(game_map.nav_grid, cluster_size=5)
+        nav = game_map.nav_grid
+        free = [(x, y) for y in range(MAP_HEIGHT) for x in range(MAP_WIDTH) if nav.is_walkable(x, y)]
+        start, goal = free[0], free[-1]
+        agent = Agent(start[0] * TILE_SIZE + 16, start[1] * TILE_SIZE + 16, 0, game_map=game_map)
+        agent.target = Agent(goal[0] * TILE_SIZE + 16, goal[1] * TILE_SIZE + 16, 1)
+
+        agent.find_path_to_target(game_map.obstacles)
+        route = list(agent.route)
+
+        self.assertTrue(agent.path)
+        self.assertTrue(route)
+        self.assertEqual(route[-1], goal)
+
+        # Walk to the end of the first segment: the next one is refined on demand
+        agent.x, agent.y = agent.path[-1]
+        while len(agent.path) > 1:
+            agent.path.popleft()
+        agent.follow_path()
+
+        self.assertEqual(list(agent.route), route[1:])
+        self.assertTrue(agent.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the shared line-of-sight overlay
+"""
+import unittest
+import sys
+import os
+import math
+
+import numpy as np
+import pygame
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from los_overlay import LosOverlay, los_cone
+from agent import Agent
+from config import *
+
+BACKGROUND = (34, 139, 34)
+
+
+def blank_screen():
+    """A screen-sized surface filled with the map background"""
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen.fill(BACKGROUND)
+    return screen
+
+
+class TestLosOverlay(unittest.TestCase):
+    """Test cone drawing, per-frame clearing and surface reuse"""
+
+    def setUp(self):
+        """Set up an overlay and a screen"""
+        self.overlay = LosOverlay()
+        self.screen = blank_screen()
+
+    def test_cone_is_blended(self):
+        """Test a point inside the cone is tinted and a point behind the agent is not"""
+        self.overlay.begin(self.screen)
+        self.overlay.add_cone(los_cone(400, 300, 0), (255, 0, 0))
+        self.overlay.draw(self.screen)
+
+        inside = self.screen.get_at((500, 300))
+        self.assertGreater(inside.r, BACKGROUND[0])
+        self.assertLess(inside.g, BACKGROUND[1])
+        self.assertEqual(tuple(self.screen.get_at((300, 300)))[:3], BACKGROUND)
+
+    def test_surface_reused_and_cleared(self):
+        """Test the layer is allocated once and old cones are erased on the next frame"""
+        self.overlay.begin(self.screen)
+        surface = self.overlay.surface
+        self.overlay.add_cone(los_cone(400, 300, 0), (255, 0, 0))
+        self.overlay.draw(self.screen)
+
+        screen = blank_screen()
+        self.overlay.begin(screen)
+        self.overlay.draw(screen)
+
+        self.assertIs(self.overlay.surface, surface)
+        self.assertEqual(tuple(screen.get_at((500, 300)))[:3], BACKGROUND)
+        self.assertFalse(pygame.surfarray.pixels_alpha(self.overlay.surface).any())
+
+    def test_resized_screen_gets_new_layer(self):
+        """Test a different screen size allocates a matching layer"""
+        self.overlay.begin(self.screen)
+        self.overlay.begin(pygame.Surface((320, 240)))
+
+        self.assertEqual(self.overlay.surface.get_size(), (320, 240))
+
+    def test_overlapping_cones_blended_once(self):
+        """Test merged areas do not overlap, so no pixel is composited twice"""
+        self.overlay.begin(self.screen)
+        self.overlay.add_cone(los_cone(400, 300, 0), (255, 0, 0))
+        self.overlay.add_cone(los_cone(420, 300, 0), (255, 0, 0))
+        self.overlay.add_cone(los_cone(100, 100, math.pi), (0, 0, 255))
+        merged = self.overlay._merged_rects()
+
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(merged[0].collidelist(merged[1:]), -1)
+
+        single = blank_screen()
+        overlay = LosOverlay()
+        overlay.begin(single)
+        overlay.add_cone(los_cone(420, 300, 0), (255, 0, 0))
+        overlay.draw(single)
+        self.overlay.draw(self.screen)
+
+        self.assertEqual(self.screen.get_at((550, 300)), single.get_at((550, 300)))
+
+    def test_agent_draw_matches_legacy(self):
+        """Test an agent drawn through the overlay looks the same as the per-agent surface"""
+        agent = Agent(400, 300, 0)
+        agent.facing_angle = 0.5
+        legacy = blank_screen()
+        agent.draw(legacy)
+
+        self.overlay.begin(self.screen)
+        agent.draw(self.screen, los_overlay=self.overlay)
+        self.overlay.draw(self.screen)
+
+        self.assertTrue(np.array_equal(pygame.surfarray.array3d(self.screen), pygame.surfarray.array3d(legacy)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Unit tests for per-match seeded RNG (reproducible matches)
+"""
+import unittest
+import sys
+import os
+import random
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from match_rng import MatchRng, resolve_rng
+from game_map import GameMap
+from agent import Agent
+from main import Game
+
+
+class TestMatchRng(unittest.TestCase):
+    """Test MatchRng construction"""
+
+    def test_same_seed_same_sequence(self):
+        """Test two generators with the same seed agree"""
+        rng1 = MatchRng(42)
+        rng2 = MatchRng(42)
+
+        self.assertEqual([rng1.random() for _ in range(5)], [rng2.random() for _ in range(5)])
+        self.assertEqual(rng1.np.integers(0, 1000, 5).tolist(), rng2.np.integers(0, 1000, 5).tolist())
+
+    def test_random_seed_is_recorded(self):
+        """Test a seed is chosen and stored when none is given"""
+        rng = MatchRng()
+
+        self.assertIsInstance(rng.match_seed, int)
+
+    def test_resolve_rng_default(self):
+        """Test resolve_rng falls back to the global random module"""
+        self.assertIs(resolve_rng(None), random)
+
+
+class TestSeededWorld(unittest.TestCase):
+    """Test map, agents and whole matches are reproducible from a seed"""
+
+    def test_same_seed_same_map(self):
+        """Test map generation depends only on the seed"""
+        map1 = GameMap("Survival", rng=MatchRng(7))
+        map2 = GameMap("Survival", rng=MatchRng(7))
+
+        self.assertEqual(map1.tiles, map2.tiles)
+
+    def test_agent_initial_heading(self):
+        """Test agent initial heading comes from the match generator"""
+        agent1 = Agent(100, 100, 0, rng=MatchRng(3))
+        agent2 = Agent(100, 100, 0, rng=MatchRng(3))
+
+        self.assertEqual(agent1.facing_angle, agent2.facing_angle)
+
+    def test_match_replays_exactly(self):
+        """Test two headless games with the same seed evolve identically"""
+        game1 = Game("King of the Hill", headless=True, seed=1234)
+        game2 = Game("King of the Hill", headless=True, seed=1234)
+
+        for _ in range(300):
+            game1.update()
+            game2.update()
+
+        self.assertEqual(game1.team_communication_modes, game2.team_communication_modes)
+        self.assertEqual([(a.x, a.y, a.health) for a in game1.agents],
+                         [(a.x, a.y, a.health) for a in game2.agents])
+        self.assertEqual(game1.game_mode.team_zone_time, game2.game_mode.team_zone_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
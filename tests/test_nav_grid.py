@@ -0,0 +1,105 @@
+"""
+Unit tests for the cached navigation grid
+"""
+import unittest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nav_grid import NavGrid, NEIGHBOR_OFFSETS, DIAGONAL_COST
+from game_map import GameMap
+from match_rng import MatchRng
+from agent import Agent
+from config import *
+
+
+def reference_neighbors(blocked_tiles, tx, ty):
+    """Neighbour rule of the original per-query pathfinding"""
+    found = []
+    for dx, dy in NEIGHBOR_OFFSETS:
+        nx, ny = tx + dx, ty + dy
+        if nx < 0 or nx >= MAP_WIDTH or ny < 0 or ny >= MAP_HEIGHT:
+            continue
+        if (nx, ny) in blocked_tiles:
+            continue
+        if dx and dy and ((tx + dx, ty) in blocked_tiles or (tx, ty + dy) in blocked_tiles):
+            continue
+        found.append((nx, ny))
+    return found
+
+
+def reference_blocked(obstacles):
+    """Blocked tiles as rasterized by the original per-query pathfinding"""
+    blocked = set()
+    for obstacle in obstacles:
+        if obstacle.alive:
+            r = obstacle.rect
+            for x in range(r.x // TILE_SIZE, (r.x + r.width) // TILE_SIZE + 1):
+                for y in range(r.y // TILE_SIZE, (r.y + r.height) // TILE_SIZE + 1):
+                    blocked.add((x, y))
+    return blocked
+
+
+class TestNavGrid(unittest.TestCase):
+    """Test walkability, CSR adjacency and versioning"""
+
+    def setUp(self):
+        """Set up a generated map"""
+        self.game_map = GameMap("Survival", rng=MatchRng(11))
+        self.nav = self.game_map.nav_grid
+
+    def assert_matches_reference(self):
+        """Compare every node's neighbours with the original rule"""
+        blocked = reference_blocked(self.game_map.obstacles)
+        start, nodes, _ = self.nav.adjacency()
+        for ty in range(MAP_HEIGHT):
+            for tx in range(MAP_WIDTH):
+                n = self.nav.node(tx, ty)
+                got = [self.nav.tile(m) for m in nodes[start[n]:start[n + 1]]]
+                self.assertEqual(got, reference_neighbors(blocked, tx, ty))
+
+    def test_adjacency_matches_reference(self):
+        """Test CSR neighbours follow the original 8-direction rule"""
+        self.assert_matches_reference()
+
+    def test_diagonal_costs(self):
+        """Test diagonal moves cost more than straight ones"""
+        start, nodes, costs = self.nav.adjacency()
+        for k in range(len(nodes)):
+            self.assertIn(costs[k], (1.0, DIAGONAL_COST))
+
+    def test_version_bumped_on_wall_destroyed(self):
+        """Test only wall destruction bumps the version and rebuilds"""
+        wall = next(w for w in self.game_map.obstacles if not w.is_border)
+        version = self.nav.version
+
+        wall.take_damage(1)
+        self.assertEqual(self.nav.version, version)
+
+        wall.take_damage(WALL_HEALTH)
+        self.assertEqual(self.nav.version, version + 1)
+        self.assert_matches_reference()
+
+    def test_from_obstacles(self):
+        """Test a graph built from an obstacle list matches the map's graph"""
+        nav = NavGrid.from_obstacles(self.game_map.obstacles)
+
+        self.assertEqual(nav.adjacency(), self.nav.adjacency())
+        self.assertTrue((nav.blocked == self.nav.blocked).all())
+
+    def test_agent_path_avoids_walls(self):
+        """Test agent paths only visit walkable tiles"""
+        agent = Agent(2.5 * TILE_SIZE, 2.5 * TILE_SIZE, 0, game_map=self.game_map)
+        agent.target = Agent((MAP_WIDTH - 3) * TILE_SIZE, (MAP_HEIGHT - 3) * TILE_SIZE, 1)
+
+        agent.find_path_to_target(self.game_map.obstacles)
+
+        self.assertTrue(agent.path)
+        for x, y in agent.path:
+            self.assertTrue(self.nav.is_walkable(int(x // TILE_SIZE), int(y // TILE_SIZE)))
+
+
+if __name__ == '__main__':
+    unittest.main()
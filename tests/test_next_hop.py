@@ -0,0 +1,90 @@
+"""
+Unit tests for the all-pairs next-hop table
+"""
+import unittest
+import sys
+import os
+import random
+
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from next_hop import NextHopTable
+from pathfinding import astar, octile_distance
+from game_map import GameMap
+from match_rng import MatchRng
+from agent import Agent
+from config import *
+
+
+class TestNextHopTable(unittest.TestCase):
+    """Test distances, next hops and incremental repair"""
+
+    def setUp(self):
+        """Set up a generated map with the table enabled"""
+        self.game_map = GameMap("Survival", rng=MatchRng(3), next_hops=True)
+        self.nav = self.game_map.nav_grid
+        self.table = self.game_map.next_hops
+        self.free = [(x, y) for y in range(MAP_HEIGHT) for x in range(MAP_WIDTH) if self.nav.is_walkable(x, y)]
+
+    def test_opt_in(self):
+        """Test the table is only built when requested"""
+        self.assertIsNone(GameMap("Survival", rng=MatchRng(3)).next_hops)
+        self.assertIsNotNone(self.table)
+
+    def test_distances_match_astar(self):
+        """Test table distances and paths match A* costs"""
+        rng = random.Random(4)
+        for _ in range(150):
+            start, goal = rng.choice(self.free), rng.choice(self.free)
+            path, reached = astar(self.nav, start, goal, max_expansions=MAP_WIDTH * MAP_HEIGHT)
+            table_path = self.table.path(start, goal)
+            if not reached:
+                self.assertIsNone(table_path)
+                self.assertEqual(self.table.distance(start, goal), float('inf'))
+                continue
+            expected = sum(octile_distance(a, b) for a, b in zip([start] + path, path))
+            self.assertAlmostEqual(self.table.distance(start, goal), expected)
+            cost = sum(octile_distance(a, b) for a, b in zip([start] + table_path, table_path))
+            self.assertAlmostEqual(cost, expected)
+
+    def test_next_tile(self):
+        """Test next_tile is the first step of the table path"""
+        start, goal = self.free[0], self.free[-1]
+        path = self.table.path(start, goal)
+
+        self.assertEqual(self.table.next_tile(start, goal), path[0])
+        self.assertIsNone(self.table.next_tile(start, start))
+
+    def test_repair_matches_rebuild(self):
+        """Test the incremental repair after wall destruction equals a full rebuild"""
+        rng = random.Random(1)
+        walls = [w for w in self.game_map.obstacles if not w.is_border]
+        for wall in rng.sample(walls, 4):
+            wall.take_damage(WALL_HEALTH)
+            self.table.ensure_current()
+            rebuilt = NextHopTable(self.nav)
+
+            self.assertTrue(np.array_equal(self.table.dist, rebuilt.dist))
+            self.assertTrue(np.array_equal(self.table.next_hop, rebuilt.next_hop))
+
+    def test_agent_reads_table(self):
+        """Test agent paths come from the table"""
+        start, goal = self.free[0], self.free[-1]
+        agent = Agent(start[0] * TILE_SIZE + 16, start[1] * TILE_SIZE + 16, 0, game_map=self.game_map)
+        agent.target = Agent(goal[0] * TILE_SIZE + 16, goal[1] * TILE_SIZE + 16, 1)
+
+        agent.find_path_to_target(self.game_map.obstacles)
+
+        # The smoothed path keeps a subsequence of the table path, ending at the goal
+        expected = [(x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+                    for x, y in self.table.path(start, goal)]
+        remaining = iter(expected)
+        self.assertTrue(all(point in remaining for point in agent.path))
+        self.assertEqual(agent.path[-1], expected[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
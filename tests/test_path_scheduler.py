@@ -0,0 +1,136 @@
+"""
+Unit tests for the per-tick pathfinding request scheduler
+"""
+import unittest
+import sys
+import os
+from collections import deque
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from path_scheduler import PathScheduler, PRIORITY_CARRIER, PRIORITY_CHASER, PRIORITY_ATTACKER, PRIORITY_EXPLORER
+from game_map import GameMap
+from match_rng import MatchRng
+from agent import Agent
+from config import *
+
+
+class Point:
+    """Minimal path target"""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class TestPathScheduler(unittest.TestCase):
+    """Test priority order, budgets, path hand-over and metrics"""
+
+    def setUp(self):
+        """Set up a generated map, a scheduler and agents on free tiles"""
+        self.game_map = GameMap("Survival", rng=MatchRng(3))
+        nav = self.game_map.nav_grid
+        self.free = [(x, y) for y in range(MAP_HEIGHT) for x in range(MAP_WIDTH) if nav.is_walkable(x, y)]
+        self.goal = Point(self.free[-1][0] * TILE_SIZE + 16, self.free[-1][1] * TILE_SIZE + 16)
+
+    def make_agent(self, scheduler, index=0):
+        """Create an agent on a free tile that submits to the scheduler"""
+        tx, ty = self.free[index]
+        return Agent(tx * TILE_SIZE + 16, ty * TILE_SIZE + 16, 0, game_map=self.game_map, path_scheduler=scheduler)
+
+    def test_request_is_deferred(self):
+        """Test a request keeps the previous path until the scheduler runs"""
+        scheduler = PathScheduler()
+        agent = self.make_agent(scheduler)
+        agent.path = deque([(1, 1)])
+
+        agent.request_path(self.game_map.obstacles, 500, self.goal)
+
+        self.assertEqual(list(agent.path), [(1, 1)])
+        self.assertEqual(agent.path_update_time, 500)
+        self.assertTrue(scheduler.is_pending(agent))
+
+        scheduler.run()
+
+        self.assertFalse(scheduler.is_pending(agent))
+        self.assertNotEqual(list(agent.path), [(1, 1)])
+        self.assertTrue(agent.path)
+
+    def test_without_scheduler_is_immediate(self):
+        """Test agents without a scheduler compute the path right away"""
+        agent = self.make_agent(None)
+        agent.request_path(self.game_map.obstacles, 0, self.goal)
+        self.assertTrue(agent.path)
+
+    def test_priority_order(self):
+        """Test carriers are served before chasers, attackers and explorers"""
+        scheduler = PathScheduler(budget_expansions=0)
+        agents = [self.make_agent(scheduler, i) for i in range(4)]
+        priorities = [PRIORITY_EXPLORER, PRIORITY_ATTACKER, PRIORITY_CARRIER, PRIORITY_CHASER]
+        for agent, priority in zip(agents, priorities):
+            scheduler.submit(agent, self.goal, priority)
+
+        order = []
+        while len(scheduler):
+            pending = [a for a in agents if scheduler.is_pending(a)]
+            scheduler.run()
+            order.extend(a for a in pending if not scheduler.is_pending(a))
+
+        self.assertEqual(order, [agents[2], agents[3], agents[1], agents[0]])
+
+    def test_budget_spreads_requests(self):
+        """Test a burst of requests is spread over several ticks"""
+        scheduler = PathScheduler(budget_expansions=1)
+        agents = [self.make_agent(scheduler, i) for i in range(5)]
+        for agent in agents:
+            agent.request_path(self.game_map.obstacles, 0, self.goal)
+
+        self.assertEqual(scheduler.run(), 1)
+        self.assertEqual(len(scheduler), 4)
+        self.assertEqual(scheduler.metrics()["peak_queue_length"], 5)
+
+        while len(scheduler):
+            scheduler.run()
+        metrics = scheduler.metrics()
+        self.assertEqual(metrics["served_total"], 5)
+        self.assertEqual(metrics["deferred_total"], 4 + 3 + 2 + 1)
+        self.assertAlmostEqual(metrics["mean_wait_ticks"], 2.0)
+
+    def test_resubmit_replaces_target(self):
+        """Test a second request from the same agent updates its pending entry"""
+        scheduler = PathScheduler()
+        agent = self.make_agent(scheduler)
+        scheduler.submit(agent, Point(0, 0), PRIORITY_EXPLORER)
+        scheduler.submit(agent, self.goal, PRIORITY_CARRIER)
+
+        self.assertEqual(len(scheduler), 1)
+        self.assertEqual(scheduler.run(), 1)
+        end = agent.path[-1]
+        self.assertEqual((end[0] // TILE_SIZE, end[1] // TILE_SIZE), self.free[-1])
+
+    def test_dead_agents_are_dropped(self):
+        """Test requests from agents that died are not served"""
+        scheduler = PathScheduler()
+        agent = self.make_agent(scheduler)
+        agent.request_path(self.game_map.obstacles, 0, self.goal)
+        agent.alive = False
+
+        self.assertEqual(scheduler.run(), 0)
+        self.assertEqual(len(scheduler), 0)
+        self.assertFalse(agent.path)
+
+    def test_agent_priority(self):
+        """Test agent roles map to request priorities"""
+        agent = self.make_agent(None)
+        self.assertEqual(agent.path_priority(), PRIORITY_EXPLORER)
+        agent.role = ROLE_ATTACKER
+        self.assertEqual(agent.path_priority(), PRIORITY_ATTACKER)
+        agent.role = ROLE_CHASER
+        self.assertEqual(agent.path_priority(), PRIORITY_CHASER)
+        agent.role = ROLE_CARRIER
+        self.assertEqual(agent.path_priority(), PRIORITY_CARRIER)
+
+
+if __name__ == '__main__':
+    unittest.main()
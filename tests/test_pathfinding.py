@@ -0,0 +1,147 @@
+"""
+Unit tests for A* pathfinding on the navigation grid
+"""
+import unittest
+import sys
+import os
+import heapq
+import random
+
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from pathfinding import astar, octile_distance, smooth_path, MAX_EXPANSIONS
+from nav_grid import NavGrid
+from game_map import GameMap
+from match_rng import MatchRng
+from agent import Agent
+from config import *
+
+
+def dijkstra_cost(nav, start, goal):
+    """Reference shortest path cost without a heuristic"""
+    start_list, nodes, costs = nav.adjacency()
+    source, target = nav.node(*start), nav.node(*goal)
+    best = {source: 0.0}
+    heap = [(0.0, source)]
+    while heap:
+        d, n = heapq.heappop(heap)
+        if n == target:
+            return d
+        if d > best[n]:
+            continue
+        for k in range(start_list[n], start_list[n + 1]):
+            m = nodes[k]
+            if d + costs[k] < best.get(m, float('inf')):
+                best[m] = d + costs[k]
+                heapq.heappush(heap, (best[m], m))
+    return None
+
+
+def path_cost(start, path):
+    """Sum of straight and diagonal step costs along a path"""
+    total, previous = 0.0, start
+    for tile in path:
+        total += octile_distance(previous, tile)
+        previous = tile
+    return total
+
+
+class TestAStar(unittest.TestCase):
+    """Test optimality, fallbacks and the octile heuristic"""
+
+    def setUp(self):
+        """Set up a generated map"""
+        self.nav = GameMap("Survival", rng=MatchRng(3)).nav_grid
+        self.free = [(x, y) for y in range(MAP_HEIGHT) for x in range(MAP_WIDTH) if self.nav.is_walkable(x, y)]
+
+    def test_octile_distance(self):
+        """Test the heuristic matches straight and diagonal move costs"""
+        self.assertEqual(octile_distance((0, 0), (4, 0)), 4.0)
+        self.assertAlmostEqual(octile_distance((0, 0), (3, 3)), 4.2)
+        self.assertAlmostEqual(octile_distance((5, 1), (0, 3)), 3.0 + 2.8)
+
+    def test_paths_are_optimal(self):
+        """Test A* path costs equal Dijkstra costs"""
+        rng = random.Random(2)
+        for _ in range(100):
+            start, goal = rng.choice(self.free), rng.choice(self.free)
+            expected = dijkstra_cost(self.nav, start, goal)
+            path, reached = astar(self.nav, start, goal)
+            if expected is None:
+                self.assertFalse(reached)
+                continue
+            self.assertTrue(reached)
+            self.assertEqual(path[-1] if path else start, goal)
+            self.assertAlmostEqual(path_cost(start, path), expected)
+
+    def test_cross_map_path_under_cap(self):
+        """Test corner-to-corner paths finish well below the expansion limit"""
+        nav = NavGrid(blocked=np.zeros((MAP_HEIGHT, MAP_WIDTH), dtype=bool))
+        path, reached = astar(nav, (0, 0), (MAP_WIDTH - 1, MAP_HEIGHT - 1), max_expansions=2 * MAP_WIDTH)
+
+        self.assertTrue(reached)
+        self.assertEqual(len(path), MAP_WIDTH - 1)
+        self.assertLess(2 * MAP_WIDTH, MAX_EXPANSIONS)
+
+    def test_unreachable_goal_gets_closest_tile(self):
+        """Test an unreachable goal yields a path to the closest explored tile"""
+        blocked = np.zeros((MAP_HEIGHT, MAP_WIDTH), dtype=bool)
+        blocked[:, 10] = True
+        nav = NavGrid(blocked=blocked)
+
+        path, reached = astar(nav, (2, 5), (15, 5))
+
+        self.assertFalse(reached)
+        self.assertEqual(path[-1], (9, 5))
+
+    def test_start_is_goal(self):
+        """Test a path to the start tile is empty"""
+        self.assertEqual(astar(self.nav, self.free[0], self.free[0]), ([], True))
+
+
+class TestSmoothPath(unittest.TestCase):
+    """Test string pulling and smoothed agent paths"""
+
+    def test_straight_line_collapses(self):
+        """Test collinear points reduce to the last point"""
+        points = [(x, 0) for x in range(1, 6)]
+        smoothed = smooth_path((0, 0), points, lambda a, b: True)
+
+        self.assertEqual(list(smoothed), [(5, 0)])
+
+    def test_keeps_corner(self):
+        """Test a point is kept when the next one is not visible past it"""
+        points = [(1, 0), (2, 0), (2, 1), (2, 2)]
+        # Only axis-aligned segments are clear (a wall fills the inside corner)
+        smoothed = smooth_path((0, 0), points, lambda a, b: a[0] == b[0] or a[1] == b[1])
+
+        self.assertEqual(list(smoothed), [(2, 0), (2, 2)])
+
+    def test_empty_path(self):
+        """Test an empty path stays empty"""
+        self.assertEqual(len(smooth_path((0, 0), [], lambda a, b: True)), 0)
+
+    def test_agent_path_is_smoothed_and_clear(self):
+        """Test agent paths keep fewer waypoints and every leg is clear for the agent"""
+        game_map = GameMap("King of the Hill", rng=MatchRng(4))
+        nav = game_map.nav_grid
+        free = [(x, y) for y in range(MAP_HEIGHT) for x in range(MAP_WIDTH) if nav.is_walkable(x, y)]
+        start, goal = free[0], free[-1]
+        agent = Agent(start[0] * TILE_SIZE + 16, start[1] * TILE_SIZE + 16, 0, game_map=game_map)
+        agent.target = Agent(goal[0] * TILE_SIZE + 16, goal[1] * TILE_SIZE + 16, 1)
+
+        agent.find_path_to_target(game_map.obstacles)
+        tiles, _ = astar(nav, start, goal, max_expansions=MAP_WIDTH * MAP_HEIGHT)
+
+        self.assertLess(len(agent.path), len(tiles))
+        self.assertEqual(agent.path[-1], (goal[0] * TILE_SIZE + 16, goal[1] * TILE_SIZE + 16))
+        legs = [(agent.x, agent.y)] + list(agent.path)
+        for a, b in zip(legs, legs[1:]):
+            self.assertTrue(game_map.segment_clear(a[0], a[1], b[0], b[1], AGENT_SIZE / 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for the PettingZoo environment's offscreen rgb_array rendering
+"""
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from pettingzoo_env import MicroBattleEnv
+except ImportError:  # pettingzoo/gymnasium not installed
+    MicroBattleEnv = None
+from config import *
+
+
+def play_round(environment):
+    """Step every agent once with a stand-still action"""
+    for _ in environment.agents:
+        environment.step(np.zeros(4, dtype=np.float32))
+
+
+@unittest.skipIf(MicroBattleEnv is None, "pettingzoo is not installed")
+class TestRgbArrayRender(unittest.TestCase):
+    """Test frames come back as arrays without a display"""
+
+    def setUp(self):
+        """Set up a reset environment rendering every second round"""
+        self.env = MicroBattleEnv("Survival", render_mode="rgb_array", render_every=2)
+        self.env.reset(seed=4)
+
+    def tearDown(self):
+        """Close the environment"""
+        self.env.close()
+
+    def test_frame_shape_and_content(self):
+        """Test a frame is an (H, W, 3) uint8 array matching the surface"""
+        frame = self.env.render()
+
+        self.assertEqual(frame.shape, (SCREEN_HEIGHT, SCREEN_WIDTH, 3))
+        self.assertEqual(frame.dtype, np.uint8)
+        self.assertTrue(frame.flags['C_CONTIGUOUS'])
+        self.assertEqual(tuple(frame[10, 30]), tuple(self.env.screen.get_at((30, 10)))[:3])
+
+    def test_surface_unlocked_after_render(self):
+        """Test the frame is a copy, so the surface can be drawn on again"""
+        first = self.env.render()
+        self.assertFalse(self.env.screen.get_locked())
+
+        play_round(self.env)
+        play_round(self.env)
+        second = self.env.render()
+
+        self.assertIsNot(first, second)
+
+    def test_renders_every_kth_round(self):
+        """Test frames between render_every rounds reuse the last one"""
+        first = self.env.render()
+        play_round(self.env)
+        self.assertIs(self.env.render(), first)
+
+        play_round(self.env)
+        self.assertIsNot(self.env.render(), first)
+
+    def test_no_render_mode(self):
+        """Test rendering without a render mode returns nothing"""
+        environment = MicroBattleEnv("Survival")
+        environment.reset(seed=4)
+
+        self.assertIsNone(environment.render())
+
+
+if __name__ == '__main__':
+    unittest.main()
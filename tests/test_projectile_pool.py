@@ -0,0 +1,133 @@
+"""
+Unit tests for the vectorized projectile pool
+"""
+import unittest
+import sys
+import os
+
+import pygame
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from projectile_pool import ProjectilePool
+from agent_store import AgentStore
+from agent import Agent
+from game_map import GameMap
+from sim_clock import SimClock
+from config import *
+
+
+class TestProjectilePool(unittest.TestCase):
+    """Test ProjectilePool spawning, movement and collisions"""
+
+    def setUp(self):
+        """Set up an empty arena with one agent per team"""
+        self.clock = SimClock()
+        self.store = AgentStore()
+        self.game_map = GameMap("Survival")
+        # Border walls only, for predictable collisions
+        self.game_map.tiles = [[1 if x in (0, MAP_WIDTH - 1) or y in (0, MAP_HEIGHT - 1) else 0
+                                for x in range(MAP_WIDTH)] for y in range(MAP_HEIGHT)]
+        self.game_map.create_obstacle_walls()
+        self.shooter = Agent(100, 100, 0, clock=self.clock, store=self.store)
+        self.target = Agent(300, 100, 1, clock=self.clock, store=self.store)
+        self.pool = ProjectilePool(self.store, capacity=2, clock=self.clock)
+
+    def test_spawn_and_move(self):
+        """Test a projectile moves by its velocity each update"""
+        self.pool.spawn(200, 300, 0, 0, owner=self.shooter)
+
+        self.pool.update(self.clock.get_ticks(), self.game_map)
+
+        self.assertEqual(len(self.pool), 1)
+        self.assertAlmostEqual(self.pool.x[0], 200 + PROJECTILE_SPEED)
+        self.assertEqual(self.pool.owner[0], self.shooter.slot)
+
+    def test_pool_grows(self):
+        """Test spawning past capacity keeps all projectiles"""
+        for i in range(5):
+            self.pool.spawn(200 + i, 300, 0, 0)
+
+        self.assertEqual(len(self.pool), 5)
+        self.assertEqual(self.pool.x[:5].tolist(), [200, 201, 202, 203, 204])
+
+    def test_hit_enemy(self):
+        """Test hitting an enemy applies damage and reports the owner"""
+        self.pool.spawn(self.target.x - 10, self.target.y, 0, 0, owner=self.shooter)
+
+        hits, wall_hits = self.pool.update(self.clock.get_ticks(), self.game_map)
+
+        self.assertEqual(hits, [(self.shooter, self.target, PROJECTILE_DAMAGE)])
+        self.assertEqual(self.target.health, AGENT_MAX_HEALTH - PROJECTILE_DAMAGE)
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(wall_hits, [])
+
+    def test_no_friendly_fire(self):
+        """Test projectiles pass through teammates"""
+        self.pool.spawn(self.target.x - 10, self.target.y, 0, 1)
+
+        hits, _ = self.pool.update(self.clock.get_ticks(), self.game_map)
+
+        self.assertEqual(hits, [])
+        self.assertEqual(self.target.health, AGENT_MAX_HEALTH)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_dead_agent_not_hit_twice(self):
+        """Test a target killed by one projectile stops the others"""
+        self.target.health = PROJECTILE_DAMAGE
+        self.pool.spawn(self.target.x - 10, self.target.y, 0, 0)
+        self.pool.spawn(self.target.x - 10, self.target.y, 0, 0)
+
+        hits, _ = self.pool.update(self.clock.get_ticks(), self.game_map)
+
+        self.assertEqual(len(hits), 1)
+        self.assertFalse(self.target.alive)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_wall_hit(self):
+        """Test a projectile is stopped by the wall it overlaps"""
+        wall = self.game_map.obstacles[self.game_map.wall_index[0, 5]]
+        self.pool.spawn(5 * TILE_SIZE + 10, TILE_SIZE + PROJECTILE_SIZE + 2, -1.5708, 0)
+
+        _, wall_hits = self.pool.update(self.clock.get_ticks(), self.game_map)
+
+        self.assertEqual(wall_hits, [wall])
+        self.assertEqual(len(self.pool), 0)
+
+    def test_expiry(self):
+        """Test projectiles expire after their lifetime"""
+        self.pool.spawn(400, 300, 0, 0)
+        self.clock.tick(int(PROJECTILE_LIFETIME / self.clock.ms_per_tick) + 2)
+
+        self.pool.update(self.clock.get_ticks(), self.game_map)
+
+        self.assertEqual(len(self.pool), 0)
+
+    def test_swap_remove_keeps_live_projectiles(self):
+        """Test compaction keeps the surviving projectiles"""
+        self.pool.spawn(-50, 300, 0, 0)   # Leaves the map
+        self.pool.spawn(400, 300, 0, 0)
+        self.pool.spawn(-50, 400, 0, 0)   # Leaves the map
+        self.pool.spawn(500, 300, 0, 0)
+
+        self.pool.update(self.clock.get_ticks(), self.game_map)
+
+        self.assertEqual(len(self.pool), 2)
+        self.assertEqual(sorted(self.pool.x[:2].tolist()),
+                         [400 + PROJECTILE_SPEED, 500 + PROJECTILE_SPEED])
+
+
+    def test_draw_interpolates_along_velocity(self):
+        """Test projectiles are drawn between their last two positions"""
+        self.pool.spawn(200, 300, 0, 0, owner=self.shooter)
+        self.pool.update(self.clock.get_ticks(), self.game_map)
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        self.pool.draw(screen, alpha=0.0)
+
+        self.assertEqual(tuple(screen.get_at((200, 300)))[:3], PROJECTILE_COLOR)
+        self.assertNotEqual(tuple(screen.get_at((200 + PROJECTILE_SPEED + PROJECTILE_SIZE - 1, 300)))[:3], PROJECTILE_COLOR)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+Unit tests for the space-time reservation table and cooperative pathfinding (WHCA*)
+"""
+import unittest
+import sys
+import os
+from collections import deque
+
+import numpy as np
+import pygame
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from reservation import ReservationTable
+from pathfinding import cooperative_astar
+from flow_field import FlowField
+from nav_grid import NavGrid
+from game_map import GameMap
+from match_rng import MatchRng
+from sim_clock import SimClock
+from agent import Agent
+from path_scheduler import PathScheduler
+from config import *
+
+
+class Owner:
+    """Minimal reservation owner"""
+
+    def __init__(self, alive=True):
+        self.alive = alive
+
+
+def corridor():
+    """A one-tile-wide horizontal corridor on row 2 of a 12x5 grid"""
+    blocked = np.ones((5, 12), dtype=bool)
+    blocked[2, :] = False
+    return NavGrid(blocked=blocked)
+
+
+class TestReservationTable(unittest.TestCase):
+    """Test reserving, releasing and conflict checks"""
+
+    def setUp(self):
+        """Set up a table with one owner holding nodes 4, 5, 5 from step 10"""
+        self.table = ReservationTable(step_ms=100)
+        self.owner = Owner()
+        self.table.reserve(self.owner, [4, 5, 5], 10)
+
+    def test_step_at(self):
+        """Test times map to whole steps"""
+        self.assertEqual(self.table.step_at(0), 0)
+        self.assertEqual(self.table.step_at(1050), 10)
+
+    def test_reserved_cells(self):
+        """Test reserved cells are taken for others but not for the owner"""
+        self.assertFalse(self.table.is_free(5, 12, Owner()))
+        self.assertTrue(self.table.is_free(5, 12, self.owner))
+        self.assertTrue(self.table.is_free(5, 13, Owner()))
+        self.assertEqual(len(self.table), 3)
+
+    def test_reserve_replaces_and_release_clears(self):
+        """Test a new reservation replaces the old one and release drops it"""
+        self.table.reserve(self.owner, [7], 10)
+        self.assertTrue(self.table.is_free(5, 11, Owner()))
+        self.assertFalse(self.table.is_free(7, 10, Owner()))
+
+        self.table.release(self.owner)
+        self.assertEqual(len(self.table), 0)
+
+    def test_swap_is_blocked(self):
+        """Test moving against a reserved move on the same edge is not allowed"""
+        other = Owner()
+        self.assertFalse(self.table.can_move(5, 4, 11, other))
+        self.assertTrue(self.table.can_move(6, 4, 12, other))
+        self.assertTrue(self.table.can_move(5, 4, 11, self.owner))
+
+    def test_dead_owner_is_ignored(self):
+        """Test reservations of a dead agent do not block teammates"""
+        self.owner.alive = False
+        self.assertTrue(self.table.is_free(5, 11, Owner()))
+
+
+class TestCooperativeAstar(unittest.TestCase):
+    """Test windowed space-time search around teammate reservations"""
+
+    def test_follows_field_without_reservations(self):
+        """Test an unobstructed plan walks straight down the flow field"""
+        nav = corridor()
+        field = FlowField(nav, [nav.node(11, 2)])
+        nodes = cooperative_astar(nav, (0, 2), field.cost, ReservationTable(), Owner(), 0, window=5)
+
+        self.assertEqual(nodes, [nav.node(x, 2) for x in range(1, 6)])
+
+    def test_stops_in_free_goal(self):
+        """Test a plan ends as soon as it reaches a goal that stays free"""
+        nav = corridor()
+        field = FlowField(nav, [nav.node(3, 2)])
+        nodes = cooperative_astar(nav, (0, 2), field.cost, ReservationTable(), Owner(), 0)
+
+        self.assertEqual(nodes, [nav.node(x, 2) for x in range(1, 4)])
+
+    def test_waits_for_reserved_tile(self):
+        """Test a plan waits instead of entering a tile a teammate holds"""
+        nav = corridor()
+        table = ReservationTable()
+        table.reserve(Owner(), [nav.node(4, 2)] * 4, 0)
+        field = FlowField(nav, [nav.node(11, 2)])
+        nodes = cooperative_astar(nav, (2, 2), field.cost, table, Owner(), 0, window=6)
+
+        self.assertEqual(len(nodes), 6)
+        for step, node in enumerate(nodes, 1):
+            self.assertTrue(table.is_free(node, step))
+        # The teammate leaves after step 3: wait on (3, 2), then walk on
+        self.assertEqual(nodes.index(nav.node(4, 2)), 3)
+        self.assertEqual(nodes[-1], nav.node(6, 2))
+
+    def test_teammates_take_different_goal_tiles(self):
+        """Test a teammate settles in another goal tile when the nearest one is held"""
+        nav = NavGrid(blocked=np.zeros((8, 12), dtype=bool))
+        goals = [nav.node(10, 3), nav.node(10, 4)]
+        field = FlowField(nav, goals)
+        table = ReservationTable()
+        first, second = Owner(), Owner()
+
+        nodes = cooperative_astar(nav, (8, 3), field.cost, table, first, 0)
+        held = [nav.node(8, 3)] + nodes
+        table.reserve(first, held + [held[-1]] * (WHCA_WINDOW + 1 - len(held)), 0)
+        other = cooperative_astar(nav, (8, 3), field.cost, table, second, 0)
+
+        self.assertEqual(nodes[-1], nav.node(10, 3))
+        self.assertEqual(other[-1], nav.node(10, 4))
+
+
+class TestAgentCooperation(unittest.TestCase):
+    """Test agents plan, reserve and follow cooperative paths"""
+
+    def setUp(self):
+        """Set up a generated map and two teammates sharing a reservation table"""
+        self.game_map = GameMap("King of the Hill", rng=MatchRng(6))
+        nav = self.game_map.nav_grid
+        free = [(x, y) for y in range(MAP_HEIGHT) for x in range(MAP_WIDTH) if nav.is_walkable(x, y)]
+        self.clock = SimClock()
+        self.table = ReservationTable()
+        tx, ty = free[0]
+        self.agents = [Agent(tx * TILE_SIZE + 16, ty * TILE_SIZE + 16, 0, clock=self.clock,
+                             game_map=self.game_map, reservations=self.table) for _ in range(2)]
+        zone = pygame.Rect(0, 0, KOTH_ZONE_SIZE, KOTH_ZONE_SIZE)
+        zone.center = (MAP_WIDTH * TILE_SIZE // 2, MAP_HEIGHT * TILE_SIZE // 2)
+        self.goal = self.game_map.flow_fields.to_rect(zone)
+
+    def test_plans_do_not_overlap(self):
+        """Test teammates heading to the same zone never hold the same tile at the same step"""
+        for agent in self.agents:
+            self.assertTrue(agent.plan_cooperative(self.goal))
+            self.assertTrue(agent.path)
+            self.assertTrue(agent.path_schedule)
+
+        # Both start on the same tile; every later step is held by one of them only
+        first, second = ({(node, step) for node, step in self.table._owned[agent][0] if step > 0}
+                         for agent in self.agents)
+        self.assertFalse(first & second)
+
+    def test_waits_until_reserved_step(self):
+        """Test an agent ahead of schedule holds still without counting as stuck"""
+        agent = self.agents[0]
+        point = (agent.x + TILE_SIZE, agent.y)
+        agent.path = deque([point])
+        agent.path_schedule = deque([(point, self.table.step_at(self.clock.get_ticks()) + 5)])
+
+        agent.follow_path()
+        self.assertEqual((agent.velocity_x, agent.velocity_y), (0, 0))
+        self.assertTrue(agent.waiting_for_slot)
+
+        self.clock.tick(int(5 * self.table.step_ms / self.clock.ms_per_tick))
+        agent.follow_path()
+        self.assertGreater(agent.velocity_x, 0)
+
+
+    def test_replans_go_through_scheduler(self):
+        """Test shared-goal replans are queued and served within the scheduler budget"""
+        scheduler = PathScheduler()
+        agent = self.agents[0]
+        agent.path_scheduler = scheduler
+        zone = pygame.Rect(0, 0, KOTH_ZONE_SIZE, KOTH_ZONE_SIZE)
+        zone.center = (MAP_WIDTH * TILE_SIZE // 2, MAP_HEIGHT * TILE_SIZE // 2)
+
+        agent.navigate_to(zone.centerx, zone.centery, self.clock.get_ticks(), self.game_map.obstacles, goal_rect=zone)
+        self.assertTrue(scheduler.is_pending(agent))
+        self.assertEqual(len(self.table), 0)
+
+        scheduler.run()
+        self.assertTrue(agent.path_schedule)
+        self.assertGreater(len(self.table), 0)
+
+    def test_chasing_uses_plain_astar(self):
+        """Test a moving target is chased without cooperative planning or a new flow field"""
+        agent = self.agents[0]
+        fields = len(self.game_map.flow_fields._fields)
+        target = self.agents[1]
+        target.x += 5 * TILE_SIZE
+
+        agent.find_path_to_target(self.game_map.obstacles, target)
+
+        self.assertEqual(len(self.game_map.flow_fields._fields), fields)
+        self.assertFalse(agent.path_schedule)
+        self.assertEqual(len(self.table), 0)
+
+if __name__ == '__main__':
+    unittest.main()
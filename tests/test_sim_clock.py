@@ -0,0 +1,155 @@
+"""
+Unit tests for SimClock (simulation time source)
+"""
+import unittest
+import sys
+import os
+import pygame
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Initialize pygame for time functions
+pygame.init()
+
+from sim_clock import SimClock, RealTimeClock, FixedStepLoop, resolve_clock
+from survival_mode import SurvivalMode
+from projectile import Projectile
+from communication import MessageBus
+from statistics import StatisticsTracker
+from agent import Agent
+from config import *
+
+
+class TestSimClock(unittest.TestCase):
+    """Test SimClock fixed-timestep behaviour"""
+
+    def test_clock_starts_at_zero(self):
+        """Test new clock reports zero time"""
+        clock = SimClock()
+
+        self.assertEqual(clock.get_ticks(), 0)
+        self.assertEqual(clock.tick_count, 0)
+
+    def test_tick_advances_by_ms_per_tick(self):
+        """Test each tick advances time by ms_per_tick"""
+        clock = SimClock(ms_per_tick=10)
+
+        clock.tick()
+        clock.tick()
+
+        self.assertEqual(clock.get_ticks(), 20)
+
+    def test_tick_multiple_steps(self):
+        """Test tick with several steps at once"""
+        clock = SimClock(ms_per_tick=10)
+
+        clock.tick(5)
+
+        self.assertEqual(clock.get_ticks(), 50)
+
+    def test_default_rate_matches_fps(self):
+        """Test FPS ticks at the default rate equal one simulated second"""
+        clock = SimClock()
+
+        clock.tick(FPS)
+
+        self.assertEqual(clock.get_ticks(), 1000)
+
+    def test_reset(self):
+        """Test reset returns the clock to its start time"""
+        clock = SimClock(ms_per_tick=10, start_ms=500)
+        clock.tick(3)
+
+        clock.reset()
+
+        self.assertEqual(clock.get_ticks(), 500)
+
+    def test_resolve_clock_default(self):
+        """Test resolve_clock falls back to real time"""
+        self.assertIsInstance(resolve_clock(None), RealTimeClock)
+        clock = SimClock()
+        self.assertIs(resolve_clock(clock), clock)
+
+
+class TestFixedStepLoop(unittest.TestCase):
+    """Test the fixed-step accumulator of the interactive loop"""
+
+    def test_steps_follow_elapsed_time(self):
+        """Test whole steps are taken and the remainder carries over"""
+        loop = FixedStepLoop(ms_per_tick=10)
+
+        self.assertEqual(loop.advance(25), 2)
+        self.assertAlmostEqual(loop.alpha, 0.5)
+        self.assertEqual(loop.advance(6), 1)
+        self.assertAlmostEqual(loop.alpha, 0.1)
+
+    def test_fast_render_takes_no_step(self):
+        """Test frames shorter than a step only advance the interpolation"""
+        loop = FixedStepLoop(ms_per_tick=10)
+
+        self.assertEqual(loop.advance(4), 0)
+        self.assertAlmostEqual(loop.alpha, 0.4)
+
+    def test_catch_up_is_capped(self):
+        """Test a long stall runs at most max_steps and drops the rest"""
+        loop = FixedStepLoop(ms_per_tick=10, max_steps=5)
+
+        self.assertEqual(loop.advance(1003), 5)
+        self.assertEqual(loop.dropped_steps, 95)
+        self.assertAlmostEqual(loop.alpha, 0.3)
+
+
+class TestSimClockIntegration(unittest.TestCase):
+    """Test components read time from an injected SimClock"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.clock = SimClock(ms_per_tick=100)
+        self.agents = [
+            Agent(100, 100, team_id=0, clock=self.clock),
+            Agent(200, 200, team_id=1, clock=self.clock),
+        ]
+
+    def test_survival_mode_ends_on_simulated_time(self):
+        """Test survival time limit elapses without waiting in real time"""
+        mode = SurvivalMode(self.agents, clock=self.clock)
+
+        self.clock.tick(SURVIVAL_TIME_LIMIT * 10)
+        mode.update()
+
+        self.assertTrue(mode.game_over)
+        self.assertEqual(mode.get_remaining_time(), 0)
+
+    def test_projectile_creation_time(self):
+        """Test projectile creation time comes from the clock"""
+        self.clock.tick(7)
+
+        projectile = Projectile(100, 100, 0, team_id=0, clock=self.clock)
+
+        self.assertEqual(projectile.creation_time, 700)
+
+    def test_enemy_spotted_timestamp(self):
+        """Test message bus timestamps use the clock"""
+        bus = MessageBus(clock=self.clock)
+        self.agents[0].agent_id = "agent_0_0"
+        self.agents[1].agent_id = "agent_1_0"
+        self.clock.tick(3)
+
+        bus.broadcast_enemy_spotted(self.agents[0], self.agents[1])
+
+        self.assertEqual(bus.messages[0].timestamp, 300)
+
+    def test_statistics_time_alive(self):
+        """Test statistics measure time alive in simulated time"""
+        tracker = StatisticsTracker(clock=self.clock)
+        tracker.on_agent_spawn(self.agents[0])
+
+        self.clock.tick(25)
+        tracker.on_agent_death(self.agents[0])
+
+        self.assertAlmostEqual(tracker.agent_stats[id(self.agents[0])]['time_alive'], 2.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
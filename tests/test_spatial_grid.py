@@ -0,0 +1,138 @@
+"""
+Unit tests for the uniform-grid spatial index
+"""
+import unittest
+import sys
+import os
+import random
+
+import pygame
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from spatial_grid import SpatialGrid
+from agent_store import AgentStore
+from agent import Agent
+from communication import MessageBus, Message
+from koth_mode import KingOfTheHillMode
+from game_map import GameMap
+from config import *
+
+
+class TestSpatialGridQueries(unittest.TestCase):
+    """Test radius, rectangle and nearest-neighbour queries"""
+
+    def setUp(self):
+        """Scatter agents of two teams over the map"""
+        rng = random.Random(5)
+        self.store = AgentStore()
+        self.agents = [Agent(rng.uniform(0, MAP_WIDTH * TILE_SIZE), rng.uniform(0, MAP_HEIGHT * TILE_SIZE),
+                             i % 2, store=self.store) for i in range(80)]
+        self.agents[3].alive = False
+        self.grid = SpatialGrid()
+        self.grid.index_agents(self.store)
+
+    def brute_radius(self, x, y, radius, team_id=None, enemy_of=None):
+        """Reference linear scan"""
+        return [a.slot for a in self.agents
+                if a.alive and (team_id is None or a.team_id == team_id)
+                and (enemy_of is None or a.team_id != enemy_of)
+                and (a.x - x) ** 2 + (a.y - y) ** 2 <= radius ** 2]
+
+    def test_radius_matches_linear_scan(self):
+        """Test radius queries return the same slots as a linear scan"""
+        for x, y, radius in [(400, 300, 100), (0, 0, 250), (790, 570, 30), (200, 100, 600)]:
+            self.assertEqual(self.grid.query_radius(x, y, radius), self.brute_radius(x, y, radius))
+
+    def test_team_filters(self):
+        """Test team and enemy filters"""
+        self.assertEqual(self.grid.query_radius(400, 300, 200, team_id=1),
+                         self.brute_radius(400, 300, 200, team_id=1))
+        self.assertEqual(self.grid.query_radius(400, 300, 200, enemy_of=1),
+                         self.brute_radius(400, 300, 200, enemy_of=1))
+
+    def test_dead_agents_skipped(self):
+        """Test dead agents are never returned"""
+        agent = self.agents[3]
+
+        self.assertNotIn(agent.slot, self.grid.query_radius(agent.x, agent.y, 1))
+
+    def test_query_rect(self):
+        """Test rectangle query follows Rect.collidepoint"""
+        rect = pygame.Rect(300, 200, 150, 120)
+        expected = [a.slot for a in self.agents if a.alive and rect.collidepoint(a.x, a.y)]
+
+        self.assertEqual(self.grid.query_rect(rect), expected)
+
+    def test_nearest(self):
+        """Test k-nearest returns the closest agents in distance order"""
+        expected = sorted(self.brute_radius(100, 100, 10000),
+                          key=lambda slot: (self.agents[slot].x - 100) ** 2 + (self.agents[slot].y - 100) ** 2)
+
+        self.assertEqual(self.grid.nearest(100, 100, k=5), expected[:5])
+        self.assertEqual(self.grid.nearest(100, 100, k=1, max_radius=1), [])
+
+    def test_slack_covers_movement(self):
+        """Test agents that moved since the rebuild are still found"""
+        grid = SpatialGrid(slack=10)
+        grid.index_agents(self.store)
+        agent = self.agents[0]
+        agent.x += 8
+
+        self.assertIn(agent.slot, grid.query_radius(agent.x, agent.y, 1))
+
+
+class TestSpatialGridCallers(unittest.TestCase):
+    """Test call sites give the same answers with and without the grid"""
+
+    def test_separation_and_target(self):
+        """Test separation and target selection match the linear scan"""
+        results = []
+        for use_grid in [False, True]:
+            store = AgentStore()
+            grid = SpatialGrid() if use_grid else None
+            agents = [Agent(100 + 12 * i, 100 + 5 * i, i % 2, store=store, grid=grid) for i in range(8)]
+            if grid:
+                grid.index_agents(store)
+            me = agents[0]
+            me.facing_angle = 0.4
+            me.velocity_x, me.velocity_y = 1.0, 0.5
+            me.apply_separation(agents)
+            me.find_target(agents, [])
+            results.append((me.velocity_x, me.velocity_y, me.target.slot if me.target else None))
+
+        self.assertEqual(results[0], results[1])
+
+    def test_limited_messages_in_range(self):
+        """Test LIMITED teams only receive messages sent from within range"""
+        bus = MessageBus()
+        bus.set_team_communication_modes({0: "LIMITED"})
+        receiver = Agent(100, 100, 0)
+        near = Message("a", 0, "ENEMY_SPOTTED", {}, 0, sender_x=150, sender_y=100)
+        far = Message("b", 0, "ENEMY_SPOTTED", {}, 0, sender_x=100 + COMMUNICATION_RANGE + 1, sender_y=100)
+        anywhere = Message("c", 0, "FLAG_DELIVERED", {}, 0)
+        other_team = Message("d", 1, "ENEMY_SPOTTED", {}, 0, sender_x=100, sender_y=100)
+        for message in [near, far, anywhere, other_team]:
+            bus.publish(message)
+
+        self.assertEqual(bus.collect(0, 0, receiving_agent=receiver), [near, anywhere])
+
+    def test_koth_zone_count(self):
+        """Test KOTH zone control uses the grid"""
+        store = AgentStore()
+        grid = SpatialGrid()
+        center = (MAP_WIDTH * TILE_SIZE / 2, MAP_HEIGHT * TILE_SIZE / 2)
+        agents = [Agent(center[0], center[1], 0, store=store, grid=grid),
+                  Agent(50, 50, 1, store=store, grid=grid)]
+        grid.index_agents(store)
+        mode = KingOfTheHillMode(agents, GameMap("King of the Hill"), grid=grid)
+
+        mode.accumulate_zone_time()
+
+        self.assertAlmostEqual(mode.team_zone_time[0], 0.1)
+        self.assertEqual(mode.team_zone_time[1], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
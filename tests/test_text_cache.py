@@ -0,0 +1,86 @@
+"""
+Unit tests for the font and rendered-text cache
+"""
+import unittest
+import sys
+import os
+
+import numpy as np
+import pygame
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from text_cache import TextCache, resolve_text_cache
+from survival_mode import SurvivalMode
+from agent import Agent
+from sim_clock import SimClock
+from config import *
+
+
+class TestTextCache(unittest.TestCase):
+    """Test font loading, memoized surfaces and LRU eviction"""
+
+    def setUp(self):
+        """Set up a small cache"""
+        pygame.font.init()
+        self.cache = TextCache(max_size=3)
+
+    def test_font_loaded_once(self):
+        """Test the same size returns the same font object"""
+        self.assertIs(self.cache.font(24), self.cache.font(24))
+        self.assertIsNot(self.cache.font(24), self.cache.font(36))
+
+    def test_render_memoized(self):
+        """Test repeated text reuses the surface and matches a direct render"""
+        first = self.cache.render(24, "Time: 10s", (255, 255, 255))
+        second = self.cache.render(24, "Time: 10s", [255, 255, 255])
+        direct = pygame.font.Font(None, 24).render("Time: 10s", True, (255, 255, 255))
+
+        self.assertIs(first, second)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertTrue(np.array_equal(pygame.surfarray.array_alpha(first), pygame.surfarray.array_alpha(direct)))
+
+    def test_key_includes_size_and_color(self):
+        """Test a different size or colour is a separate entry"""
+        self.cache.render(24, "DPS", (255, 0, 0))
+        self.cache.render(20, "DPS", (255, 0, 0))
+        self.cache.render(24, "DPS", (0, 0, 255))
+
+        self.assertEqual(len(self.cache), 3)
+
+    def test_least_recently_used_evicted(self):
+        """Test the oldest unused surface is dropped when the cache is full"""
+        a = self.cache.render(24, "a", (255, 255, 255))
+        self.cache.render(24, "b", (255, 255, 255))
+        self.cache.render(24, "c", (255, 255, 255))
+        self.cache.render(24, "a", (255, 255, 255))
+        self.cache.render(24, "d", (255, 255, 255))
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertIs(self.cache.render(24, "a", (255, 255, 255)), a)
+        misses = self.cache.misses
+        self.cache.render(24, "b", (255, 255, 255))
+        self.assertEqual(self.cache.misses, misses + 1)
+
+    def test_shared_instance(self):
+        """Test UI code without an explicit cache shares one instance"""
+        self.assertIs(resolve_text_cache(), resolve_text_cache())
+        self.assertIs(resolve_text_cache(self.cache), self.cache)
+
+    def test_mode_ui_reuses_surfaces(self):
+        """Test drawing an unchanged HUD twice renders no new text"""
+        mode = SurvivalMode([Agent(100, 100, 0), Agent(200, 200, 1)], clock=SimClock(), text_cache=self.cache)
+        self.cache.max_size = 64
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        mode.draw_ui(screen)
+        misses = self.cache.misses
+        mode.draw_ui(screen)
+
+        self.assertGreater(misses, 0)
+        self.assertEqual(self.cache.misses, misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the per-tick visibility matrix
+"""
+import unittest
+import sys
+import os
+import math
+import random
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from visibility import VisibilitySystem
+from agent_store import AgentStore
+from agent import Agent
+from game_map import GameMap
+from match_rng import MatchRng
+from config import *
+
+
+class TestVisibilitySystem(unittest.TestCase):
+    """Test the vectorized range/cone filter and the raycast pass"""
+
+    def setUp(self):
+        """Set up a generated map and a shared store"""
+        self.game_map = GameMap("Survival", rng=MatchRng(4))
+        self.store = AgentStore()
+        self.visibility = VisibilitySystem(self.game_map)
+
+    def make_agent(self, x, y, team_id, facing_angle=0.0):
+        """Create an agent in the shared store"""
+        agent = Agent(x, y, team_id, store=self.store, game_map=self.game_map, visibility=self.visibility)
+        agent.facing_angle = facing_angle
+        return agent
+
+    def test_matches_line_of_sight(self):
+        """Test the matrix agrees with per-agent is_in_line_of_sight"""
+        rng = random.Random(9)
+        agents = [self.make_agent(rng.uniform(40, MAP_WIDTH * TILE_SIZE - 40),
+                                  rng.uniform(40, MAP_HEIGHT * TILE_SIZE - 40),
+                                  i % 2, rng.uniform(-math.pi, 3 * math.pi)) for i in range(60)]
+        agents[7].alive = False
+
+        self.visibility.update(self.store)
+
+        for observer in agents:
+            for target in agents:
+                if observer.alive and target.team_id != observer.team_id:
+                    expected = observer.is_in_line_of_sight(target, self.game_map.obstacles)
+                    self.assertEqual(self.visibility.can_see(observer.slot, target.slot), expected)
+
+    def test_cone_and_range(self):
+        """Test targets behind the observer or out of range are not visible"""
+        observer = self.make_agent(400, 300, 0, facing_angle=0.0)
+        behind = self.make_agent(350, 300, 1)
+        out_of_range = self.make_agent(400 + AGENT_LOS_RANGE + 5, 300, 1)
+        teammate = self.make_agent(420, 300, 0)
+        self.visibility.game_map = None
+
+        self.visibility.update(self.store)
+
+        self.assertFalse(self.visibility.can_see(observer.slot, behind.slot))
+        self.assertFalse(self.visibility.can_see(observer.slot, out_of_range.slot))
+        self.assertFalse(self.visibility.can_see(observer.slot, teammate.slot))
+        self.assertTrue(self.visibility.can_see(behind.slot, observer.slot))
+
+    def test_find_target_uses_matrix(self):
+        """Test find_target picks the nearest enemy from the shared matrix"""
+        observer = self.make_agent(200, 200, 0, facing_angle=0.0)
+        near = self.make_agent(260, 200, 1)
+        self.make_agent(300, 200, 1)
+        self.visibility.game_map = None
+        self.visibility.update(self.store)
+
+        observer.find_target(self.store.agents, [])
+
+        self.assertIs(observer.target, near)
+
+    def test_covers(self):
+        """Test the matrix only answers for known slots and the map's obstacles"""
+        observer = self.make_agent(200, 200, 0)
+        self.visibility.update(self.store)
+        late = self.make_agent(300, 200, 1)
+
+        self.assertTrue(self.visibility.covers(observer.slot, self.game_map.obstacles))
+        self.assertFalse(self.visibility.covers(observer.slot, []))
+        self.assertFalse(self.visibility.covers(late.slot, self.game_map.obstacles))
+
+
+if __name__ == '__main__':
+    unittest.main()